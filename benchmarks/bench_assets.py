@@ -0,0 +1,99 @@
+"""
+아이템 스프라이트 로드 비용을 측정합니다.
+게임 인스턴스마다 PNG를 디코드해 cv2.resize(기본 보간)하던 기존 _load_item_image 방식과,
+asset_bundle 아틀라스를 새로 만들 때(캐시 없음), 캐시 파일을 memmap으로 열 때(새 프로세스 기준),
+같은 프로세스에서 공유 아틀라스를 다시 받을 때의 시간을 비교하고, 기존 방식과의 최대 픽셀 차이도 출력합니다.
+
+    python benchmarks/bench_assets.py --size 120 --repeat 3
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import asset_bundle as ab  # noqa: E402
+import game_logic as gl  # noqa: E402
+from sprites import PremultipliedSprite  # noqa: E402
+
+
+def legacy_load_item_image(path, size, fallback_color):
+    """아틀라스 이전 ChristmasGame._load_item_image."""
+    img = cv2.imread(path, cv2.IMREAD_UNCHANGED) if path else None
+    if img is None:
+        img = np.zeros((size, size, 4), dtype=np.uint8)
+        img[:, :, :3] = fallback_color
+        img[:, :, 3] = 255
+    else:
+        img = cv2.resize(img, (size, size))
+    return PremultipliedSprite(img)
+
+
+def item_entries():
+    game = gl.ChristmasGame(64, 64, render=False)
+    return [(item_type, os.path.join(game.asset_dir, props['asset']) if props.get('asset') else None,
+             props.get('fallback_color', (255, 255, 255)))
+            for item_type, props in game.item_properties.items()]
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def composite(sprite, size):
+    frame = np.full((size, size, 3), 80, dtype=np.uint8)
+    sprite.blit(frame, 0, 0)
+    return frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=120)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    entries = item_entries()
+    legacy_time, legacy = timed(lambda: {name: legacy_load_item_image(path, args.size, color)
+                                         for name, path, color in entries}, args.repeat)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        def cold():
+            ab._loaded_atlases.clear()
+            for filename in os.listdir(cache_dir):
+                os.unlink(os.path.join(cache_dir, filename))
+            return ab.load_item_atlas(entries, args.size, cache_dir=cache_dir)
+
+        def warm():
+            ab._loaded_atlases.clear()
+            return ab.load_item_atlas(entries, args.size, cache_dir=cache_dir)
+
+        cold_time, _ = timed(cold, args.repeat)
+        warm_time, atlas = timed(warm, args.repeat)
+        shared_time, _ = timed(lambda: ab.load_item_atlas(entries, args.size, cache_dir=cache_dir), args.repeat)
+        cache_bytes = os.path.getsize(atlas.path)
+
+        print(f"{'path':<28} {'ms':>9}")
+        print(f"{'legacy imread + resize':<28} {legacy_time * 1e3:>9.1f}")
+        print(f"{'atlas build (no cache)':<28} {cold_time * 1e3:>9.1f}")
+        print(f"{'atlas memmap (new process)':<28} {warm_time * 1e3:>9.2f}")
+        print(f"{'atlas shared (same process)':<28} {shared_time * 1e3:>9.3f}")
+        print(f"cache file {cache_bytes / 1024:.0f} KB for {len(entries)} items at {args.size}px")
+        for name, _, _ in entries:
+            diff = np.abs(composite(legacy[name], args.size).astype(np.int16)
+                          - composite(atlas.sprites[name], args.size).astype(np.int16))
+            print(f"  {name:<10} max diff vs legacy {int(diff.max()):>3}, mean {diff.mean():.2f}")
+        del atlas
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+충돌 판정 비용을 살아 있는 객체 수(10 ~ 50,000)에 따라 측정합니다.
+GameObject 리스트를 도는 기존 선형 탐색과 열 단위 객체 저장소(GameObjectStore)의 배열 질의를 비교하고,
+객체별 move() 루프와 배열 연산 update()의 프레임당 비용도 함께 측정합니다.
+객체가 OVERLAP_INDEX_MIN_OBJECTS 이상이면 저장소 질의는 y 정렬 인덱스로 후보를 좁힙니다.
+멀티플레이어용으로 입 --mouths개를 find_overlaps() 한 번으로 판정하는 비용과 입마다 따로 질의하는 비용도 비교합니다.
+객체 밀도는 화면 하나당 --density개로 유지하고, 객체 수가 늘면 플레이 영역을 세로로 늘립니다.
+
+    python benchmarks/bench_collision.py
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import game_logic as gl  # noqa: E402
+
+OBJECT_COUNTS = [10, 100, 1000, 10000, 50000]
+FRAMES = 20
+
+
+def linear_find_collision(objects, mouth_x, mouth_y):
+    """기존 check_collection의 선형 탐색."""
+    for obj in objects:
+        if not obj.active:
+            continue
+        if abs(mouth_y - obj.y) < obj.size and abs(mouth_x - obj.x) < obj.size:
+            return obj
+    return None
+
+
+def populate(count, width, height, seed):
+    """같은 객체들을 GameObject 리스트와 게임의 객체 저장소에 함께 만듭니다."""
+    rng = random.Random(seed)
+    game = gl.ChristmasGame(width, height, seed=seed, render=False)
+    objects = []
+    for _ in range(count):
+        obj = gl.GameObject(rng.uniform(0, width), rng.uniform(-50, height), rng.uniform(3, 8),
+                            rng.choice(list(game.item_properties)))
+        objects.append(obj)
+        game.add_object(obj)
+    return game, objects
+
+
+def legacy_move(objects, height):
+    """기존 update()의 객체별 이동 및 리스트 재구성."""
+    kept = []
+    for obj in objects:
+        if obj.move(height):
+            obj.active = False
+        if obj.active:
+            kept.append(obj)
+    return kept
+
+
+def time_per_call(fn, queries, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for x, y in queries:
+            fn(x, y)
+    return (time.perf_counter() - start) / (repeat * len(queries))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--density', type=int, default=40, help='화면 하나당 객체 수')
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--mouths', type=int, default=4, help='한 번에 판정할 입(플레이어) 수')
+    args = parser.parse_args()
+
+    print(f"{'objects':>8} {'linear us':>10} {'store us':>9} {'speedup':>8} {'hit rate':>9} "
+          f"{'move() us':>10} {'update us':>10} {'per-mouth us':>13} {'batched us':>11}")
+    for count in OBJECT_COUNTS:
+        height = args.height * max(1, count // args.density)
+        game, objects = populate(count, args.width, height, seed=count)
+        rng = random.Random(count)
+        queries = [(rng.uniform(0, args.width), rng.uniform(0, height)) for _ in range(args.queries)]
+        hits = sum(linear_find_collision(objects, x, y) is not None for x, y in queries)
+        repeat = max(1, 2000 // count)
+        linear = time_per_call(lambda x, y: linear_find_collision(objects, x, y), queries, repeat)
+        store = time_per_call(game._find_collision, queries, repeat)
+
+        # 입 args.mouths개: 입마다 find_overlap() vs find_overlaps() 한 번 (틱당 비용)
+        groups = [queries[idx:idx + args.mouths] for idx in range(0, len(queries) - args.mouths + 1, args.mouths)]
+        store_objects = game.objects
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for group in groups:
+                for x, y in group:
+                    store_objects.find_overlap(x, y)
+        per_mouth = (time.perf_counter() - start) / (repeat * len(groups))
+        group_arrays = [([x for x, _ in group], [y for _, y in group]) for group in groups]
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for xs, ys in group_arrays:
+                store_objects.find_overlaps(xs, ys)
+        batched = (time.perf_counter() - start) / (repeat * len(groups))
+
+        # 프레임당 이동/화면 밖 처리 (FRAMES 프레임 평균)
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            objects = legacy_move(objects, height)
+        move = (time.perf_counter() - start) / FRAMES
+        game.spawn_rate = 10 ** 9
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            game.update()
+        update = (time.perf_counter() - start) / FRAMES
+        print(f"{count:>8} {linear * 1e6:>10.1f} {store * 1e6:>9.1f} {linear / store:>7.1f}x "
+              f"{hits / len(queries):>8.0%} {move * 1e6:>10.0f} {update * 1e6:>10.0f} "
+              f"{per_mouth * 1e6:>13.1f} {batched * 1e6:>11.1f}")
+
+if __name__ == '__main__':
+    main()
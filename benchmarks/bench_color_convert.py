@@ -0,0 +1,77 @@
+"""
+추론 전처리(BGR→RGB 변환) 경로의 처리량과 프레임당 임시 할당량을 비교합니다.
+
+- legacy: 기존 process_frame(BGR→RGB→BGR) + detect_hand_gesture(BGR→RGB)의 변환 3회
+- buffered: FrameBuffers로 재사용 버퍼에 한 번만 변환
+- scaled-0.5: FrameBuffers(scale=0.5)로 INTER_AREA 축소 후 변환 (--inference-scale 0.5)
+
+    python benchmarks/bench_color_convert.py --iterations 300
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import filter_logic as fl  # noqa: E402
+
+RESOLUTIONS = {
+    '720p': (1280, 720),
+    '1080p': (1920, 1080),
+}
+
+
+def legacy_path(frame):
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    processed = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+    hand_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    return processed, rgb, hand_rgb
+
+
+def make_buffered_path(scale=1.0):
+    buffers = fl.FrameBuffers(scale=scale)
+
+    def buffered_path(frame):
+        rgb = buffers.convert(frame)
+        return frame, rgb, rgb
+    return buffered_path
+
+
+def measure(path, frame, iterations):
+    for _ in range(5):
+        path(frame)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        path(frame)
+    fps = iterations / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    path(frame)
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    path(frame)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return fps, peak - base
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=300)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for name, (width, height) in RESOLUTIONS.items():
+        frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        for label, path in (('legacy', legacy_path), ('buffered', make_buffered_path()),
+                            ('scaled-0.5', make_buffered_path(0.5))):
+            fps, allocated = measure(path, frame, args.iterations)
+            print(f"{name:<6} {label:<10} {fps:8.1f} frames/s  {allocated / 1e6:6.2f} MB allocated per frame")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Face Mesh 전체 프레임 경로와 ROI 추적 모드(FaceRoiTracker)의 FPS와 mouth ratio 정확도를 비교합니다.
+
+    python benchmarks/bench_face_roi.py --video clip.mp4
+    python benchmarks/bench_face_roi.py --image face.jpg   # 정지 이미지를 움직여 만든 합성 클립
+"""
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import filter_logic as fl  # noqa: E402
+
+
+def load_video_frames(path, max_frames):
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < max_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.flip(frame, 1))
+    cap.release()
+    return frames
+
+
+def synthesize_frames(image_path, max_frames, width=1280, height=720):
+    """정지 이미지를 캔버스 위에서 천천히 이동시켜 합성 클립을 만듭니다."""
+    image = cv2.imread(image_path)
+    if image is None:
+        raise SystemExit(f"Could not read image '{image_path}'")
+    scale = (height * 0.8) / image.shape[0]
+    image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    ih, iw = image.shape[:2]
+    frames = []
+    for idx in range(max_frames):
+        canvas = np.full((height, width, 3), 40, dtype=np.uint8)
+        t = idx / max(1, max_frames - 1)
+        x = int((width - iw) * (0.5 + 0.4 * np.sin(t * np.pi * 2)))
+        y = int((height - ih) * (0.5 + 0.3 * np.cos(t * np.pi * 3)))
+        x = min(max(x, 0), width - iw)
+        y = min(max(y, 0), height - ih)
+        canvas[y:y + ih, x:x + iw] = image[:height - y, :width - x]
+        frames.append(canvas)
+    return frames
+
+
+def run_path(name, frames, process, warmup=10):
+    ratios = []
+    start = time.perf_counter()
+    for idx, frame in enumerate(frames):
+        if idx == warmup:
+            start = time.perf_counter()
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        results = process(rgb)
+        if results.multi_face_landmarks:
+            ratios.append(fl.calculate_mouth_dist(results.multi_face_landmarks[0], frame.shape[1], frame.shape[0]))
+        else:
+            ratios.append(None)
+    elapsed = time.perf_counter() - start
+    timed = max(1, len(frames) - warmup)
+    detected = sum(r is not None for r in ratios)
+    print(f"{name:<12} {timed / elapsed:7.1f} FPS  detected {detected}/{len(frames)}")
+    return ratios
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--video', help='입력 비디오 파일')
+    source.add_argument('--image', help='합성 클립을 만들 얼굴 이미지')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--roi-size', type=int, default=256)
+    args = parser.parse_args()
+
+    if args.video:
+        frames = load_video_frames(args.video, args.frames)
+    else:
+        frames = synthesize_frames(args.image, args.frames)
+    if not frames:
+        raise SystemExit("No frames to benchmark.")
+    print(f"{len(frames)} frames @ {frames[0].shape[1]}x{frames[0].shape[0]}")
+
+    baseline_mesh, _ = fl.initialize_filter_system(refine_landmarks=True)
+    baseline = run_path('full-frame', frames, baseline_mesh.process)
+    baseline_mesh.close()
+
+    plain_mesh, _ = fl.initialize_filter_system(refine_landmarks=False)
+    plain = run_path('no-refine', frames, plain_mesh.process)
+    plain_mesh.close()
+
+    tracker = fl.initialize_face_roi_tracker(refine_landmarks=False, roi_size=args.roi_size)
+    tracked = run_path('roi-tracked', frames, tracker.process)
+    print(f"roi runs {tracker.roi_runs}, full-frame fallbacks {tracker.full_frame_runs}")
+    tracker.close()
+
+    mean_ratio = np.mean([r for r in baseline if r is not None] or [0.0])
+    print(f"baseline mean mouth ratio {mean_ratio:.3f}")
+    report_error('no-refine', baseline, plain)
+    report_error('roi-tracked', baseline, tracked)
+
+
+def report_error(name, baseline, ratios):
+    errors = [abs(a - b) for a, b in zip(baseline, ratios) if a is not None and b is not None]
+    if not errors:
+        return
+    errors = np.array(errors)
+    print(f"{name:<12} mouth ratio abs error vs full-frame: mean {errors.mean():.4f}  "
+          f"p95 {np.percentile(errors, 95):.4f}  max {errors.max():.4f}")
+
+
+if __name__ == '__main__':
+    main()
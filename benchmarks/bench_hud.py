@@ -0,0 +1,130 @@
+"""
+게임 HUD(점수/레벨/모드, 하트, 수집 현황, 피드백, 일시 정지/게임 오버 문구)의 프레임당 그리기 비용을 측정합니다.
+매 프레임 cv2.putText/도형을 다시 래스터화하던 기존 방식과, 바뀐 요소만 다시 그리고
+나머지는 캐시된 타일을 합성하는 HudTileCache 방식(ChristmasGame._draw_hud)을 같은 상태로 비교합니다.
+
+    python benchmarks/bench_hud.py --frames 300
+"""
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import game_logic as gl  # noqa: E402
+
+
+def legacy_draw_heart(frame, center, size, filled):
+    x, y = center
+    radius = size // 2
+    offset = radius // 2
+    color = (0, 0, 230) if filled else (70, 70, 90)
+    outline_color = (255, 255, 255) if filled else (120, 120, 120)
+    cv2.circle(frame, (x - offset, y), radius, color, -1)
+    cv2.circle(frame, (x + offset, y), radius, color, -1)
+    triangle = np.array([[x - radius - offset, y], [x + radius + offset, y], [x, y + size]], np.int32)
+    cv2.fillConvexPoly(frame, triangle, color)
+    cv2.circle(frame, (x - offset, y), radius, outline_color, 2)
+    cv2.circle(frame, (x + offset, y), radius, outline_color, 2)
+    cv2.polylines(frame, [triangle], True, outline_color, 2, cv2.LINE_AA)
+
+
+def legacy_draw_hud(game, frame):
+    """타일 캐시 이전 _draw_hud의 글자/도형 그리기 (피격 플래시와 게임 오버 띠는 두 방식이 같아 제외)."""
+    width, height = game.width, game.height
+    for idx in range(game.max_lives):
+        legacy_draw_heart(frame, (30 + idx * 60, 50), 26, idx < game.lives)
+
+    cv2.putText(frame, f"SCORE: {game.score}", (width - 240, 70),
+                cv2.FONT_HERSHEY_DUPLEX, 1.0, (40, 220, 255), 2, cv2.LINE_AA)
+    cv2.putText(frame, f"LEVEL: {game.level}", (width - 240, 110),
+                cv2.FONT_HERSHEY_DUPLEX, 0.9, (255, 255, 255), 2, cv2.LINE_AA)
+    cv2.putText(frame, f"MODE: {game.current_difficulty.upper()}", (width - 240, 150),
+                cv2.FONT_HERSHEY_DUPLEX, 0.8, (180, 200, 255), 2, cv2.LINE_AA)
+
+    start_x, start_y = 20, height - 140
+    cv2.putText(frame, "COLLECTED", (start_x, start_y), cv2.FONT_HERSHEY_DUPLEX, 0.8, (255, 200, 150), 2, cv2.LINE_AA)
+    counts = game.collection_counts
+    for idx, item in enumerate(game.collectible_types):
+        text = f"{game.item_properties[item]['display_name']}: {counts.get(item, 0)}"
+        cv2.putText(frame, text, (start_x, start_y + 30 + idx * 28),
+                    cv2.FONT_HERSHEY_DUPLEX, 0.7, (200, 255, 200), 1, cv2.LINE_AA)
+
+    if game.paused and not game.game_over:
+        cv2.putText(frame, "PAUSED (Press P to resume)", (width // 2 - 200, height // 2),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2, cv2.LINE_AA)
+
+    if game.feedback_timer > 0:
+        (text_w, _), _ = cv2.getTextSize(game.feedback_text, cv2.FONT_HERSHEY_DUPLEX, 1.5, 3)
+        cv2.putText(frame, game.feedback_text, (width // 2 - text_w // 2, height // 2 - 150),
+                    cv2.FONT_HERSHEY_DUPLEX, 1.5, game.feedback_color, 3, cv2.LINE_AA)
+
+    if game.game_over:
+        cv2.putText(frame, "GAME OVER", (width // 2 - 210, height // 2 - 30),
+                    cv2.FONT_HERSHEY_DUPLEX, 1.8, (20, 0, 255), 4, cv2.LINE_AA)
+        cv2.putText(frame, f"Final Score: {game.score}", (width // 2 - 200, height // 2 + 30),
+                    cv2.FONT_HERSHEY_DUPLEX, 1.1, (255, 255, 255), 2, cv2.LINE_AA)
+        cv2.putText(frame, "Press R to Restart", (width // 2 - 200, height // 2 + 80),
+                    cv2.FONT_HERSHEY_DUPLEX, 0.9, (255, 220, 0), 2, cv2.LINE_AA)
+        for idx, line in enumerate(game._get_collected_summary_lines()):
+            cv2.putText(frame, line, (width // 2 - 200, height // 2 + 130 + idx * 35),
+                        cv2.FONT_HERSHEY_DUPLEX, 0.85, (255, 255, 255), 2, cv2.LINE_AA)
+
+
+def cached_draw_hud(game, frame):
+    """플래시/게임 오버 띠를 빼고 비교하도록 해당 타이머를 끈 상태로 _draw_hud를 부릅니다."""
+    game.damage_flash_timer = 0
+    band = game.solid_blend.blend_solid
+    game.solid_blend.blend_solid = lambda *args: None
+    try:
+        game._draw_hud(frame)
+    finally:
+        game.solid_blend.blend_solid = band
+
+
+def scenario_states(game, name, frame_idx):
+    """시나리오별로 프레임마다 바뀌는 게임 상태를 설정합니다."""
+    game.paused = name == 'paused'
+    game.game_over = name == 'game over'
+    game.feedback_timer = game.max_feedback_time if name in ('feedback', 'score every frame') else 0
+    if name == 'score every frame':
+        # 최악의 경우: 점수와 피드백 문구가 매 프레임 바뀜
+        game.players[0].score = frame_idx
+        game.feedback_text = f"Present! (+{frame_idx % 50})"
+
+
+def time_hud(draw, game, name, frames, frame):
+    start = time.perf_counter()
+    for idx in range(frames):
+        scenario_states(game, name, idx)
+        draw(game, frame)
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--frames', type=int, default=300)
+    args = parser.parse_args()
+
+    game = gl.ChristmasGame(args.width, args.height, seed=0)
+    game.players[0].score = 240
+    game.players[0].collection_counts['present'] = 7
+    game.feedback_text = "Present! (+10)"
+    game.feedback_color = (0, 255, 0)
+    frame = np.full((args.height, args.width, 3), 80, dtype=np.uint8)
+
+    print(f"{'scenario':<18} {'putText us':>11} {'tiles us':>9} {'speedup':>8}")
+    for name in ['steady', 'feedback', 'paused', 'game over', 'score every frame']:
+        legacy = time_hud(legacy_draw_hud, game, name, args.frames, frame)
+        cached = time_hud(cached_draw_hud, game, name, args.frames, frame)
+        print(f"{name:<18} {legacy * 1e6:>11.0f} {cached * 1e6:>9.0f} {legacy / cached:>7.1f}x")
+    print(f"tile renders {game.hud_tiles.renders}, cache hits {game.hud_tiles.hits}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+헤드리스 시뮬레이션으로 모든 난이도의 게임 로직 처리량과 점수 분포를 측정합니다.
+각 판은 (난이도, 시드)로 결정되므로 같은 옵션이면 같은 점수 분포가 나옵니다.
+
+    python benchmarks/bench_simulation.py --runs 2000 --workers 8
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+import game_logic as gl  # noqa: E402
+import simulation  # noqa: E402
+
+
+def _run_task(task):
+    difficulty, seed, max_frames, controller = task
+    return simulation.simulate_run(difficulty, seed, max_frames=max_frames, controller=controller)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=600, help='난이도별 시뮬레이션 횟수')
+    parser.add_argument('--frames', type=int, default=3600, help='판당 최대 프레임 수')
+    parser.add_argument('--controller', choices=sorted(simulation.CONTROLLERS), default='greedy')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0, help='첫 시드 (난이도마다 seed..seed+runs-1 사용)')
+    args = parser.parse_args()
+
+    difficulties = list(gl.ChristmasGame(64, 64, render=False).difficulty_settings)
+    tasks = [(difficulty, args.seed + idx, args.frames, args.controller)
+             for difficulty in difficulties for idx in range(args.runs)]
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers) as pool:
+        results = pool.map(_run_task, tasks, chunksize=max(1, len(tasks) // (args.workers * 8)))
+    elapsed = time.perf_counter() - start
+
+    total_frames = sum(r['frames'] for r in results)
+    print(f"{len(results)} runs on {args.workers} workers in {elapsed:.2f}s: "
+          f"{len(results) / elapsed:.0f} runs/s, {total_frames / elapsed:,.0f} frames/s")
+    for difficulty in difficulties:
+        rows = [r for r in results if r['difficulty'] == difficulty]
+        scores = np.array([r['score'] for r in rows])
+        frames = np.array([r['frames'] for r in rows])
+        game_over_rate = np.mean([r['game_over'] for r in rows])
+        p10, p50, p90 = np.percentile(scores, [10, 50, 90])
+        print(f"{difficulty:<7} score mean {scores.mean():7.1f}  p10 {p10:6.0f}  p50 {p50:6.0f}  p90 {p90:6.0f}  "
+              f"max {scores.max():5d}  frames mean {frames.mean():7.1f}  game over {game_over_rate:5.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+import hashlib
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+from sprites import PremultipliedSprite
+
+# 미리 축소/알파 곱셈한 아이템 스프라이트 아틀라스를 저장하는 디렉터리 (아이템 목록/크기 단계별로 파일 하나)
+ASSET_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', '.cache')
+# 아틀라스 전처리 방식이 바뀌면 올려서 이전 캐시 파일을 무효화
+ATLAS_FORMAT_VERSION = 1
+# 아이템 스프라이트 크기 단계 (px). 프레임 높이에 맞는 단계를 골라 캐시를 단계 수만큼으로 제한
+ITEM_SIZE_LEVELS = (60, 80, 100, 120, 150, 180, 240)
+# 이 프레임 높이에서 아이템 크기가 ITEM_BASE_SIZE (720p 기준 120px)
+ITEM_REFERENCE_HEIGHT = 720
+ITEM_BASE_SIZE = 120
+
+# 프로세스 안에서 ChristmasGame 인스턴스끼리 공유하는 아틀라스 (캐시 파일 경로 → SpriteAtlas)
+_loaded_atlases = {}
+
+
+class SpriteAtlas:
+    """
+    한 크기(size x size)로 미리 축소한 아이템 스프라이트를 한 배열에 묶은 아틀라스입니다.
+    data는 (아이템 수, 2, size, size, 3) uint8 배열로, [i, 0]은 알파를 미리 곱한 BGR, [i, 1]은 3채널 inv_alpha입니다.
+    캐시 파일에서 읽은 경우 data는 읽기 전용 memmap이라 여러 게임 인스턴스와 프로세스가 같은 페이지를 공유합니다.
+    """
+
+    def __init__(self, names, data, path=None):
+        self.names = list(names)
+        self.data = data
+        self.path = path
+        self.size = data.shape[2]
+        self.sprites = {
+            name: PremultipliedSprite.from_premultiplied(np.asarray(data[idx, 0]), np.asarray(data[idx, 1]))
+            for idx, name in enumerate(self.names)
+        }
+
+
+def _premultiplied_tile(path, size, fallback_color):
+    """
+    에셋 하나를 (premultiplied, inv_alpha) 한 쌍으로 만듭니다.
+    원본 해상도에서 알파를 먼저 곱한 뒤 INTER_AREA로 축소하므로 투명 영역의 색이 가장자리로 번지지 않습니다.
+    """
+    img = cv2.imread(path, cv2.IMREAD_UNCHANGED) if path else None
+    if path and img is None:
+        print(f"WARNING: Could not load asset '{path}'. Using fallback graphic.")
+    tile = np.empty((2, size, size, 3), dtype=np.uint8)
+    if img is None:
+        tile[0] = fallback_color
+        tile[1] = 0
+        return tile
+
+    if img.ndim == 2:
+        img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+    bgr = np.ascontiguousarray(img[:, :, :3])
+    if img.shape[2] == 4:
+        alpha = np.ascontiguousarray(img[:, :, 3])
+        bgr = cv2.multiply(bgr, cv2.merge([alpha] * 3), scale=1 / 255.0)
+    else:
+        alpha = np.full(img.shape[:2], 255, dtype=np.uint8)
+    cv2.resize(bgr, (size, size), dst=tile[0], interpolation=cv2.INTER_AREA)
+    small_alpha = cv2.resize(alpha, (size, size), interpolation=cv2.INTER_AREA)
+    cv2.merge([cv2.bitwise_not(small_alpha)] * 3, dst=tile[1])
+    return tile
+
+
+def item_size_for_frame(height, levels=ITEM_SIZE_LEVELS):
+    """프레임 높이에 비례한 아이템 크기에 가장 가까운 크기 단계를 반환합니다. (720p → 120px)"""
+    target = ITEM_BASE_SIZE * height / ITEM_REFERENCE_HEIGHT
+    return min(levels, key=lambda level: abs(level - target))
+
+
+def _entry_set_key(entries):
+    """아이템 이름과 에셋 경로로 아틀라스 종류를 구분하는 키를 만듭니다. (에셋이 바뀌어도 같음)"""
+    parts = [f"{name}|{os.path.abspath(path) if path else ''}" for name, path, _ in entries]
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:12]
+
+
+def _atlas_key(entries, size):
+    """에셋 경로별 수정 시각과 파일 크기, 목표 크기, 대체 색으로 캐시 내용의 키를 만듭니다."""
+    parts = [f"v{ATLAS_FORMAT_VERSION}", str(size)]
+    for name, path, fallback_color in entries:
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            stat = None
+        parts.append(f"{name}|{os.path.basename(path or '')}|{stat.st_mtime_ns if stat else 0}|"
+                     f"{stat.st_size if stat else 0}|{tuple(fallback_color)}")
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def build_atlas_data(entries, size):
+    """entries [(이름, 에셋 경로, 대체 색)]를 size 크기 아틀라스 배열로 만듭니다."""
+    data = np.empty((len(entries), 2, size, size, 3), dtype=np.uint8)
+    for idx, (_, path, fallback_color) in enumerate(entries):
+        data[idx] = _premultiplied_tile(path, size, fallback_color)
+    return data
+
+
+def _write_cache(cache_dir, path, prefix, data):
+    """임시 파일에 쓴 뒤 이름을 바꿔, 동시에 만드는 다른 프로세스가 반쯤 쓰인 파일을 읽지 않게 합니다."""
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=prefix, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    # 에셋이 바뀌기 전의 같은 아틀라스 종류/크기 파일만 정리 (다른 아이템 목록의 캐시는 그대로 둠)
+    for filename in os.listdir(cache_dir):
+        if filename.startswith(prefix) and filename.endswith('.npy') and filename != os.path.basename(path):
+            try:
+                os.unlink(os.path.join(cache_dir, filename))
+            except OSError:
+                pass
+
+
+def load_item_atlas(entries, size, cache_dir=ASSET_CACHE_DIR):
+    """
+    entries [(이름, 에셋 경로, 대체 색)]의 size 크기 SpriteAtlas를 반환합니다.
+    같은 에셋/크기의 캐시 파일이 있으면 읽기 전용 memmap으로 열고, 없거나 에셋이 바뀌었으면 새로 만들어 저장합니다.
+    캐시 파일은 아이템 목록(_entry_set_key)과 크기 단계(item_size_for_frame)마다 하나씩 남습니다.
+    캐시를 쓸 수 없으면 메모리에만 만듭니다.
+    """
+    entries = list(entries)
+    prefix = f"items_{size}px_{_entry_set_key(entries)}_"
+    path = os.path.join(cache_dir, f"{prefix}{_atlas_key(entries, size)}.npy") if cache_dir else None
+    atlas = _loaded_atlases.get(path) if path else None
+    if atlas is not None:
+        return atlas
+
+    expected_shape = (len(entries), 2, size, size, 3)
+    data = None
+    if path and os.path.exists(path):
+        try:
+            data = np.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            data = None
+        if data is not None and (data.shape != expected_shape or data.dtype != np.uint8):
+            data = None
+    if data is None:
+        data = build_atlas_data(entries, size)
+        if path:
+            try:
+                _write_cache(cache_dir, path, prefix, data)
+                data = np.load(path, mmap_mode='r')
+            except OSError as exc:
+                print(f"WARNING: Could not write asset cache '{path}': {exc}")
+                path = None
+
+    atlas = SpriteAtlas([name for name, _, _ in entries], data, path)
+    if path:
+        _loaded_atlases[path] = atlas
+    return atlas
@@ -1,11 +1,20 @@
 import cv2
-import mediapipe as mp
 import numpy as np
-
-# MediaPipe 객체 초기화
-mp_drawing = mp.solutions.drawing_utils
-mp_face_mesh = mp.solutions.face_mesh
-mp_hands = mp.solutions.hands
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from profiling import NULL_PROFILER, NULL_STARTUP
+
+# mediapipe는 import에만 수 초가 걸리므로 모델을 처음 만들 때 load_mediapipe()로 불러옴
+_mediapipe = None
+
+def load_mediapipe():
+    """mediapipe 모듈을 처음 호출될 때 한 번만 import해 반환합니다."""
+    global _mediapipe
+    if _mediapipe is None:
+        import mediapipe
+        _mediapipe = mediapipe
+    return _mediapipe
 
 # 입 벌림 거리 측정을 위한 랜드마크 인덱스 정의 (입술 중앙)
 MOUTH_UPPER = 13  # upper lip center
@@ -15,6 +24,11 @@ MOUTH_LOWER = 14  # lower lip center
 LEFT_EYE_INNER = 263 
 RIGHT_EYE_INNER = 33 
 
+# ROI 추적 시 얼굴 영역 계산에 쓰는 윤곽 랜드마크
+# (mediapipe FACEMESH_FACE_OVAL 연결에 쓰인 정점들. mediapipe를 import하지 않도록 값으로 둠)
+FACE_OVAL_LANDMARKS = [10, 21, 54, 58, 67, 93, 103, 109, 127, 132, 136, 148, 149, 150, 152, 162, 172, 176,
+                       234, 251, 284, 288, 297, 323, 332, 338, 356, 361, 365, 377, 378, 379, 389, 397, 400, 454]
+
 # 손 제스처 판별을 위한 랜드마크 (관절 비교용)
 HAND_FINGER_TIPS = [8, 12, 16, 20]
 HAND_FINGER_PIPS = [6, 10, 14, 18]
@@ -42,31 +56,204 @@ MODEL_3D_POINTS = np.array([
     (0.0, -330.0, -65.0)
 ], dtype=np.float32)
 
-def initialize_filter_system():
-    """MediaPipe Face Mesh 객체를 초기화하고 반환합니다."""
-    face_mesh = mp_face_mesh.FaceMesh(
-        max_num_faces=1,
-        refine_landmarks=True,
+def initialize_filter_system(refine_landmarks=True, max_num_faces=1):
+    """
+    MediaPipe Face Mesh 객체를 초기화하고 반환합니다.
+    게임플레이는 입/눈 랜드마크만 사용하므로 refine_landmarks=False로 홍채 정밀 모델을 끌 수 있습니다.
+    max_num_faces: 멀티플레이어 모드에서 추적할 얼굴 수 (얼굴마다 랜드마크 모델이 한 번씩 더 돎)
+    """
+    mp = load_mediapipe()
+    face_mesh = mp.solutions.face_mesh.FaceMesh(
+        max_num_faces=max_num_faces,
+        refine_landmarks=refine_landmarks,
         min_detection_confidence=0.5,
         min_tracking_confidence=0.5)
-    return face_mesh, mp_drawing
+    return face_mesh, mp.solutions.drawing_utils
 
 def initialize_hand_tracker():
     """MediaPipe Hands 객체를 초기화하고 반환합니다."""
-    hand_tracker = mp_hands.Hands(
+    hand_tracker = load_mediapipe().solutions.hands.Hands(
         max_num_hands=1,
         min_detection_confidence=0.5,
         min_tracking_confidence=0.5)
     return hand_tracker
 
-def process_frame(frame, face_mesh):
-    """MediaPipe Face Mesh를 사용하여 프레임을 처리합니다."""
-    frame.flags.writeable = False
-    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    results = face_mesh.process(frame)
-    frame.flags.writeable = True
-    processed_frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-    return processed_frame, results
+class FrameBuffers:
+    """
+    추론 입력용 RGB 버퍼를 해상도별로 한 번만 할당해 프레임마다 재사용합니다.
+    convert()가 돌려주는 RGB 뷰는 읽기 전용이며, 다음 convert() 호출 때 덮어써집니다.
+    scale < 1이면 BGR 프레임을 먼저 INTER_AREA로 한 번 축소한 뒤 변환합니다.
+    모델 출력은 정규화 좌표이고 가로세로 비율이 유지되므로 전체 해상도 화면에 그대로 대응됩니다.
+    """
+
+    def __init__(self, scale=1.0):
+        self.scale = scale
+        self.rgb = None
+        self.small = None
+
+    def inference_size(self, frame):
+        """frame을 추론할 때의 (width, height)를 반환합니다."""
+        height, width = frame.shape[:2]
+        return self.scaled_size(width, height)
+
+    def scaled_size(self, width, height):
+        """width x height 프레임을 추론할 때의 (width, height)를 반환합니다."""
+        if self.scale >= 1.0:
+            return width, height
+        return max(1, int(round(width * self.scale))), max(1, int(round(height * self.scale)))
+
+    def convert(self, frame, out=None):
+        """
+        BGR 프레임을 재사용 버퍼에 (필요하면 축소해) RGB로 변환하고 읽기 전용 뷰를 반환합니다.
+        out을 주면 (inference_size와 같은 크기의 연속 배열) 내부 버퍼 대신 out에 바로 씁니다.
+        """
+        width, height = self.inference_size(frame)
+        source = frame
+        if (width, height) != (frame.shape[1], frame.shape[0]):
+            if self.small is None or self.small.shape[:2] != (height, width):
+                self.small = np.empty((height, width, 3), dtype=np.uint8)
+            cv2.resize(frame, (width, height), dst=self.small, interpolation=cv2.INTER_AREA)
+            source = self.small
+        if out is not None:
+            cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=out)
+            return out
+        if self.rgb is None or self.rgb.shape != source.shape:
+            self.rgb = np.empty(source.shape, dtype=np.uint8)
+        self.rgb.flags.writeable = True
+        cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=self.rgb)
+        self.rgb.flags.writeable = False
+        return self.rgb
+
+
+# process_frame / detect_hand_gesture에서 rgb를 따로 넘기지 않았을 때 쓰는 기본 버퍼
+_default_buffers = FrameBuffers()
+
+def process_frame(frame, face_mesh, rgb=None):
+    """
+    MediaPipe Face Mesh를 사용하여 프레임을 처리합니다.
+    원본 BGR 프레임은 그대로 반환하며, 이미 변환한 RGB 뷰가 있으면 rgb로 넘겨 재사용합니다.
+    """
+    if rgb is None:
+        rgb = _default_buffers.convert(frame)
+    results = face_mesh.process(rgb)
+    return frame, results
+
+class FaceRoiTracker:
+    """
+    입 주변 ROI 추적 모드의 Face Mesh 래퍼입니다. (face_mesh.process와 같은 인터페이스)
+    얼굴을 한 번 찾으면 마지막 얼굴 영역을 패딩한 정사각형 ROI만 잘라 roi_size로 축소해 추론하고,
+    랜드마크를 전체 프레임 정규화 좌표로 되돌립니다. ROI에서 얼굴을 놓치면 전체 프레임 검출로 돌아갑니다.
+    ROI는 얼굴이 안쪽 여백을 벗어나거나 크기가 크게 변할 때만 다시 잡아 내부 추적이 흔들리지 않게 합니다.
+    """
+
+    def __init__(self, full_mesh, roi_mesh, roi_size=256, padding=0.6, inner_margin=0.15, resize_tolerance=0.25):
+        self.full_mesh = full_mesh
+        self.roi_mesh = roi_mesh
+        self.roi_size = roi_size
+        self.padding = padding
+        self.inner_margin = inner_margin
+        self.resize_tolerance = resize_tolerance
+        self.roi = None
+        self._roi_buffer = None
+        self.full_frame_runs = 0
+        self.roi_runs = 0
+
+    def process(self, rgb):
+        """RGB 프레임을 추론합니다. 반환값의 랜드마크는 전체 프레임 기준 정규화 좌표입니다."""
+        frame_height, frame_width = rgb.shape[:2]
+        if self.roi is not None:
+            results = self._process_roi(rgb, frame_width, frame_height)
+            if results.multi_face_landmarks:
+                self._update_roi(results.multi_face_landmarks[0], frame_width, frame_height)
+                return results
+            # 추적 실패: 전체 프레임 검출로 복귀
+            self.roi = None
+
+        self.full_frame_runs += 1
+        results = self.full_mesh.process(rgb)
+        if results.multi_face_landmarks:
+            self._update_roi(results.multi_face_landmarks[0], frame_width, frame_height, force=True)
+        return results
+
+    def _process_roi(self, rgb, frame_width, frame_height):
+        x1, y1, x2, y2 = self.roi
+        crop = rgb[y1:y2, x1:x2]
+        if self._roi_buffer is None:
+            self._roi_buffer = np.empty((self.roi_size, self.roi_size, 3), dtype=np.uint8)
+        # ROI 축소 비율은 보통 2배 안팎이라 INTER_AREA보다 훨씬 싼 INTER_LINEAR로 충분함
+        cv2.resize(crop, (self.roi_size, self.roi_size), dst=self._roi_buffer, interpolation=cv2.INTER_LINEAR)
+        self.roi_runs += 1
+        results = self.roi_mesh.process(self._roi_buffer)
+        if not results.multi_face_landmarks:
+            return results
+
+        # ROI 정규화 좌표 → 전체 프레임 정규화 좌표
+        side = x2 - x1
+        scale_x = side / frame_width
+        scale_y = side / frame_height
+        offset_x = x1 / frame_width
+        offset_y = y1 / frame_height
+        for face_landmarks in results.multi_face_landmarks:
+            for lm in face_landmarks.landmark:
+                lm.x = offset_x + lm.x * scale_x
+                lm.y = offset_y + lm.y * scale_y
+                lm.z = lm.z * scale_x
+        return results
+
+    def _update_roi(self, landmarks, frame_width, frame_height, force=False):
+        # 얼굴 윤곽 랜드마크만으로 얼굴 영역을 구함
+        points = [landmarks.landmark[idx] for idx in FACE_OVAL_LANDMARKS]
+        xs = np.fromiter((lm.x for lm in points), dtype=np.float32) * frame_width
+        ys = np.fromiter((lm.y for lm in points), dtype=np.float32) * frame_height
+        fx1, fx2 = float(xs.min()), float(xs.max())
+        fy1, fy2 = float(ys.min()), float(ys.max())
+        face_side = max(fx2 - fx1, fy2 - fy1, 1.0)
+
+        if not force and self.roi is not None:
+            x1, y1, x2, y2 = self.roi
+            side = x2 - x1
+            margin = side * self.inner_margin
+            inside = (fx1 >= x1 + margin and fx2 <= x2 - margin and
+                      fy1 >= y1 + margin and fy2 <= y2 - margin)
+            expected_face = side / (1 + 2 * self.padding)
+            size_ok = abs(face_side - expected_face) <= expected_face * self.resize_tolerance
+            if inside and size_ok:
+                return
+
+        side = int(min(face_side * (1 + 2 * self.padding), frame_width, frame_height))
+        cx = (fx1 + fx2) / 2
+        cy = (fy1 + fy2) / 2
+        x1 = int(min(max(cx - side / 2, 0), frame_width - side))
+        y1 = int(min(max(cy - side / 2, 0), frame_height - side))
+        self.roi = (x1, y1, x1 + side, y1 + side)
+
+    def reset(self):
+        self.roi = None
+
+    def close(self):
+        self.full_mesh.close()
+        self.roi_mesh.close()
+
+
+def initialize_face_roi_tracker(refine_landmarks=False, roi_size=256):
+    """ROI 추적 모드용 Face Mesh(전체 프레임 검출용 + ROI 추론용)를 만들어 FaceRoiTracker로 반환합니다."""
+    full_mesh, _ = initialize_filter_system(refine_landmarks)
+    roi_mesh, _ = initialize_filter_system(refine_landmarks)
+    return FaceRoiTracker(full_mesh, roi_mesh, roi_size=roi_size)
+
+def warm_up_model(model, width, height):
+    """
+    검은 RGB 프레임으로 한 번 추론해 그래프 초기화와 첫 추론 비용을 게임 시작 전에 치릅니다.
+    FaceRoiTracker는 전체 프레임용과 ROI용 Face Mesh를 각자의 입력 크기로 한 번씩 돌립니다.
+    """
+    if isinstance(model, FaceRoiTracker):
+        graphs = [(model.full_mesh, width, height), (model.roi_mesh, model.roi_size, model.roi_size)]
+    else:
+        graphs = [(model, width, height)]
+    for graph, graph_width, graph_height in graphs:
+        rgb = np.zeros((graph_height, graph_width, 3), dtype=np.uint8)
+        rgb.flags.writeable = False
+        graph.process(rgb)
 
 def draw_landmarks_and_mesh(frame, results, mp_drawing):
     """얼굴 메쉬와 랜드마크를 그립니다. (현재 main.py에서 주석 처리됨)"""
@@ -75,7 +262,7 @@ def draw_landmarks_and_mesh(frame, results, mp_drawing):
             mp_drawing.draw_landmarks(
                 image=frame,
                 landmark_list=face_landmarks,
-                connections=mp_face_mesh.FACEMESH_TESSELATION,
+                connections=load_mediapipe().solutions.face_mesh.FACEMESH_TESSELATION,
                 landmark_drawing_spec=None,
                 connection_drawing_spec=mp_drawing.DrawingSpec(color=(120, 120, 120), thickness=1, circle_radius=1))
     return frame
@@ -160,20 +347,28 @@ def draw_head_pose_axis(frame, rvec, image_points, camera_matrix, dist_coeffs):
     
     return frame
 
-def detect_hand_gesture(frame, hand_tracker):
-    """손 랜드마크를 분석해 단순 제스처를 판별하고 좌표 데이터를 반환합니다."""
-    data = {
+def _empty_hand_data():
+    return {
         'gesture': None,
         'landmarks': [],
         'hand_count': 0
     }
 
+def detect_hand_gesture(frame, hand_tracker, rgb=None):
+    """손 랜드마크를 분석해 단순 제스처를 판별하고 좌표 데이터를 반환합니다."""
     if hand_tracker is None or frame is None:
-        return data
+        return _empty_hand_data()
 
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    if rgb is None:
+        rgb = _default_buffers.convert(frame)
     results = hand_tracker.process(rgb)
-    if not results.multi_hand_landmarks:
+    return build_hand_data(results)
+
+def build_hand_data(results):
+    """MediaPipe Hands 결과를 main.py에서 사용하는 hand_data 딕셔너리로 변환합니다."""
+    data = _empty_hand_data()
+
+    if results is None or not results.multi_hand_landmarks:
         return data
 
     # 저장용 좌표 리스트 생성 (x, y, z 튜플)
@@ -186,21 +381,372 @@ def detect_hand_gesture(frame, hand_tracker):
     data['hand_count'] = len(hand_points)
 
     # 첫 번째 손으로 제스처 판정
-    primary = results.multi_hand_landmarks[0]
+    data['gesture'] = classify_gesture(hand_points[0])
+    return data
 
+def classify_gesture(hand_points):
+    """(x, y, z) 좌표 리스트로 된 손 하나의 제스처를 판별합니다."""
     finger_states = []
     for tip_idx, pip_idx in zip(HAND_FINGER_TIPS, HAND_FINGER_PIPS):
-        tip = primary.landmark[tip_idx]
-        pip = primary.landmark[pip_idx]
-        finger_states.append(tip.y < pip.y - 0.015)
+        tip_y = hand_points[tip_idx][1]
+        pip_y = hand_points[pip_idx][1]
+        finger_states.append(tip_y < pip_y - 0.015)
 
     if all(finger_states):
-        data['gesture'] = 'PALM'
+        return 'PALM'
     elif finger_states[0] and finger_states[1] and not finger_states[2] and not finger_states[3]:
-        data['gesture'] = 'PEACE'
+        return 'PEACE'
     elif not any(finger_states):
-        data['gesture'] = 'FIST'
+        return 'FIST'
     elif finger_states[0] and finger_states[3] and not finger_states[1] and not finger_states[2]:
-        data['gesture'] = 'ROCK'
+        return 'ROCK'
+    return None
 
-    return data
+
+class HandTrackingScheduler:
+    """
+    Hands 모델의 실행 주기를 조절합니다.
+    제스처 프롬프트가 활성화된 동안에는 active_interval, 그 외에는 interval 프레임마다 한 번만 모델을 돌리고,
+    건너뛴 프레임에는 최근 두 번의 검출로 구한 속도로 랜드마크를 외삽(또는 유지)한 hand_data를 돌려줍니다.
+    """
+
+    def __init__(self, interval=3, active_interval=1, max_hold_frames=8, extrapolate=True):
+        self.interval = max(1, int(interval))
+        self.active_interval = max(1, int(active_interval))
+        self.max_hold_frames = max_hold_frames
+        self.extrapolate = extrapolate
+        self.active = False
+        self._frames_since_run = None
+        self._last_points = None
+        self._velocity = None
+        self._last_gesture = None
+
+    def set_active(self, active):
+        """제스처 판정이 필요한 구간이면 True로 설정해 더 자주 모델을 실행합니다."""
+        self.active = bool(active)
+
+    def should_run(self):
+        if self._frames_since_run is None:
+            return True
+        interval = self.active_interval if self.active else self.interval
+        return self._frames_since_run + 1 >= interval
+
+    def record(self, hand_data):
+        """실제 모델 결과를 기록하고 그대로 반환합니다."""
+        landmarks = hand_data.get('landmarks') or []
+        points = np.array(landmarks, dtype=np.float32) if landmarks else None
+        if (points is not None and self._last_points is not None
+                and points.shape == self._last_points.shape and self._frames_since_run is not None):
+            self._velocity = (points - self._last_points) / (self._frames_since_run + 1)
+        else:
+            self._velocity = None
+        self._last_points = points
+        self._last_gesture = hand_data.get('gesture')
+        self._frames_since_run = 0
+        return hand_data
+
+    def predict(self):
+        """모델을 건너뛴 프레임의 hand_data를 만듭니다. 오래 유지된 결과는 버립니다."""
+        self._frames_since_run = (self._frames_since_run or 0) + 1
+        data = _empty_hand_data()
+        if self._last_points is None or self._frames_since_run > self.max_hold_frames:
+            return data
+
+        points = self._last_points
+        if self.extrapolate and self._velocity is not None:
+            points = points + self._velocity * self._frames_since_run
+
+        data['landmarks'] = [[tuple(float(v) for v in lm) for lm in hand] for hand in points]
+        data['hand_count'] = len(points)
+        data['gesture'] = self._last_gesture
+        return data
+
+    def reset(self):
+        self._frames_since_run = None
+        self._last_points = None
+        self._velocity = None
+        self._last_gesture = None
+
+
+# 장면 변화 감지용 축소 흑백 이미지 크기와 판정 기준
+FRAME_CHANGE_SIZE = (64, 36)
+FRAME_CHANGE_PIXEL_DELTA = 12   # 축소 이미지에서 이 값보다 밝기가 변한 칸을 '변화'로 셈
+FRAME_CHANGE_MIN_CELLS = 4      # 변화한 칸이 이만큼 이상이면 장면이 바뀐 것으로 판정
+# 메뉴/일시 정지/게임 오버 화면에서 장면이 그대로일 때 결과를 재사용할 수 있는 최대 시간 (초)
+RESULT_CACHE_TTL = 1.0
+# 같은 화면에서 장면이 바뀌어도 추론을 다시 돌리지 않는 간격 (초)
+IDLE_KEEPALIVE_INTERVAL = 0.5
+
+
+class FrameChangeDetector:
+    """
+    프레임을 작은 흑백 이미지로 줄여 기준 프레임과 비교하는 장면 변화 감지기입니다.
+    칸 단위 밝기 차이가 FRAME_CHANGE_PIXEL_DELTA를 넘는 칸 수로 판정하므로,
+    카메라 노이즈는 무시하고 입 벌림처럼 작은 영역의 움직임은 잡아냅니다. (720p 기준 1ms 미만)
+    """
+
+    def __init__(self, size=FRAME_CHANGE_SIZE, pixel_delta=FRAME_CHANGE_PIXEL_DELTA, min_cells=FRAME_CHANGE_MIN_CELLS):
+        self.size = size
+        self.pixel_delta = pixel_delta
+        self.min_cells = min_cells
+        self.reference = None
+        self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        self._last_thumb = None
+
+    def _thumbnail(self, frame):
+        cv2.resize(frame, self.size, dst=self._small, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY)
+
+    def changed(self, frame):
+        """기준 프레임 이후 장면이 바뀌었으면 True입니다. 기준이 없으면 항상 True."""
+        thumb = self._thumbnail(frame)
+        self._last_thumb = thumb
+        if self.reference is None:
+            return True
+        diff = cv2.absdiff(thumb, self.reference)
+        return cv2.countNonZero(cv2.threshold(diff, self.pixel_delta, 255, cv2.THRESH_BINARY)[1]) >= self.min_cells
+
+    def set_reference(self, frame, reuse_last=False):
+        """
+        frame을 새 기준으로 삼습니다.
+        reuse_last=True면 같은 프레임에 대해 방금 호출한 changed()의 축소 이미지를 다시 씁니다.
+        (카메라 버퍼는 재사용되므로 배열 동일성으로는 같은 프레임인지 알 수 없음)
+        """
+        thumb = self._last_thumb if reuse_last and self._last_thumb is not None else self._thumbnail(frame)
+        self.reference = thumb
+        self._last_thumb = None
+
+    def reset(self):
+        self.reference = None
+        self._last_thumb = None
+
+
+class InferenceResultCache:
+    """
+    마지막 추론 결과(face_results, hand_data)를 짧게 보관합니다.
+    idle(메뉴/일시 정지/게임 오버) 동안에만 재사용합니다. keepalive_interval 안에서는 장면과 관계없이,
+    그 뒤로는 장면이 그대로이고 ttl이 지나지 않았을 때만 재사용하고 움직임이 감지되면 다시 추론합니다.
+    게임 중에는 축소 이미지로 잡히지 않는 작은 입 벌림도 놓치면 안 되므로 매 프레임 추론합니다.
+    """
+
+    def __init__(self, detector=None, ttl=RESULT_CACHE_TTL, keepalive_interval=IDLE_KEEPALIVE_INTERVAL,
+                 clock=time.perf_counter):
+        self.detector = detector or FrameChangeDetector()
+        self.ttl = ttl
+        self.keepalive_interval = keepalive_interval
+        self.clock = clock
+        self.idle = False
+        self.hits = 0
+        self.misses = 0
+        self._entry = None
+        self._stored_at = 0.0
+        self._checked = False
+
+    def lookup(self, frame):
+        """재사용할 수 있으면 (face_results, hand_data), 추론이 필요하면 None을 반환합니다."""
+        self._checked = False
+        if self._entry is None or not self.idle:
+            self.misses += 1
+            return None
+        age = self.clock() - self._stored_at
+        reusable = age < self.keepalive_interval
+        if not reusable and age < self.ttl:
+            self._checked = True
+            reusable = not self.detector.changed(frame)
+        if reusable:
+            self.hits += 1
+            return self._entry
+        self.misses += 1
+        return None
+
+    def store(self, frame, face_results, hand_data):
+        """방금 lookup()한 frame의 추론 결과를 저장합니다."""
+        if self.idle:
+            self.detector.set_reference(frame, reuse_last=self._checked)
+        else:
+            # 게임 중에는 기준 프레임을 만들지 않음 (idle로 바뀐 뒤 첫 비교는 항상 '변화'로 판정)
+            self.detector.reset()
+        self._entry = (face_results, hand_data)
+        self._stored_at = self.clock()
+
+    def invalidate(self):
+        self._entry = None
+        self.detector.reset()
+
+
+class InferenceResult:
+    """
+    한 프레임에 대한 Face Mesh / Hands 추론 결과를 묶은 객체입니다.
+    media_time은 추론한 프레임의 영상 내 시각(초)입니다. 트레이스 재생은 기록된 시각, 그 외에는 main이 입력 소스에서 채웁니다.
+    """
+
+    def __init__(self, frame, face_results, hand_data, media_time=None):
+        self.frame = frame
+        self.face_results = face_results
+        self.hand_data = hand_data
+        self.media_time = media_time
+
+
+class InferenceCoordinator:
+    """
+    프레임을 한 번만 RGB로 변환한 뒤 같은 버퍼를 Face Mesh와 Hands 그래프에 동시에 전달합니다.
+    MediaPipe 그래프 실행은 GIL을 놓기 때문에, Hands는 전용 워커 스레드에서 돌리고
+    Face Mesh는 호출 스레드에서 돌려 프레임당 추론 시간이 두 모델 시간의 합이 아닌 최댓값이 되게 합니다.
+    """
+
+    def __init__(self, face_mesh, hand_tracker, parallel=True, hand_scheduler=None, timers=None, result_cache=None,
+                 inference_scale=1.0):
+        self.face_mesh = face_mesh
+        self.hand_tracker = hand_tracker
+        self.hand_scheduler = hand_scheduler
+        # 메뉴/일시 정지/게임 오버 중 추론을 건너뛰는 InferenceResultCache (None이면 매 프레임 추론)
+        self.result_cache = result_cache
+        # 모델별 추론 시간을 'inference.face' / 'inference.hands'로 기록 (profiling.FrameProfiler)
+        self.timers = timers or NULL_PROFILER
+        # inference_scale < 1이면 두 모델 모두 한 번 축소한 같은 RGB 버퍼를 받음 (렌더링은 원본 해상도 유지)
+        self.buffers = FrameBuffers(scale=inference_scale)
+        self.parallel = parallel and hand_tracker is not None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='hands') if self.parallel else None
+
+    def process(self, frame):
+        """frame(BGR)을 추론해 InferenceResult를 반환합니다."""
+        if self.result_cache is not None:
+            cached = self.result_cache.lookup(frame)
+            if cached is not None:
+                return InferenceResult(frame, *cached)
+
+        rgb = self.buffers.convert(frame)
+
+        run_hands = self.hand_tracker is not None
+        if run_hands and self.hand_scheduler is not None:
+            run_hands = self.hand_scheduler.should_run()
+
+        hand_future = None
+        hand_results = None
+        if run_hands and self._executor is not None:
+            hand_future = self._executor.submit(self._process_hands, rgb)
+        elif run_hands:
+            hand_results = self._process_hands(rgb)
+
+        with self.timers.measure('inference.face'):
+            face_results = self.face_mesh.process(rgb)
+        if hand_future is not None:
+            hand_results = hand_future.result()
+
+        if not run_hands and self.hand_scheduler is not None:
+            hand_data = self.hand_scheduler.predict()
+        else:
+            hand_data = build_hand_data(hand_results)
+            if self.hand_scheduler is not None:
+                self.hand_scheduler.record(hand_data)
+
+        if self.result_cache is not None:
+            self.result_cache.store(frame, face_results, hand_data)
+        return InferenceResult(frame, face_results, hand_data)
+
+    def set_idle(self, idle):
+        """메뉴/일시 정지/게임 오버처럼 정확한 추적이 필요 없는 동안 추론을 저빈도 keep-alive로 낮춥니다."""
+        if self.result_cache is not None:
+            self.result_cache.idle = idle
+
+    def warm_up(self, width, height):
+        """width x height 프레임 기준 추론 크기로 두 모델을 한 번씩 미리 실행합니다."""
+        width, height = self.buffers.scaled_size(width, height)
+        warm_up_model(self.face_mesh, width, height)
+        if self.hand_tracker is not None:
+            warm_up_model(self.hand_tracker, width, height)
+
+    def _process_hands(self, rgb):
+        with self.timers.measure('inference.hands'):
+            return self.hand_tracker.process(rgb)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class _NoFaceResults:
+    """모델이 준비되기 전 프레임의 얼굴 결과 (검출된 얼굴 없음)."""
+    multi_face_landmarks = None
+
+
+class DeferredInference:
+    """
+    모델 생성(mediapipe import 포함)과 워밍업 추론을 백그라운드 스레드에서 하는 추론 래퍼입니다.
+    (process / set_idle / close 인터페이스는 감싼 InferenceCoordinator / ProcessInferencePool과 동일)
+    준비되기 전 process()는 추론 없이 얼굴/손이 없는 결과를 바로 돌려주므로 창과 메뉴는 카메라 영상으로 먼저 뜹니다.
+    초기화에 실패하거나 실행 중 추론 객체가 포기해도 process()는 같은 빈 결과를 돌려주며 예외를 던지지 않습니다.
+    호출하는 쪽이 failed/error를 확인합니다.
+    factory()가 감쌀 추론 객체를 만들고, 그 객체의 warm_up(width, height)으로 첫 추론을 미리 실행합니다.
+    """
+
+    def __init__(self, factory, frame_size, startup=None):
+        self.factory = factory
+        self.frame_size = frame_size
+        self.startup = startup or NULL_STARTUP
+        self.inference = None
+        self._error = None
+        self._idle = False
+        self._loaded = threading.Event()
+        self._thread = threading.Thread(target=self._load, name='model-loader', daemon=True)
+        self._thread.start()
+
+    @property
+    def error(self):
+        """초기화 예외, 또는 감싼 추론 객체가 실행 중 포기한 이유 (ProcessInferencePool의 워커 실패). 없으면 None."""
+        if self._error is not None:
+            return self._error
+        if self.inference is not None and getattr(self.inference, 'failed', False):
+            return self.inference.error
+        return None
+
+    @property
+    def status(self):
+        """감싼 추론 객체의 마지막 상태 안내 (워커 재시작 등). 없으면 None."""
+        return getattr(self.inference, 'status', None)
+
+    @property
+    def ready(self):
+        return self._loaded.is_set() and self.error is None
+
+    @property
+    def failed(self):
+        """모델 초기화에 실패했거나, 실행 중 추론 객체가 포기했으면 True입니다. (이유는 error)"""
+        return self._loaded.is_set() and self.error is not None
+
+    def _load(self):
+        try:
+            with self.startup.measure('model init'):
+                inference = self.factory()
+            with self.startup.measure('warm-up'):
+                inference.warm_up(*self.frame_size)
+            inference.set_idle(self._idle)
+            self.inference = inference
+            self.startup.mark('models ready')
+        except Exception as exc:
+            self._error = exc
+        finally:
+            self._loaded.set()
+
+    def wait(self, timeout=None):
+        """모델이 준비될 때까지 기다립니다. 준비됐으면 True, 시간 초과나 초기화 실패면 False를 반환합니다."""
+        self._loaded.wait(timeout)
+        return self.ready
+
+    def process(self, frame):
+        """모델이 준비됐으면 감싼 객체로 추론하고, 아니면(로딩 중 또는 실패) 얼굴/손이 없는 InferenceResult를 반환합니다."""
+        if not self.ready:
+            return InferenceResult(frame, _NoFaceResults(), _empty_hand_data())
+        return self.inference.process(frame)
+
+    def set_idle(self, idle):
+        self._idle = idle
+        if self.inference is not None:
+            self.inference.set_idle(idle)
+
+    def close(self):
+        # 만드는 중인 모델도 닫을 수 있도록 로더가 끝날 때까지 기다림
+        self._thread.join()
+        if self.inference is not None:
+            self.inference.close()
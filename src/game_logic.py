@@ -3,80 +3,118 @@ import math
 import os
 import random
 import numpy as np
-
-
-class ParticleBurst:
-    def __init__(self, center_x, center_y, color, count=70):
-        self.particles = []
-        self.center_x = center_x
-        self.center_y = center_y
-        for _ in range(count):
-            velocity = (
-                random.uniform(-3.5, 3.5),
-                random.uniform(-4.5, -1.5)
-            )
-            life = random.randint(18, 35)
-            size = random.randint(3, 6)
-            self.particles.append({
-                'x': center_x + random.uniform(-10, 10),
-                'y': center_y + random.uniform(-10, 10),
-                'vx': velocity[0],
-                'vy': velocity[1],
-                'life': life,
-                'max_life': life,
-                'size': size,
-                'color': color
-            })
+from asset_bundle import ITEM_BASE_SIZE, item_size_for_frame, load_item_atlas
+from hud import HudTileCache
+from profiling import NULL_PROFILER
+from sprites import get_disc_atlas
+
+
+# 동시에 살아 있을 수 있는 버스트 파티클 수의 상한 (버스트당 70개)
+PARTICLE_BUDGET = 1024
+
+
+class ParticlePool:
+    """
+    보너스 폭발(버스트) 파티클을 고정 용량 NumPy 배열에 담는 풀입니다.
+    새 버스트는 빈 슬롯에 기록되고, 빈 슬롯이 모자라면 가장 오래된 버스트의 파티클부터 밀어냅니다.
+    모든 버스트가 한 번의 배열 연산으로 갱신되므로 버스트 수와 관계없이 메모리가 일정합니다.
+    """
+
+    def __init__(self, capacity=PARTICLE_BUDGET, rng=None):
+        self.capacity = capacity
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.max_life = np.ones(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.float32)
+        self.birth = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self._next_birth = 0
+
+    @property
+    def active_count(self):
+        return int(np.count_nonzero(self.alive))
+
+    def spawn_burst(self, center_x, center_y, color, count=70):
+        count = min(count, self.capacity)
+        free = np.flatnonzero(~self.alive)
+        shortage = count - len(free)
+        if shortage > 0:
+            # 예산 초과: 가장 먼저 생성된 파티클부터 제거
+            alive = np.flatnonzero(self.alive)
+            oldest = alive[np.argpartition(self.birth[alive], shortage - 1)[:shortage]]
+            self.alive[oldest] = False
+            free = np.flatnonzero(~self.alive)
+        slots = free[:count]
+
+        rng = self.rng
+        self.x[slots] = center_x + rng.uniform(-10, 10, count)
+        self.y[slots] = center_y + rng.uniform(-10, 10, count)
+        self.vx[slots] = rng.uniform(-3.5, 3.5, count)
+        self.vy[slots] = rng.uniform(-4.5, -1.5, count)
+        life = rng.integers(18, 36, count)
+        self.life[slots] = life
+        self.max_life[slots] = life
+        self.size[slots] = rng.integers(3, 7, count)
+        self.color[slots] = color
+        self.birth[slots] = self._next_birth
+        self.alive[slots] = True
+        self._next_birth += 1
 
     def update(self):
-        active = []
-        for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['vy'] += 0.25 # gravity
-            p['life'] -= 1
-            if p['life'] > 0:
-                active.append(p)
-        self.particles = active
+        alive = self.alive
+        np.add(self.x, self.vx, out=self.x, where=alive)
+        np.add(self.y, self.vy, out=self.y, where=alive)
+        np.add(self.vy, 0.25, out=self.vy, where=alive) # gravity
+        np.subtract(self.life, 1, out=self.life, where=alive)
+        alive &= self.life > 0
 
     def draw(self, frame):
-        for p in self.particles:
-            alpha = max(0.1, p['life'] / p['max_life'])
-            color = tuple(min(255, int(c * (0.6 + 0.4 * alpha))) for c in p['color'])
-            cv2.circle(frame, (int(p['x']), int(p['y'])), p['size'], color, -1, cv2.LINE_AA)
+        slots = np.flatnonzero(self.alive)
+        if len(slots) == 0:
+            return
+        # 오래된 버스트가 먼저 그려지도록 생성 순서로 정렬
+        slots = slots[np.argsort(self.birth[slots], kind='stable')]
+        alpha = np.maximum(0.1, self.life[slots] / self.max_life[slots])
+        colors = np.minimum(255, np.floor(self.color[slots] * (0.6 + 0.4 * alpha)[:, None]))
+        get_disc_atlas().blit_over(frame, self.x[slots].astype(np.int32), self.y[slots].astype(np.int32),
+                                   self.size[slots], colors)
 
-    def is_finished(self):
-        return len(self.particles) == 0
+    def clear(self):
+        self.alive[:] = False
 
 
 class ScreenParticleField:
-    def __init__(self, width, height, count=520):
+    """
+    화면 전체를 도는 배경 파티클 필드입니다.
+    파티클 속성은 구조체 배열(SoA) 형태의 NumPy 배열로 보관하고, 회전/물결/보간 계산을 배열 연산 한 번으로 처리합니다.
+    """
+
+    def __init__(self, width, height, count=520, rng=None):
         self.width = width
         self.height = height
         self.center_x = width / 2
         self.center_y = height / 2
-        self.particles = []
+        self.count = count
         self.intensity = 0.0
         self.color = (200, 200, 255)
 
+        rng = rng if rng is not None else np.random.default_rng()
         radius_limit = min(width, height) * 0.75
-        for _ in range(count):
-            radius = random.uniform(40, radius_limit)
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(0.003, 0.012)
-            size = random.uniform(2.0, 4.5)
-            x = self.center_x + math.cos(angle) * radius
-            y = self.center_y + math.sin(angle) * radius * 0.45
-            self.particles.append({
-                'radius': radius,
-                'angle': angle,
-                'speed': speed,
-                'size': size,
-                'x': x,
-                'y': y,
-                'phase': random.uniform(0, math.pi * 2),
-                'alpha': 0.3
-            })
+        self.radius = rng.uniform(40, radius_limit, count).astype(np.float32)
+        self.angle = rng.uniform(0, math.pi * 2, count).astype(np.float32)
+        self.speed = rng.uniform(0.003, 0.012, count).astype(np.float32)
+        self.size = rng.uniform(2.0, 4.5, count).astype(np.float32)
+        self.x = (self.center_x + np.cos(self.angle) * self.radius).astype(np.float32)
+        self.y = (self.center_y + np.sin(self.angle) * self.radius * 0.45).astype(np.float32)
+        self.phase = rng.uniform(0, math.pi * 2, count).astype(np.float32)
+        self.alpha = np.full(count, 0.3, dtype=np.float32)
+        # sin(angle + phase): 알파와 색 변화에 함께 쓰이므로 update에서 한 번만 계산
+        self.shimmer = np.sin(self.angle + self.phase)
 
     def update(self, factor, color):
         self.intensity = factor
@@ -84,36 +122,68 @@ class ScreenParticleField:
             self.color = color
 
         swirl = 0.7 + factor * 1.6
-        for p in self.particles:
-            p['angle'] += p['speed'] * swirl
-            wave = math.sin(p['phase'] + p['angle'] * 1.5)
-            radius = p['radius'] * (0.7 + factor * 1.3)
-            target_x = self.center_x + math.cos(p['angle']) * radius + wave * 30 * factor
-            target_y = self.center_y + math.sin(p['angle']) * radius * 0.55 + math.cos(p['angle'] * 2) * 35 * factor
-            p['x'] += (target_x - p['x']) * 0.1
-            p['y'] += (target_y - p['y']) * 0.1
-            p['alpha'] = 0.2 + 0.7 * factor + 0.1 * math.sin(p['angle'] + p['phase'])
+        self.angle += self.speed * swirl
+        angle = self.angle
+        wave = np.sin(self.phase + angle * 1.5)
+        radius = self.radius * (0.7 + factor * 1.3)
+        target_x = self.center_x + np.cos(angle) * radius + wave * (30 * factor)
+        target_y = self.center_y + np.sin(angle) * radius * 0.55 + np.cos(angle * 2) * (35 * factor)
+        self.x += (target_x - self.x) * 0.1
+        self.y += (target_y - self.y) * 0.1
+        self.shimmer = np.sin(angle + self.phase)
+        self.alpha = 0.2 + 0.7 * factor + 0.1 * self.shimmer
 
     def draw(self, frame):
-        overlay = np.zeros_like(frame)
-        base_color = np.array(self.color, dtype=np.float32)
-        for p in self.particles:
-            size = max(1, int(p['size'] * (1 + self.intensity * 1.9)))
-            color_shift = 35 * math.sin(p['angle'] + p['phase'])
-            color = tuple(int(np.clip(c + color_shift, 0, 255)) for c in base_color)
-            cv2.circle(overlay, (int(p['x']), int(p['y'])), size, color, -1, cv2.LINE_AA)
+        sizes = np.maximum(1, (self.size * (1 + self.intensity * 1.9)).astype(np.int32))
+        # 색상은 (N, 3) 배열로 한 번에 계산
+        colors = np.clip(np.array(self.color, dtype=np.float32)[None, :] + 35 * self.shimmer[:, None], 0, 255)
+        colors = np.floor(colors)
 
+        # 오버레이 위 원 그리기 + addWeighted(alpha, 1.0)와 같은 가산 합성을 아틀라스로 처리
         alpha = min(0.65, 0.25 + self.intensity * 0.5)
-        cv2.addWeighted(overlay, alpha, frame, 1.0, 0, dst=frame)
+        get_disc_atlas().blit_additive(frame, self.x.astype(np.int32), self.y.astype(np.int32), sizes, colors, alpha)
+
+
+class SolidBlendCache:
+    """
+    화면 전체/일부를 단색 쪽으로 섞는 합성(딤, 피격 플래시, 메뉴 색조)의 변환 행렬 캐시입니다. 프레임 크기 레이어는 만들지 않습니다.
+    (color, alpha)마다 채널별 배율과 오프셋을 담은 3x4 행렬을 한 번 만들어 두고,
+    cv2.transform으로 target = target * (1 - alpha) + color * alpha를 제자리에서 한 번에 계산합니다.
+    """
+
+    def __init__(self, max_matrices=16):
+        self.max_matrices = max_matrices
+        self._matrices = {}
+
+    def blend_matrix(self, color, alpha, channels=3):
+        """color 쪽으로 alpha만큼 섞는 (channels, channels + 1) 변환 행렬을 반환합니다."""
+        key = (tuple(int(c) for c in color[:channels]), float(alpha), channels)
+        matrix = self._matrices.get(key)
+        if matrix is None:
+            if len(self._matrices) >= self.max_matrices:
+                # 가장 먼저 만든 행렬(예: 이전 딤 색상)부터 버림
+                self._matrices.pop(next(iter(self._matrices)))
+            matrix = np.zeros((channels, channels + 1), dtype=np.float64)
+            matrix[:, :channels] = np.eye(channels) * (1 - alpha)
+            matrix[:, channels] = np.array(key[0], dtype=np.float64) * alpha
+            self._matrices[key] = matrix
+        return matrix
+
+    def blend_solid(self, target, color, alpha):
+        """target을 color 쪽으로 alpha만큼 제자리(in-place)에서 섞습니다. target은 프레임의 일부 영역이어도 됩니다."""
+        if alpha <= 0:
+            return
+        cv2.transform(target, self.blend_matrix(color, alpha, target.shape[2]), dst=target)
+
 
 # 게임 객체의 기본 속성을 정의하는 클래스
 class GameObject:
-    def __init__(self, x, y, speed, type):
+    def __init__(self, x, y, speed, type, size=ITEM_BASE_SIZE):
         self.x = x
         self.y = y
         self.speed = speed
         self.type = type
-        self.size = 120 # C35: 크기 증가 반영 (80)
+        self.size = size # C35: 크기 증가 반영 (80 → 720p 기준 120, 해상도별 단계는 item_size_for_frame)
         self.active = True
 
     def move(self, height):
@@ -124,13 +194,418 @@ class GameObject:
             return True 
         return False
 
+# 객체 저장소의 초기 슬롯 수 (모자라면 두 배씩 늘림)
+OBJECT_STORE_CAPACITY = 64
+# 비활성 슬롯이 이보다 많고 활성 객체 수 이상이 되면 배열을 압축
+OBJECT_COMPACT_MIN_DEAD = 32
+# 객체가 이보다 많을 때만 y 정렬 인덱스로 충돌 후보를 좁힘 (적을 때는 전체 배열 연산 한 번이 더 쌈, bench_collision.py 기준)
+OVERLAP_INDEX_MIN_OBJECTS = 1024
+# 인덱스를 만든 뒤 객체 간 속도 차로 y 순서가 이만큼(px) 어긋날 수 있게 되면 다시 정렬
+OVERLAP_INDEX_MAX_DRIFT = 120
+
+
+class GameObjectView:
+    """
+    GameObjectStore의 한 슬롯을 GameObject처럼 읽고 쓰게 해 주는 얇은 뷰입니다.
+    슬롯 번호를 직접 가리키므로 다음 압축(update) 전까지만 유효합니다.
+    """
+    __slots__ = ('_store', 'slot')
+
+    def __init__(self, store, slot):
+        self._store = store
+        self.slot = slot
+
+    @property
+    def x(self):
+        return float(self._store.x[self.slot])
+
+    @x.setter
+    def x(self, value):
+        self._store.x[self.slot] = value
+        self._store.invalidate_index()
+
+    @property
+    def y(self):
+        return float(self._store.y[self.slot])
+
+    @y.setter
+    def y(self, value):
+        self._store.y[self.slot] = value
+        self._store.invalidate_index()
+
+    @property
+    def speed(self):
+        return float(self._store.speed[self.slot])
+
+    @speed.setter
+    def speed(self, value):
+        self._store.speed[self.slot] = value
+        self._store.invalidate_index()
+
+    @property
+    def size(self):
+        return int(self._store.size[self.slot])
+
+    @property
+    def type(self):
+        return self._store.type_names[self._store.type_id[self.slot]]
+
+    @property
+    def active(self):
+        return bool(self._store.active[self.slot])
+
+    @active.setter
+    def active(self, value):
+        self._store.active[self.slot] = value
+
+    @property
+    def seq(self):
+        return int(self._store.seq[self.slot])
+
+    def move(self, height):
+        """GameObject.move와 같은 단일 객체 이동입니다. (호환용)"""
+        self.y += self.speed
+        return self.y > height + self.size
+
+
+class GameObjectStore:
+    """
+    떨어지는 객체를 열(type_id, x, y, speed, size, active, seq)별 NumPy 배열에 담는 SoA 저장소입니다.
+    prev_y는 직전 틱의 y로, 고정 틱 사이 렌더링 보간에 사용합니다.
+    슬롯은 생성 순서대로 채워지고 압축해도 순서가 유지되므로, 슬롯 번호가 작을수록 먼저 생성된 객체입니다.
+    이동, 화면 밖 판정, 충돌 판정이 객체 수와 관계없이 배열 연산 몇 번으로 끝나며,
+    비활성 슬롯은 바로 지우지 않고 충분히 쌓였을 때 한 번에 압축합니다.
+    """
+
+    def __init__(self, type_names=(), capacity=OBJECT_STORE_CAPACITY):
+        self.type_names = list(type_names)
+        self.type_ids = {name: idx for idx, name in enumerate(self.type_names)}
+        self.count = 0
+        self._next_seq = 0
+        # find_overlaps()가 재사용하는 (입 수, 용량) 작업 배열 (큰 임시 배열을 틱마다 새로 할당하지 않도록)
+        self._overlap_scratch = None
+        # 충돌 후보를 좁히는 y 정렬 인덱스 (_build_index 참고). None이면 다음 질의 때 다시 만듦
+        self._index_slots = None
+        self._index_y = None
+        self._index_count = 0
+        self._index_ticks = 0
+        self._index_speed = (0.0, 0.0)
+        self._index_size = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.type_id = np.zeros(capacity, dtype=np.int16)
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.prev_y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.seq = np.zeros(capacity, dtype=np.int64)
+
+    def _columns(self):
+        return (self.type_id, self.x, self.y, self.prev_y, self.speed, self.size, self.active, self.seq)
+
+    def _grow(self):
+        old_columns = self._columns()
+        self._allocate(self.capacity * 2)
+        for old, new in zip(old_columns, self._columns()):
+            new[:self.count] = old[:self.count]
+
+    def type_id_of(self, name):
+        type_id = self.type_ids.get(name)
+        if type_id is None:
+            type_id = len(self.type_names)
+            self.type_names.append(name)
+            self.type_ids[name] = type_id
+        return type_id
+
+    def append(self, x, y, speed, type, size):
+        """새 객체를 마지막 슬롯에 기록하고 뷰를 반환합니다."""
+        if self.count == self.capacity:
+            self._grow()
+        slot = self.count
+        self.type_id[slot] = self.type_id_of(type)
+        self.x[slot] = x
+        self.y[slot] = y
+        self.prev_y[slot] = y
+        self.speed[slot] = speed
+        self.size[slot] = size
+        self.active[slot] = True
+        self.seq[slot] = self._next_seq
+        self._next_seq += 1
+        self.count += 1
+        self._maintain_index()
+        return GameObjectView(self, slot)
+
+    def advance(self, height):
+        """
+        모든 활성 객체를 speed만큼 내리고, 화면 아래로 벗어난 객체를 비활성화합니다.
+        이번에 벗어난 객체의 슬롯 번호 배열을 반환합니다.
+        """
+        n = self.count
+        y = self.y[:n]
+        active = self.active[:n]
+        self.prev_y[:n] = y
+        np.add(y, self.speed[:n], out=y, where=active)
+        self._index_ticks += 1
+        off_screen = np.flatnonzero(active & (y > height + self.size[:n]))
+        active[off_screen] = False
+        self._maintain_index()
+        return off_screen
+
+    def hold(self):
+        """이번 틱에 움직이지 않은 객체가 보간 렌더링에서 흔들리지 않도록 prev_y를 현재 위치로 맞춥니다."""
+        self.prev_y[:self.count] = self.y[:self.count]
+
+    def interpolated_y(self, slots, alpha):
+        """직전 틱과 현재 틱 사이 alpha(0..1) 지점의 y를 반환합니다."""
+        prev_y = self.prev_y[slots]
+        return prev_y + (self.y[slots] - prev_y) * alpha
+
+    def invalidate_index(self):
+        self._index_slots = None
+
+    def _maintain_index(self):
+        """
+        이동(advance)과 생성(append) 때마다 y 정렬 인덱스를 갱신합니다.
+        이동은 틱 수만 세고(질의 창을 넓힘), 새 객체는 인덱스 뒤쪽 슬롯 범위로 함께 확인하며,
+        어긋남이나 뒤쪽 슬롯이 한도를 넘을 때만 다시 정렬합니다. 객체가 적으면 인덱스를 두지 않습니다.
+        """
+        if self.count < OVERLAP_INDEX_MIN_OBJECTS:
+            self._index_slots = None
+        elif self._index_stale():
+            self._build_index()
+
+    def _build_index(self):
+        """
+        활성 슬롯을 y 순으로 정렬해 둡니다. 객체는 틱마다 자기 speed만큼만 내려가므로
+        인덱스를 만든 뒤 t틱이 지나도 현재 y는 (만들 때 y + 최소 속도 * t) ~ (만들 때 y + 최대 속도 * t) 안에 있고,
+        질의는 이 범위만큼 넓힌 창을 searchsorted로 찾습니다. 속도 차로 창이 OVERLAP_INDEX_MAX_DRIFT보다 넓어지면 다시 만듭니다.
+        """
+        n = self.count
+        slots = np.flatnonzero(self.active[:n])
+        ys = self.y[slots]
+        order = np.argsort(ys, kind='stable')
+        self._index_slots = slots[order]
+        self._index_y = ys[order]
+        self._index_count = n
+        self._index_ticks = 0
+        speeds = self.speed[slots]
+        self._index_speed = (float(speeds.min()), float(speeds.max())) if len(slots) else (0.0, 0.0)
+        self._index_size = int(self.size[slots].max()) if len(slots) else 0
+
+    def _index_stale(self):
+        if self._index_slots is None:
+            return True
+        min_speed, max_speed = self._index_speed
+        if (max_speed - min_speed) * self._index_ticks > OVERLAP_INDEX_MAX_DRIFT:
+            return True
+        # 인덱스 이후 추가된 슬롯은 따로 전부 확인하므로 너무 많이 쌓이면 다시 만듦
+        return self.count - self._index_count > max(OVERLAP_INDEX_MIN_OBJECTS, self._index_count // 8)
+
+    def _indexed_hits(self, x, y):
+        """y 정렬 인덱스로 (x, y) 주변 후보만 확인해 겹치는 활성 슬롯들을 반환합니다. (순서 없음)"""
+        if self._index_slots is None:
+            # 압축 직후나 뷰로 위치를 직접 바꾼 뒤에는 다음 틱 전에 질의가 올 수 있음
+            self._build_index()
+        min_speed, max_speed = self._index_speed
+        ticks = self._index_ticks
+        # 누적 덧셈 반올림 오차에 대비해 1px 여유를 둠
+        reach = self._index_size + 1
+        start = self._index_y.searchsorted(y - reach - max_speed * ticks)
+        end = self._index_y.searchsorted(y + reach - min_speed * ticks)
+        candidates = self._index_slots[start:end]
+        if self._index_count < self.count:
+            # 인덱스를 만든 뒤 추가된 슬롯
+            candidates = np.concatenate([candidates, np.arange(self._index_count, self.count)])
+        size = self.size[candidates]
+        hits = np.abs(self.y[candidates] - y) < size
+        hits &= np.abs(self.x[candidates] - x) < size
+        hits &= self.active[candidates]
+        return candidates[hits]
+
+    def find_overlap(self, x, y):
+        """(x, y)와 겹치는 활성 객체 중 가장 먼저 생성된 객체의 슬롯을 반환합니다. (없으면 -1)"""
+        n = self.count
+        if n >= OVERLAP_INDEX_MIN_OBJECTS:
+            hits = self._indexed_hits(x, y)
+            return int(hits.min()) if len(hits) else -1
+        size = self.size[:n]
+        hits = self.active[:n] & (np.abs(self.y[:n] - y) < size) & (np.abs(self.x[:n] - x) < size)
+        slot = int(hits.argmax()) if n else 0
+        return slot if n and hits[slot] else -1
+
+    def find_overlaps(self, xs, ys):
+        """
+        입 여러 개를 판정해 입마다 겹치는 가장 먼저 생성된 슬롯을 반환합니다.
+        객체가 많으면 입마다 y 정렬 인덱스로 주변 후보만 확인하고, 적으면 한 번의 (입 수, 객체 수) 배열 연산으로 판정합니다.
+        한 객체는 앞 순서의 입 하나만 가져가며, 겹치는 객체가 없는 입은 -1입니다.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        slots = np.full(len(xs), -1, dtype=np.intp)
+        n = self.count
+        if n == 0 or len(xs) == 0:
+            return slots
+        if n >= OVERLAP_INDEX_MIN_OBJECTS:
+            claimed = set()
+            for mouth, (x, y) in enumerate(zip(xs.tolist(), ys.tolist())):
+                free = [slot for slot in self._indexed_hits(x, y).tolist() if slot not in claimed]
+                if free:
+                    slots[mouth] = min(free)
+                    claimed.add(slots[mouth])
+            return slots
+        scratch = self._overlap_scratch
+        if scratch is None or scratch[0].shape[0] < len(xs) or scratch[0].shape[1] < n:
+            shape = (len(xs), self.capacity)
+            scratch = self._overlap_scratch = (np.empty(shape), np.empty(shape, dtype=bool), np.empty(shape, dtype=bool))
+        distance, hits, near = (buffer[:len(xs), :n] for buffer in scratch)
+        size = self.size[:n]
+        np.subtract(self.y[:n], ys[:, None], out=distance)
+        np.abs(distance, out=distance)
+        np.less(distance, size, out=hits)
+        np.subtract(self.x[:n], xs[:, None], out=distance)
+        np.abs(distance, out=distance)
+        np.less(distance, size, out=near)
+        hits &= near
+        hits &= self.active[:n]
+        for mouth, row in enumerate(hits):
+            slot = int(row.argmax())
+            if row[slot]:
+                slots[mouth] = slot
+                # 같은 객체를 뒤 순서의 입이 다시 가져가지 않도록 열을 지움
+                hits[:, slot] = False
+        return slots
+
+    def active_slots(self):
+        return np.flatnonzero(self.active[:self.count])
+
+    def maybe_compact(self):
+        """비활성 슬롯이 활성 객체 수 이상으로 쌓였을 때만 압축합니다. (분할 상환 O(1))"""
+        live = int(np.count_nonzero(self.active[:self.count]))
+        dead = self.count - live
+        if dead >= OBJECT_COMPACT_MIN_DEAD and dead >= live:
+            self.compact()
+
+    def compact(self):
+        keep = self.active_slots()
+        for column in self._columns():
+            column[:len(keep)] = column[keep]
+        self.count = len(keep)
+        self.invalidate_index()
+
+    def clear(self):
+        self.active[:self.count] = False
+        self.count = 0
+        self.invalidate_index()
+
+    def view(self, slot):
+        return GameObjectView(self, slot)
+
+    def __iter__(self):
+        """활성 객체를 생성 순서대로 뷰로 돌려줍니다."""
+        for slot in self.active_slots().tolist():
+            yield GameObjectView(self, slot)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.active[:self.count]))
+
+
 # 게임 관리 클래스
+# 이전 프레임 입 위치와 이 거리(화면 너비 대비) 안에 있는 얼굴만 같은 플레이어로 이어 붙임
+PLAYER_MATCH_DISTANCE = 0.25
+# 플레이어별 HUD/입 표시 색상 (BGR)
+PLAYER_COLORS = [(40, 220, 255), (255, 170, 60), (120, 255, 120), (255, 120, 255), (80, 120, 255), (255, 255, 120)]
+
+
+class Player:
+    """멀티플레이어 모드의 플레이어 한 명의 점수, 라이프, 수집 현황과 마지막 입 위치입니다."""
+
+    def __init__(self, player_id, max_lives, collectible_types):
+        self.player_id = player_id
+        self.color = PLAYER_COLORS[player_id % len(PLAYER_COLORS)]
+        self.collection_counts = {item_type: 0 for item_type in collectible_types}
+        self.reset(max_lives)
+
+    def reset(self, max_lives):
+        self.score = 0
+        self.max_lives = max_lives
+        self.lives = max_lives
+        for item_type in self.collection_counts:
+            self.collection_counts[item_type] = 0
+        self.present = False
+        # 얼굴이 한 번이라도 이 번호에 배정됐는지 (1번 플레이어는 항상 참여). 참여 전인 번호는 라이프/보너스/합계에서 빠짐
+        self.joined = self.player_id == 0
+        self.mouth_x = None
+        self.mouth_y = None
+        self.mouth_open = False
+
+    @property
+    def alive(self):
+        return self.lives > 0
+
+    @property
+    def label(self):
+        return f"P{self.player_id + 1}"
+
+
+class PlayerTracker:
+    """
+    검출된 얼굴(입 위치)마다 프레임이 바뀌어도 같은 플레이어 번호를 붙입니다.
+    이전 위치와 가까운 쌍부터 greedy로 짝짓고, 짝이 없는 얼굴은 한 번도 쓰이지 않은 번호부터 받습니다.
+    """
+
+    def __init__(self, max_players, max_distance):
+        self.max_players = max_players
+        self.max_distance = max_distance
+        self.centers = [None] * max_players
+
+    def reset(self):
+        self.centers = [None] * self.max_players
+
+    def assign(self, points):
+        """points: [(x, y), ...] (픽셀). 같은 순서로 플레이어 번호 목록을 반환합니다. (번호가 모자라면 None)"""
+        ids = [None] * len(points)
+        known = [pid for pid, center in enumerate(self.centers) if center is not None]
+        if points and known:
+            current = np.asarray(points, dtype=np.float64)
+            previous = np.asarray([self.centers[pid] for pid in known], dtype=np.float64)
+            distance = np.linalg.norm(current[:, None, :] - previous[None, :, :], axis=2)
+            for flat in np.argsort(distance, axis=None):
+                face, prev = divmod(int(flat), len(known))
+                if distance[face, prev] > self.max_distance:
+                    break
+                if ids[face] is None and known[prev] not in ids:
+                    ids[face] = known[prev]
+        free = sorted((pid for pid in range(self.max_players) if pid not in ids),
+                      key=lambda pid: self.centers[pid] is not None)
+        for face, pid in enumerate(ids):
+            if pid is None and free:
+                ids[face] = free.pop(0)
+        for face, pid in enumerate(ids):
+            if pid is not None:
+                self.centers[pid] = tuple(points[face])
+        return ids
+
+
 class ChristmasGame:
-    def __init__(self, width, height):
+    def __init__(self, width, height, particle_budget=PARTICLE_BUDGET, seed=None, render=True, profiler=None,
+                 max_players=1):
+        """
+        seed: 게임 인스턴스 전용 난수 시드 (None이면 매번 다름). 같은 시드와 입력이면 같은 게임이 재현됩니다.
+        render: False면 에셋 로드, 배경/버스트 파티클, 그리기를 모두 건너뛰는 헤드리스 모드입니다.
+        profiler: draw() 단계별 시간을 기록할 profiling.FrameProfiler (None이면 계측하지 않음)
+        max_players: 2 이상이면 얼굴마다 점수/라이프/수집 현황을 따로 갖는 멀티플레이어 모드
+        """
         self.width = width
         self.height = height
-        self.score = 0
-        self.objects = []
+        self.seed = seed
+        self.render = render
+        self.profiler = profiler or NULL_PROFILER
+        self.rng = random.Random(seed)
+        np_rng = np.random.default_rng(seed)
         self.spawn_timer = 0
         self.base_spawn_rate = 50 
         self.spawn_rate = self.base_spawn_rate 
@@ -140,16 +615,15 @@ class ChristmasGame:
         self.level = 1
         self.score_to_next_level = 100 
         
-        # C32: 라이프 및 상태 변수
+        # C32: 라이프 및 상태 변수 (플레이어별 라이프는 Player에 있음)
         self.max_lives = 3
-        self.lives = self.max_lives
         self.game_over = False
         self.paused = False 
 
         # 📌 C40: 피드백 메시지 변수 추가
         self.feedback_text = ""
         self.feedback_color = (0, 0, 0) # BGR
-        self.max_feedback_time = 30 # 30프레임 (약 0.5초) 동안 표시
+        self.max_feedback_time = 30 # 30틱 (0.5초) 동안 표시
         self.feedback_timer = 0
 
         # 라이프 감소 시 화면 플래시 관련 변수
@@ -157,7 +631,15 @@ class ChristmasGame:
         self.damage_flash_timer = 0
         self.damage_flash_color = (0, 0, 255)
 
-        obj_size = GameObject(0, 0, 0, '').size 
+        # 배경 딤 색상과 단색 섞기 변환 행렬 캐시
+        self.dim_color = (30, 10, 40)
+        self.solid_blend = SolidBlendCache()
+        # 점수/하트/문구처럼 가끔만 바뀌는 HUD 요소의 타일 캐시
+        self.hud_tiles = HudTileCache()
+
+        # 아이템 크기는 프레임 높이에 맞는 크기 단계 (720p에서 120px)
+        obj_size = item_size_for_frame(height)
+        self.object_size = obj_size
 
         # 아이템 정의 및 이미지 로드 설정
         self.asset_dir = os.path.join(os.path.dirname(__file__), 'assets')
@@ -204,16 +686,24 @@ class ChristmasGame:
             }
         }
 
+        # 아이템 이미지는 크기 단계별로 미리 축소/알파 곱셈해 둔 공유 아틀라스(asset_bundle)에서 가져옴
+        self.item_atlas = None
         self.item_images = {}
-        for item_type, props in self.item_properties.items():
-            asset_path = os.path.join(self.asset_dir, props['asset']) if props.get('asset') else None
-            self.item_images[item_type] = self._load_item_image(asset_path, obj_size, props.get('fallback_color', (255, 255, 255)))
+        if render:
+            self.item_atlas = self._load_item_atlas(obj_size)
+            self.item_images = dict(self.item_atlas.sprites)
 
         self.collectible_types = [key for key, props in self.item_properties.items() if props.get('category') == 'collectible']
-        self.collection_counts = {item_type: 0 for item_type in self.collectible_types}
 
-        self.particle_effects = []
-        self.sky_particles = ScreenParticleField(width, height)
+        # 떨어지는 객체는 열 단위 배열 저장소에 보관 (iter/len은 활성 객체 기준)
+        self.objects = GameObjectStore(self.item_properties)
+        self._collectible_by_type = np.zeros(0, dtype=bool)
+        # 점수/라이프/수집 현황은 플레이어별로 관리 (score, lives, collection_counts는 전체 합계)
+        self.players = [Player(pid, self.max_lives, self.collectible_types) for pid in range(max(1, max_players))]
+        self.player_tracker = PlayerTracker(len(self.players), width * PLAYER_MATCH_DISTANCE)
+
+        self.particle_effects = ParticlePool(particle_budget, rng=np_rng)
+        self.sky_particles = ScreenParticleField(width, height, rng=np_rng) if render else None
         self.gesture_overlay_target = 0.0
         self.gesture_overlay_factor = 0.0
         self.gesture_overlay_color = (200, 200, 255)
@@ -246,26 +736,51 @@ class ChristmasGame:
         self.score_multiplier = 1.0
         self.start_new_run(self.current_difficulty)
         
+    @property
+    def multiplayer(self):
+        return len(self.players) > 1
+
+    @property
+    def joined_players(self):
+        """얼굴이 한 번이라도 배정된 플레이어 목록 (1번 플레이어 포함)."""
+        return [player for player in self.players if player.joined]
+
+    @property
+    def score(self):
+        """참여한 플레이어 점수의 합. 레벨업과 최종 점수의 기준입니다."""
+        return sum(player.score for player in self.joined_players)
+
+    @property
+    def lives(self):
+        return sum(player.lives for player in self.joined_players)
+
+    @property
+    def collection_counts(self):
+        totals = dict.fromkeys(self.collectible_types, 0)
+        for player in self.joined_players:
+            for item_type, count in player.collection_counts.items():
+                totals[item_type] += count
+        return totals
+
     def reset_game(self):
         """C34: 게임 상태를 초기화하고 재시작합니다."""
-        self.score = 0
-        self.objects = []
+        self.objects.clear()
         self.spawn_timer = 0
         self.spawn_rate = self.base_spawn_rate
         self.level = 1
         self.score_to_next_level = 100
         settings = self.difficulty_settings.get(self.current_difficulty, self.difficulty_settings['normal'])
         self.max_lives = settings['max_lives']
-        self.lives = self.max_lives
+        for player in self.players:
+            player.reset(self.max_lives)
+        self.player_tracker.reset()
         self.game_over = False
         self.paused = False
         self.feedback_timer = 0 # C40
         self.damage_flash_timer = 0
-        self.particle_effects = []
+        self.particle_effects.clear()
         self.gesture_overlay_target = 0.0
         self.gesture_overlay_factor = 0.0
-        for item in self.collectible_types:
-            self.collection_counts[item] = 0
 
     def _check_level_up(self):
         """C30: 레벨을 올리고 난이도를 조절합니다."""
@@ -280,43 +795,82 @@ class ChristmasGame:
 
 
     def check_collection(self, is_mouth_open, mouth_x, mouth_y):
-        """C32, C40: 입 벌림 상태와 입의 위치를 기준으로 객체와의 충돌을 확인하고 점수를 업데이트합니다."""
+        """C32, C40: 1번 플레이어의 입 위치와 벌림 상태로 객체와의 충돌을 확인하고 점수를 업데이트합니다."""
+        player = self.players[0]
+        player.present = True
+        player.mouth_x = mouth_x
+        player.mouth_y = mouth_y
+        player.mouth_open = is_mouth_open
+        self.check_players()
+
+    def update_players(self, mouths):
+        """
+        이번 프레임에 검출된 입 목록 [(x, y, is_open), ...]에 플레이어 번호를 붙여 각 플레이어의 입 상태를 갱신합니다.
+        검출되지 않은 플레이어는 다음 update_players() 전까지 충돌 판정에서 빠집니다. 배정된 번호 목록을 반환합니다.
+        """
+        for player in self.players:
+            player.present = False
+        ids = self.player_tracker.assign([(x, y) for x, y, _ in mouths])
+        for pid, (x, y, is_open) in zip(ids, mouths):
+            if pid is None:
+                continue
+            player = self.players[pid]
+            player.present = True
+            player.joined = True
+            player.mouth_x = x
+            player.mouth_y = y
+            player.mouth_open = is_open
+        return ids
+
+    def check_players(self):
+        """검출된 모든 플레이어의 입과 모든 객체의 충돌을 한 번의 배열 연산으로 판정합니다. (틱마다 호출)"""
         if self.game_over:
             return
+        players = [player for player in self.players if player.present and player.alive]
+        if not players:
+            return
+        if len(players) == 1:
+            # 한 명이면 (입 수, 객체 수) 작업 배열 없이 단일 질의로 충분
+            slots = [self.objects.find_overlap(players[0].mouth_x, players[0].mouth_y)]
+        else:
+            slots = self.objects.find_overlaps([player.mouth_x for player in players],
+                                               [player.mouth_y for player in players]).tolist()
+        for player, slot in zip(players, slots):
+            if slot >= 0:
+                self._collect(player, self.objects.view(slot))
+
+    def _collect(self, player, obj):
+        obj.active = False
+        props = self.item_properties.get(obj.type, {})
+        category = props.get('category', 'collectible')
+        display_name = props.get('display_name', obj.type.title())
+        prefix = f"{player.label} " if self.multiplayer else ""
+
+        if category == 'collectible':
+            if player.mouth_open:
+                score_gain = int(props.get('score', 10) * self.score_multiplier)
+                player.score += score_gain
+                self._apply_feedback(f"{prefix}{display_name}! (+{score_gain})", (0, 255, 0))
+                if obj.type in player.collection_counts:
+                    player.collection_counts[obj.type] += 1
+            else:
+                self._apply_feedback(f"{prefix}MOUTH CLOSED! Missed {display_name}", (0, 165, 255))
+                self._lose_life(flash_color=(0, 165, 255), player=player)
+        else:
+            penalty = props.get('penalty', 1)
+            self._apply_feedback(f"{prefix}{display_name}! (-{penalty} Life)", (0, 0, 255))
+            self._lose_life(penalty, flash_color=(0, 0, 255), player=player)
 
-        for obj in self.objects:
-            if not obj.active:
-                continue
-
-            distance_y = abs(mouth_y - obj.y)
-            distance_x = abs(mouth_x - obj.x)
-
-            if distance_y < obj.size and distance_x < obj.size:
-                obj.active = False
-                props = self.item_properties.get(obj.type, {})
-                category = props.get('category', 'collectible')
-                display_name = props.get('display_name', obj.type.title())
-
-                if category == 'collectible':
-                    if is_mouth_open:
-                        score_gain = int(props.get('score', 10) * self.score_multiplier)
-                        self.score += score_gain
-                        self._apply_feedback(f"{display_name}! (+{score_gain})", (0, 255, 0))
-                        if obj.type in self.collection_counts:
-                            self.collection_counts[obj.type] += 1
-                    else:
-                        self._apply_feedback(f"MOUTH CLOSED! Missed {display_name}", (0, 165, 255))
-                        self._lose_life(flash_color=(0, 165, 255))
-                else:
-                    penalty = props.get('penalty', 1)
-                    self._apply_feedback(f"{display_name}! (-{penalty} Life)", (0, 0, 255))
-                    self._lose_life(penalty, flash_color=(0, 0, 255))
-                break 
+    def _find_collision(self, mouth_x, mouth_y):
+        """입 위치와 겹치는 활성 객체 중 가장 먼저 생성된 객체를 반환합니다. (없으면 None)"""
+        slot = self.objects.find_overlap(mouth_x, mouth_y)
+        return self.objects.view(slot) if slot >= 0 else None
 
     def update(self):
-        """게임 로직 업데이트 (객체 이동, 제거, 레벨 체크)"""
+        """게임 로직을 고정 틱 하나만큼 진행합니다 (객체 이동, 제거, 레벨 체크). 타이머와 속도는 모두 틱 단위입니다."""
         self.gesture_overlay_factor += (self.gesture_overlay_target - self.gesture_overlay_factor) * 0.08
-        self.sky_particles.update(self.gesture_overlay_factor, self.gesture_overlay_color)
+        if self.render:
+            self.sky_particles.update(self.gesture_overlay_factor, self.gesture_overlay_color)
 
         if self.feedback_timer > 0:
             self.feedback_timer -= 1
@@ -324,31 +878,25 @@ class ChristmasGame:
         if self.damage_flash_timer > 0:
             self.damage_flash_timer -= 1
 
-        self._update_particle_effects()
+        if self.render:
+            self._update_particle_effects()
 
         if self.game_over or self.paused: 
+            self.objects.hold()
             return
             
         self._check_level_up() 
         
-        # 객체 이동 및 화면 밖 객체 체크
-        objects_to_keep = []
-        for obj in self.objects:
-            is_off_screen = obj.move(self.height)
-            
-            if is_off_screen and obj.active:
-                props = self.item_properties.get(obj.type, {})
-                if props.get('category') == 'collectible':
-                    display_name = props.get('display_name', obj.type.title())
-                    self._apply_feedback(f"Missed {display_name}!", (0, 165, 255))
-                    self._lose_life(flash_color=(0, 165, 255))
-
-                obj.active = False
-            
-            if obj.active:
-                objects_to_keep.append(obj)
-                
-        self.objects = objects_to_keep
+        # 객체 이동 및 화면 밖 객체 체크 (배열 연산 한 번)
+        off_screen = self.objects.advance(self.height)
+        if len(off_screen):
+            # 수집되지 않고 화면 밖으로 나간 수집 아이템은 개수만큼 라이프 감소
+            missed = off_screen[self._collectible_mask()[self.objects.type_id[off_screen]]]
+            if len(missed):
+                props = self.item_properties[self.objects.view(int(missed[-1])).type]
+                self._apply_feedback(f"Missed {props['display_name']}!", (0, 165, 255))
+                self._charge_misses(self.objects.x[missed])
+        self.objects.maybe_compact()
         
         self.spawn_timer += 1
         if self.spawn_timer >= self.spawn_rate: 
@@ -357,79 +905,113 @@ class ChristmasGame:
         
         return len(self.objects)
 
+    def _charge_misses(self, missed_x):
+        """놓친 아이템마다 떨어진 x 위치와 마지막 입 위치가 가장 가까운 참여 중인 살아 있는 플레이어의 라이프를 줄입니다."""
+        alive = [player for player in self.joined_players if player.alive]
+        if len(alive) == 1:
+            self._lose_life(len(missed_x), flash_color=(0, 165, 255), player=alive[0])
+            return
+        mouth_x = np.array([self.width / 2 if player.mouth_x is None else player.mouth_x for player in alive])
+        nearest = np.abs(missed_x[:, None] - mouth_x[None, :]).argmin(axis=1)
+        for idx, count in enumerate(np.bincount(nearest, minlength=len(alive)).tolist()):
+            if count:
+                self._lose_life(count, flash_color=(0, 165, 255), player=alive[idx])
+
     def spawn_object(self):
         """새로운 선물 또는 장애물을 무작위로 생성합니다."""
         
-        x = random.randint(50, self.width - 50)
+        x = self.rng.randint(50, self.width - 50)
         y = -50 
         variance_min, variance_max = self.speed_variance
         level_bonus = min(self.level * 0.15, 2.5)
-        speed = self.base_speed + random.uniform(variance_min, variance_max) + random.uniform(0, level_bonus)
+        speed = self.base_speed + self.rng.uniform(variance_min, variance_max) + self.rng.uniform(0, level_bonus)
         obj_type = self._choose_spawn_type()
         
-        new_obj = GameObject(x, y, speed, obj_type)
-        self.objects.append(new_obj)
+        new_obj = GameObject(x, y, speed, obj_type, self.object_size)
+        self.add_object(new_obj)
+
+    def add_object(self, obj):
+        """GameObject를 객체 저장소에 등록하고 저장소 뷰를 반환합니다."""
+        return self.objects.append(obj.x, obj.y, obj.speed, obj.type, obj.size)
+
+    def _collectible_mask(self):
+        """type_id로 인덱싱하는 '수집 아이템 여부' 배열입니다. 새 타입이 등록되면 다시 만듭니다."""
+        type_names = self.objects.type_names
+        if len(self._collectible_by_type) != len(type_names):
+            self._collectible_by_type = np.array(
+                [self.item_properties.get(name, {}).get('category') == 'collectible' for name in type_names], dtype=bool)
+        return self._collectible_by_type
         
-    def draw(self, frame):
-        """모든 게임 객체와 점수, 피드백을 프레임에 그립니다."""
-        # 배경 딤 및 파티클 필드 오버레이를 먼저 적용해 아이템이 위에 놓이도록 함
-        background_overlay = np.zeros_like(frame)
-        background_overlay[:] = (30, 10, 40)
-        dim_alpha = min(0.6, 0.2 + self.gesture_overlay_factor * 0.35)
-        cv2.addWeighted(background_overlay, dim_alpha, frame, 1 - dim_alpha, 0, dst=frame)
-        self.sky_particles.draw(frame)
-
-        for obj in self.objects:
-            img = self.item_images.get(obj.type, self.item_images.get('present'))
-            
-            x, y = int(obj.x - obj.size / 2), int(obj.y - obj.size / 2)
-            w, h = obj.size, obj.size
-            
-            x_end = min(x + w, self.width)
-            y_end = min(y + h, self.height)
-            
-            if x >= 0 and y >= 0 and x < self.width and y < self.height:
-                roi = frame[y:y_end, x:x_end]
-                img_to_overlay = img[0:y_end-y, 0:x_end-x]
-                
-                if img_to_overlay.shape[2] == 4:
-                    alpha = img_to_overlay[:, :, 3] / 255.0
-                    inv_alpha = 1.0 - alpha
-
-                    for c in range(0, 3):
-                        roi[:, :, c] = (roi[:, :, c] * inv_alpha) + (img_to_overlay[:, :, c] * alpha)
-                else:
-                    roi[:] = img_to_overlay
-
-        self._draw_particle_effects(frame)
+    def draw(self, frame, alpha=1.0):
+        """
+        모든 게임 객체와 점수, 피드백을 프레임에 그립니다.
+        alpha: 마지막 update() 틱 이후 다음 틱까지 흐른 비율. 객체 위치를 직전/현재 틱 사이로 보간합니다.
+        """
+        if not self.render:
+            return
 
+        profiler = self.profiler
+        # 배경 딤 및 파티클 필드 오버레이를 먼저 적용해 아이템이 위에 놓이도록 함
+        with profiler.measure('draw.dim'):
+            dim_alpha = min(0.6, 0.2 + self.gesture_overlay_factor * 0.35)
+            self.solid_blend.blend_solid(frame, self.dim_color, dim_alpha)
+        with profiler.measure('draw.sky'):
+            self.sky_particles.draw(frame)
+
+        with profiler.measure('draw.sprites'):
+            objects = self.objects
+            slots = objects.active_slots()
+            default_sprite = self.item_images.get('present')
+            for type_id, x, y, size in zip(objects.type_id[slots].tolist(), objects.x[slots].tolist(),
+                                           objects.interpolated_y(slots, alpha).tolist(), objects.size[slots].tolist()):
+                sprite = self.item_images.get(objects.type_names[type_id], default_sprite)
+                sprite.blit(frame, int(x - size / 2), int(y - size / 2))
+
+        with profiler.measure('draw.bursts'):
+            self._draw_particle_effects(frame)
+
+        with profiler.measure('draw.hud'):
+            self._draw_hud(frame)
+
+    def _draw_hud(self, frame):
+        """
+        피격 플래시, 하트, 점수/레벨, 피드백 문구, 일시 정지/게임 오버 화면을 그립니다.
+        글자와 하트는 hud_tiles에 타일로 캐시되어 점수/라이프/문구가 바뀔 때만 다시 래스터화됩니다.
+        """
         if self.damage_flash_timer > 0:
             intensity = self.damage_flash_timer / self.damage_flash_duration
             alpha = min(0.6, 0.6 * intensity)
-            overlay = np.full_like(frame, self.damage_flash_color)
-            frame[:] = cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0)
+            self.solid_blend.blend_solid(frame, self.damage_flash_color, alpha)
 
-        self._draw_hearts(frame)
+        tiles = self.hud_tiles
+        if self.multiplayer:
+            self._draw_player_panels(frame)
+        else:
+            self._draw_hearts(frame)
 
         # C30: 점수, 레벨, 난이도 정보 표시
         score_text = f"SCORE: {self.score}"
         level_text = f"LEVEL: {self.level}"
         diff_text = f"MODE: {self.current_difficulty.upper()}"
-        
-        cv2.putText(frame, score_text, (self.width - 240, 70), 
-                    cv2.FONT_HERSHEY_DUPLEX, 1.0, (40, 220, 255), 2, cv2.LINE_AA)
-        cv2.putText(frame, level_text, (self.width - 240, 110), 
-                    cv2.FONT_HERSHEY_DUPLEX, 0.9, (255, 255, 255), 2, cv2.LINE_AA)
-        cv2.putText(frame, diff_text, (self.width - 240, 150), 
-                    cv2.FONT_HERSHEY_DUPLEX, 0.8, (180, 200, 255), 2, cv2.LINE_AA)
+
+        # 점수는 자주 바뀌므로 레벨/난이도와 다른 타일에 그림
+        tiles.draw(frame, 'score', score_text, (self.width - 250, 35), (250, 50),
+                   lambda canvas: canvas.putText(score_text, (10, 35), cv2.FONT_HERSHEY_DUPLEX, 1.0, (40, 220, 255),
+                                                 2, cv2.LINE_AA))
+
+        def render_level(canvas):
+            canvas.putText(level_text, (10, 35), cv2.FONT_HERSHEY_DUPLEX, 0.9, (255, 255, 255), 2, cv2.LINE_AA)
+            canvas.putText(diff_text, (10, 75), cv2.FONT_HERSHEY_DUPLEX, 0.8, (180, 200, 255), 2, cv2.LINE_AA)
+        tiles.draw(frame, 'level', (level_text, diff_text), (self.width - 250, 75), (250, 90), render_level)
 
         self._draw_collected_summary(frame)
         
         # C34: 일시 정지 메시지 출력
         if self.paused and not self.game_over:
-            pause_text = "PAUSED (Press P to resume)"
-            cv2.putText(frame, pause_text, (self.width // 2 - 200, self.height // 2), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2, cv2.LINE_AA)
+            tiles.draw(frame, 'pause', None, (self.width // 2 - 210, self.height // 2 - 35), (520, 50),
+                       lambda canvas: canvas.putText("PAUSED (Press P to resume)", (10, 35),
+                                                     cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2,
+                                                     cv2.LINE_AA))
 
         # 📌 C40: 실시간 피드백 메시지 출력
         if self.feedback_timer > 0:
@@ -441,37 +1023,36 @@ class ChristmasGame:
             
             # 텍스트의 중심을 맞추기 위해 텍스트 크기 계산
             (text_w, text_h), baseline = cv2.getTextSize(self.feedback_text, cv2.FONT_HERSHEY_DUPLEX, scale, thickness)
-            
-            cv2.putText(frame, self.feedback_text, (center_x - text_w // 2, center_y), 
-                        cv2.FONT_HERSHEY_DUPLEX, scale, self.feedback_color, thickness, cv2.LINE_AA)
+            tiles.draw(frame, 'feedback', (self.feedback_text, self.feedback_color),
+                       (center_x - text_w // 2 - 10, center_y - text_h - 10), (text_w + 20, text_h + baseline + 20),
+                       lambda canvas: canvas.putText(self.feedback_text, (10, text_h + 10), cv2.FONT_HERSHEY_DUPLEX,
+                                                     scale, self.feedback_color, thickness, cv2.LINE_AA))
 
         # C32: 게임 오버 화면 출력
         if self.game_over:
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, self.height // 2 - 100), (self.width, self.height // 2 + 100), (0, 0, 0), -1)
-            alpha = 0.6
-            frame = cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0)
-            
-            game_over_text = "GAME OVER"
-            final_score_text = f"Final Score: {self.score}"
-            restart_text = "Press R to Restart"
-            
-            cv2.putText(frame, game_over_text, (self.width // 2 - 210, self.height // 2 - 30), 
-                        cv2.FONT_HERSHEY_DUPLEX, 1.8, (20, 0, 255), 4, cv2.LINE_AA)
-            cv2.putText(frame, final_score_text, (self.width // 2 - 200, self.height // 2 + 30), 
-                        cv2.FONT_HERSHEY_DUPLEX, 1.1, (255, 255, 255), 2, cv2.LINE_AA)
-            cv2.putText(frame, restart_text, (self.width // 2 - 200, self.height // 2 + 80), 
-                        cv2.FONT_HERSHEY_DUPLEX, 0.9, (255, 220, 0), 2, cv2.LINE_AA)
+            band = frame[max(0, self.height // 2 - 100):self.height // 2 + 101, :]
+            self.solid_blend.blend_solid(band, (0, 0, 0), 0.6)
 
+            final_score_text = f"Final Score: {self.score}"
             summary_lines = self._get_collected_summary_lines()
-            summary_start_y = self.height // 2 + 130
-            for idx, line in enumerate(summary_lines):
-                cv2.putText(frame, line, (self.width // 2 - 200, summary_start_y + idx * 35), 
-                            cv2.FONT_HERSHEY_DUPLEX, 0.85, (255, 255, 255), 2, cv2.LINE_AA)
+
+            def render_game_over(canvas):
+                # 타일 원점은 (화면 중앙 x - 220, 화면 중앙 y - 90)
+                canvas.putText("GAME OVER", (10, 60), cv2.FONT_HERSHEY_DUPLEX, 1.8, (20, 0, 255), 4, cv2.LINE_AA)
+                canvas.putText(final_score_text, (20, 120), cv2.FONT_HERSHEY_DUPLEX, 1.1, (255, 255, 255), 2,
+                               cv2.LINE_AA)
+                canvas.putText("Press R to Restart", (20, 170), cv2.FONT_HERSHEY_DUPLEX, 0.9, (255, 220, 0), 2,
+                               cv2.LINE_AA)
+                for idx, line in enumerate(summary_lines):
+                    canvas.putText(line, (20, 220 + idx * 35), cv2.FONT_HERSHEY_DUPLEX, 0.85, (255, 255, 255), 2,
+                                   cv2.LINE_AA)
+            tiles.draw(frame, 'game_over', (final_score_text, tuple(summary_lines)),
+                       (self.width // 2 - 220, self.height // 2 - 90), (540, 230 + len(summary_lines) * 35),
+                       render_game_over)
 
     def _choose_spawn_type(self):
         total_weight = sum(props.get('spawn_weight', 1) for props in self.item_properties.values())
-        pick = random.uniform(0, total_weight)
+        pick = self.rng.uniform(0, total_weight)
         cumulative = 0
         for item_type, props in self.item_properties.items():
             cumulative += props.get('spawn_weight', 1)
@@ -498,47 +1079,89 @@ class ChristmasGame:
     def _draw_hearts(self, frame):
         start_x = 30
         heart_spacing = 60
-        for idx in range(self.max_lives):
-            filled = idx < self.lives
-            x = start_x + idx * heart_spacing
-            self._draw_heart_shape(frame, (x, 50), 26, filled)
 
-    def _draw_heart_shape(self, frame, center, size, filled):
+        def render(canvas):
+            # 타일 원점은 (0, 30)
+            for idx in range(self.max_lives):
+                self._draw_heart_shape(canvas, (start_x + idx * heart_spacing, 20), 26, idx < self.lives)
+        self.hud_tiles.draw(frame, 'hearts', (self.lives, self.max_lives), (0, 30),
+                            (start_x + self.max_lives * heart_spacing, 52), render)
+
+    def _draw_player_panels(self, frame):
+        """멀티플레이어: 위쪽에 플레이어별 점수와 하트를, 검출된 입 위치에 플레이어 번호를 그립니다."""
+        panel_width = min(200, max(120, (self.width - 260) // len(self.players)))
+
+        def render(canvas):
+            # 타일 원점은 (0, 10)
+            for idx, player in enumerate(self.players):
+                x = 20 + idx * panel_width
+                if not player.joined:
+                    canvas.putText(f"{player.label} ---", (x, 26), cv2.FONT_HERSHEY_DUPLEX, 0.8, (120, 120, 120), 2,
+                                   cv2.LINE_AA)
+                    continue
+                color = player.color if player.alive else (120, 120, 120)
+                status = f"{player.label} {player.score}" if player.alive else f"{player.label} OUT"
+                canvas.putText(status, (x, 26), cv2.FONT_HERSHEY_DUPLEX, 0.8, color, 2, cv2.LINE_AA)
+                for life in range(player.max_lives):
+                    self._draw_heart_shape(canvas, (x + 12 + life * 30, 48), 14, life < player.lives)
+        key = tuple((player.joined, player.score, player.lives, player.max_lives) for player in self.players)
+        self.hud_tiles.draw(frame, 'players', key, (0, 10), (20 + len(self.players) * panel_width, 70), render)
+
+        for player in self.players:
+            if player.present and player.alive:
+                def render_marker(canvas, player=player):
+                    canvas.circle((40, 62), 34, player.color, 2, cv2.LINE_AA)
+                    canvas.putText(player.label, (24, 20), cv2.FONT_HERSHEY_DUPLEX, 0.7, player.color, 2, cv2.LINE_AA)
+                self.hud_tiles.draw(frame, f"marker{player.player_id}", None,
+                                    (int(player.mouth_x) - 40, int(player.mouth_y) - 62), (80, 102), render_marker)
+
+    def _draw_heart_shape(self, canvas, center, size, filled):
+        """하트 하나를 HUD 타일 캔버스(hud.HudCanvas)에 그립니다."""
         x, y = center
         radius = size // 2
         offset = radius // 2
         color = (0, 0, 230) if filled else (70, 70, 90)
         outline_color = (255, 255, 255) if filled else (120, 120, 120)
 
-        cv2.circle(frame, (x - offset, y), radius, color, -1)
-        cv2.circle(frame, (x + offset, y), radius, color, -1)
+        canvas.circle((x - offset, y), radius, color, -1)
+        canvas.circle((x + offset, y), radius, color, -1)
         triangle = np.array([
             [x - radius - offset, y],
             [x + radius + offset, y],
             [x, y + size]
         ], np.int32)
-        cv2.fillConvexPoly(frame, triangle, color)
+        canvas.fillConvexPoly(triangle, color)
 
-        cv2.circle(frame, (x - offset, y), radius, outline_color, 2)
-        cv2.circle(frame, (x + offset, y), radius, outline_color, 2)
-        cv2.polylines(frame, [triangle], True, outline_color, 2, cv2.LINE_AA)
+        canvas.circle((x - offset, y), radius, outline_color, 2)
+        canvas.circle((x + offset, y), radius, outline_color, 2)
+        canvas.polylines([triangle], True, outline_color, 2, cv2.LINE_AA)
 
     def _draw_collected_summary(self, frame):
-        start_x = 20
-        start_y = self.height - 140
-        cv2.putText(frame, "COLLECTED", (start_x, start_y), 
-                    cv2.FONT_HERSHEY_DUPLEX, 0.8, (255, 200, 150), 2, cv2.LINE_AA)
-        for idx, item in enumerate(self.collectible_types):
-            display_name = self.item_properties[item]['display_name']
-            count = self.collection_counts.get(item, 0)
-            text = f"{display_name}: {count}"
-            cv2.putText(frame, text, (start_x, start_y + 30 + idx * 28), 
-                        cv2.FONT_HERSHEY_DUPLEX, 0.7, (200, 255, 200), 1, cv2.LINE_AA)
+        counts = self.collection_counts
+
+        def render(canvas):
+            # 타일 원점은 (0, 화면 높이 - 170)
+            start_x = 20
+            start_y = 30
+            canvas.putText("COLLECTED", (start_x, start_y), cv2.FONT_HERSHEY_DUPLEX, 0.8, (255, 200, 150), 2,
+                           cv2.LINE_AA)
+            for idx, item in enumerate(self.collectible_types):
+                display_name = self.item_properties[item]['display_name']
+                text = f"{display_name}: {counts.get(item, 0)}"
+                canvas.putText(text, (start_x, start_y + 30 + idx * 28), cv2.FONT_HERSHEY_DUPLEX, 0.7,
+                               (200, 255, 200), 1, cv2.LINE_AA)
+        self.hud_tiles.draw(frame, 'collected', tuple(counts.values()), (0, self.height - 170),
+                            (360, 50 + len(self.collectible_types) * 28), render)
 
     def _get_collected_summary_lines(self):
         lines = []
         total = sum(self.collection_counts.values())
         lines.append(f"Total Collected: {total}")
+        if self.multiplayer:
+            # 멀티플레이어는 아이템별 대신 플레이어별 결과 (점수 순)
+            for player in sorted(self.joined_players, key=lambda p: -p.score):
+                lines.append(f"{player.label}: {player.score} pts, {sum(player.collection_counts.values())} items")
+            return lines
         for item in self.collectible_types:
             display_name = self.item_properties[item]['display_name']
             count = self.collection_counts.get(item, 0)
@@ -554,7 +1177,10 @@ class ChristmasGame:
         if self.game_over:
             return 0
         score_gain = int(bonus_value * self.score_multiplier)
-        self.score += score_gain
+        # 제스처는 모두가 함께 맞추는 보너스라 참여 중인 살아 있는 플레이어 전원에게 줌
+        for player in self.joined_players:
+            if player.alive:
+                player.score += score_gain
         self._apply_feedback(f"{gesture_name} BONUS! (+{score_gain})", (255, 120, 220))
         if origin is None:
             origin = (self.width // 2, self.height // 2)
@@ -562,43 +1188,35 @@ class ChristmasGame:
         return score_gain
 
     def trigger_particle_effect(self, origin, color):
+        if not self.render:
+            return
         x, y = origin
-        burst = ParticleBurst(x, y, color)
-        self.particle_effects.append(burst)
+        self.particle_effects.spawn_burst(x, y, color)
 
     def _update_particle_effects(self):
-        active_effects = []
-        for effect in self.particle_effects:
-            effect.update()
-            if not effect.is_finished():
-                active_effects.append(effect)
-        self.particle_effects = active_effects
+        self.particle_effects.update()
 
     def _draw_particle_effects(self, frame):
-        for effect in self.particle_effects:
-            effect.draw(frame)
+        self.particle_effects.draw(frame)
 
     def _apply_feedback(self, text, color):
         self.feedback_text = text
         self.feedback_color = color
         self.feedback_timer = self.max_feedback_time
 
-    def _lose_life(self, amount=1, flash_color=(0, 0, 255)):
-        self.lives -= amount
+    def _lose_life(self, amount=1, flash_color=(0, 0, 255), player=None):
+        """player(기본 1번)의 라이프를 줄입니다. 참여한 모든 플레이어의 라이프가 0이 되면 게임 오버입니다."""
+        player = player or self.players[0]
+        player.lives = max(0, player.lives - amount)
         self.damage_flash_color = flash_color
         self.damage_flash_timer = self.damage_flash_duration
-        if self.lives <= 0:
+        if not any(p.alive for p in self.joined_players):
             self.game_over = True
 
-    def _load_item_image(self, path, size, fallback_color):
-        img = cv2.imread(path, cv2.IMREAD_UNCHANGED) if path else None
-        if path and img is None:
-            print(f"WARNING: Could not load asset '{path}'. Using fallback graphic.")
-        if img is None:
-            img = np.zeros((size, size, 4), dtype=np.uint8)
-            img[:, :, :3] = fallback_color
-            img[:, :, 3] = 255
-        else:
-            img = cv2.resize(img, (size, size))
-
-        return img
+    def _load_item_atlas(self, size):
+        """모든 아이템의 size 크기 스프라이트 아틀라스를 반환합니다. (캐시 파일이 있으면 memmap으로 공유)"""
+        entries = [(item_type,
+                    os.path.join(self.asset_dir, props['asset']) if props.get('asset') else None,
+                    props.get('fallback_color', (255, 255, 255)))
+                   for item_type, props in self.item_properties.items()]
+        return load_item_atlas(entries, size)
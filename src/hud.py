@@ -0,0 +1,100 @@
+import cv2
+import numpy as np
+
+from sprites import PremultipliedSprite
+
+
+class HudCanvas:
+    """
+    HUD 타일 하나를 그리는 캔버스입니다. cv2 그리기 함수와 같은 인자(프레임 인자 제외)를 받아
+    검은 바탕의 BGR 이미지와 커버리지(알파) 마스크에 같은 도형을 함께 그립니다.
+    안티앨리어싱된 가장자리는 검은 바탕과 섞이므로 BGR 이미지가 곧 알파를 미리 곱한 색이 됩니다.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.image = np.zeros((height, width, 3), dtype=np.uint8)
+        self.alpha = np.zeros((height, width), dtype=np.uint8)
+        self.inv_alpha = np.empty((height, width, 3), dtype=np.uint8)
+
+    def clear(self):
+        self.image[:] = 0
+        self.alpha[:] = 0
+
+    def putText(self, text, org, font, scale, color, thickness=1, line_type=cv2.LINE_8):
+        cv2.putText(self.image, text, org, font, scale, color, thickness, line_type)
+        cv2.putText(self.alpha, text, org, font, scale, 255, thickness, line_type)
+
+    def circle(self, center, radius, color, thickness=1, line_type=cv2.LINE_8):
+        cv2.circle(self.image, center, radius, color, thickness, line_type)
+        cv2.circle(self.alpha, center, radius, 255, thickness, line_type)
+
+    def rectangle(self, pt1, pt2, color, thickness=1, line_type=cv2.LINE_8):
+        cv2.rectangle(self.image, pt1, pt2, color, thickness, line_type)
+        cv2.rectangle(self.alpha, pt1, pt2, 255, thickness, line_type)
+
+    def fillConvexPoly(self, points, color, line_type=cv2.LINE_8):
+        cv2.fillConvexPoly(self.image, points, color, line_type)
+        cv2.fillConvexPoly(self.alpha, points, 255, line_type)
+
+    def polylines(self, points, closed, color, thickness=1, line_type=cv2.LINE_8):
+        cv2.polylines(self.image, points, closed, color, thickness, line_type)
+        cv2.polylines(self.alpha, points, closed, 255, thickness, line_type)
+
+    def fill_rect(self, pt1, pt2, color, opacity):
+        """반투명 패널: 프레임에 addWeighted(color, opacity, frame, 1 - opacity)한 것과 같은 영역을 채웁니다."""
+        (x1, y1), (x2, y2) = pt1, pt2
+        self.image[y1:y2 + 1, x1:x2 + 1] = [int(round(c * opacity)) for c in color]
+        self.alpha[y1:y2 + 1, x1:x2 + 1] = int(round(255 * opacity))
+
+    def to_sprite(self):
+        """
+        그려진 영역(알파가 0이 아닌 경계 상자)만 담은 PremultipliedSprite와 타일 안에서의 (x, y) 위치를 반환합니다.
+        캔버스 버퍼의 뷰를 쓰므로 복사하지 않으며, 빈 캔버스면 (None, None)입니다.
+        """
+        rows = np.flatnonzero(self.alpha.any(axis=1))
+        if not len(rows):
+            return None, None
+        cols = np.flatnonzero(self.alpha.any(axis=0))
+        y1, y2 = int(rows[0]), int(rows[-1]) + 1
+        x1, x2 = int(cols[0]), int(cols[-1]) + 1
+        inv_alpha = self.inv_alpha[y1:y2, x1:x2]
+        cv2.merge([cv2.bitwise_not(self.alpha[y1:y2, x1:x2])] * 3, dst=inv_alpha)
+        return PremultipliedSprite.from_premultiplied(self.image[y1:y2, x1:x2], inv_alpha), (x1, y1)
+
+
+class HudTileCache:
+    """
+    HUD 요소를 이름별 RGBA 타일로 캐시합니다.
+    draw(frame, name, key, ...)는 key(표시할 텍스트/값)가 지난번과 같으면 캐시된 타일을 합성만 하고,
+    바뀌었을 때만 render(canvas)로 타일을 다시 그립니다. 크기가 같으면 캔버스 버퍼를 재사용합니다.
+    """
+
+    def __init__(self):
+        self._tiles = {}
+        self.hits = 0
+        self.renders = 0
+
+    def tile(self, name, key, size, render):
+        """name 타일의 (sprite, 타일 안에서의 위치)를 반환합니다. key가 바뀌었을 때만 render(canvas)로 다시 그립니다."""
+        entry = self._tiles.get(name)
+        if entry is not None and entry[0] == key and (entry[1].width, entry[1].height) == size:
+            self.hits += 1
+            return entry[2], entry[3]
+        canvas = entry[1] if entry is not None and (entry[1].width, entry[1].height) == size else HudCanvas(*size)
+        canvas.clear()
+        render(canvas)
+        sprite, offset = canvas.to_sprite()
+        self._tiles[name] = (key, canvas, sprite, offset)
+        self.renders += 1
+        return sprite, offset
+
+    def draw(self, frame, name, key, origin, size, render):
+        """타일 왼쪽 위를 origin에 두고 합성합니다. size는 (width, height)입니다."""
+        sprite, offset = self.tile(name, key, size, render)
+        if sprite is not None:
+            sprite.blit(frame, origin[0] + offset[0], origin[1] + offset[1])
+
+    def clear(self):
+        self._tiles = {}
@@ -0,0 +1,379 @@
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import filter_logic as fl
+import landmark_trace as lt
+from profiling import NULL_PROFILER
+
+# 공유 메모리 프레임 링의 슬롯 수
+# 결과를 기다리다 시간 초과된 워커가 종료되기 전까지 이전 슬롯을 읽고 있을 수 있으므로 다음 프레임은 다른 슬롯에 씀
+FRAME_RING_SLOTS = 2
+# 워커가 모델을 만들고 준비 신호를 보낼 때까지 기다리는 최대 시간 (초)
+WORKER_START_TIMEOUT = 60.0
+# 한 프레임의 결과를 기다리는 최대 시간 (초). 넘기면 워커가 멈춘 것으로 보고 다시 시작
+WORKER_RESULT_TIMEOUT = 2.0
+# 종료 요청 후 워커가 스스로 끝나기를 기다리는 시간 (초)
+WORKER_STOP_TIMEOUT = 2.0
+# 실행 중 워커를 연달아 다시 시작할 수 있는 최대 횟수 (넘기면 그 워커를 포기하고 failed로 표시)
+WORKER_MAX_RESTARTS = 5
+# 마지막 재시작 뒤 이 시간(초) 동안 정상 결과를 돌려주면 재시작 횟수를 0으로 되돌림 (오래 켜 두는 키오스크용)
+WORKER_HEALTHY_RESET = 60.0
+
+
+class SharedFrameRing:
+    """
+    추론 입력(RGB) 프레임을 담는 multiprocessing.shared_memory 링 버퍼입니다.
+    메인 프로세스는 slot 뷰에 바로 RGB 변환 결과를 쓰고, 워커는 같은 메모리를 복사 없이 읽습니다.
+    """
+
+    def __init__(self, shape, slots=FRAME_RING_SLOTS):
+        self.shape = tuple(shape)
+        self.slots = max(1, slots)
+        size = int(np.prod(self.shape)) * self.slots
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+        self.frames = np.ndarray((self.slots,) + self.shape, dtype=np.uint8, buffer=self.shm.buf)
+        self._next = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def next_slot(self):
+        """다음에 쓸 (슬롯 번호, 프레임 뷰)를 반환합니다."""
+        slot = self._next
+        self._next = (self._next + 1) % self.slots
+        return slot, self.frames[slot]
+
+    def close(self):
+        # 공유 메모리를 닫기 전에 버퍼를 참조하는 뷰부터 놓아야 함
+        self.frames = None
+        self.shm.close()
+        self.shm.unlink()
+
+
+class _AttachedRing:
+    """워커 쪽에서 이름으로 연 SharedFrameRing입니다. 링이 바뀌면 이전 것을 닫고 새로 엽니다."""
+
+    def __init__(self):
+        self.name = None
+        self.shm = None
+        self.frames = None
+
+    def frame(self, name, shape, slots, slot):
+        if name != self.name:
+            self.close()
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.frames = np.ndarray((slots,) + tuple(shape), dtype=np.uint8, buffer=self.shm.buf)
+            self.name = name
+        return self.frames[slot]
+
+    def close(self):
+        if self.shm is not None:
+            self.frames = None
+            self.shm.close()
+            self.shm = None
+            self.name = None
+
+
+def _create_model(kind, options):
+    if kind == 'face':
+        if options.get('face_roi'):
+            return fl.initialize_face_roi_tracker(refine_landmarks=options.get('refine_landmarks', True))
+        face_mesh, _ = fl.initialize_filter_system(refine_landmarks=options.get('refine_landmarks', True),
+                                                   max_num_faces=options.get('max_faces', 1))
+        return face_mesh
+    return fl.initialize_hand_tracker()
+
+
+def _pack_results(kind, results):
+    """모델 결과를 파이프로 보낼 작은 값으로 바꿉니다. (얼굴: float32 (N, 3) 배열 목록, 손: hand_data)"""
+    if kind == 'hands':
+        return fl.build_hand_data(results)
+    return [np.array([(lm.x, lm.y, lm.z) for lm in face.landmark], dtype=np.float32)
+            for face in (results.multi_face_landmarks or [])]
+
+
+def _worker_main(kind, options, conn):
+    """
+    워커 프로세스 본체. 모델을 만든 뒤 ('ready',)를 보내고,
+    (seq, 링 이름, 모양, 슬롯 수, 슬롯) 요청마다 ('result', seq, 결과, 추론 시간)을 돌려줍니다. None을 받으면 끝냅니다.
+    """
+    ring = _AttachedRing()
+    model = None
+    try:
+        try:
+            model = _create_model(kind, options)
+        except Exception as exc:
+            conn.send(('error', f"{type(exc).__name__}: {exc}"))
+            return
+        conn.send(('ready',))
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            seq, name, shape, slots, slot = request
+            rgb = ring.frame(name, shape, slots, slot)
+            start = time.perf_counter()
+            results = model.process(rgb)
+            elapsed = time.perf_counter() - start
+            conn.send(('result', seq, _pack_results(kind, results), elapsed))
+    except (EOFError, KeyboardInterrupt):
+        # 메인 프로세스가 먼저 끝남
+        pass
+    finally:
+        if model is not None and hasattr(model, 'close'):
+            model.close()
+        ring.close()
+        conn.close()
+
+
+class ModelWorker:
+    """
+    모델 하나(Face Mesh 또는 Hands)를 전용 프로세스에서 실행하고 파이프로 요청/결과를 주고받습니다.
+    워커가 죽거나 WORKER_RESULT_TIMEOUT 안에 답하지 않으면 다시 시작하고, 준비될 때까지 그 모델은 건너뜁니다.
+    연달아 WORKER_MAX_RESTARTS번을 넘게 재시작하면 워커를 멈추고 failed/error로 알리며, 예외는 던지지 않습니다.
+    status는 마지막 재시작/실패 안내 문구입니다. (main이 바뀔 때마다 출력)
+    """
+
+    def __init__(self, kind, options=None, context=None):
+        self.kind = kind
+        self.options = options or {}
+        self.context = context or multiprocessing.get_context('spawn')
+        self.process = None
+        self.conn = None
+        self.ready = False
+        self.restarts = 0
+        self.error = None
+        self.status = None
+        self._last_restart = None
+        self.start()
+
+    @property
+    def failed(self):
+        return self.error is not None
+
+    def start(self):
+        parent_conn, child_conn = self.context.Pipe()
+        # fork는 MediaPipe/TFLite 스레드 상태를 복제하므로 spawn으로 새 인터프리터에서 모델을 만듦
+        self.process = self.context.Process(target=_worker_main, args=(self.kind, self.options, child_conn),
+                                            name=f"{self.kind}-worker", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.ready = False
+
+    def wait_ready(self, timeout=WORKER_START_TIMEOUT):
+        """워커가 모델을 다 만들 때까지 기다립니다. timeout=0이면 기다리지 않고 현재 상태만 확인합니다."""
+        if self.ready:
+            return True
+        if self.failed:
+            return False
+        try:
+            if not self.conn.poll(timeout):
+                if timeout:
+                    raise RuntimeError(f"{self.kind} worker did not start within {timeout:.0f}s")
+                return False
+            message = self.conn.recv()
+        except (OSError, EOFError):
+            self._restart('exited during startup')
+            return False
+        if message[0] == 'error':
+            self._fail(f"{self.kind} worker failed to start: {message[1]}")
+            if timeout:
+                # 시작 시점(모델 로더 스레드)에서는 DeferredInference가 예외를 받아 failed로 표시
+                raise RuntimeError(self.error)
+            return False
+        self.ready = True
+        return True
+
+    def submit(self, request):
+        """요청을 보냅니다. 파이프가 끊겼으면 워커를 다시 시작하고 False를 반환합니다."""
+        if self.failed:
+            return False
+        try:
+            self.conn.send(request)
+            return True
+        except (OSError, EOFError):
+            self._restart('pipe closed')
+            return False
+
+    def receive(self, seq, timeout=WORKER_RESULT_TIMEOUT):
+        """seq 요청의 (결과, 추론 시간)을 반환합니다. 워커가 죽었거나 멈췄으면 다시 시작하고 None을 반환합니다."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                if not self.conn.poll(max(0.0, deadline - time.perf_counter())):
+                    self._restart(f"no result within {timeout:.1f}s")
+                    return None
+                message = self.conn.recv()
+            except (OSError, EOFError):
+                self._restart('exited')
+                return None
+            if message[0] == 'result' and message[1] == seq:
+                if self.restarts and time.perf_counter() - self._last_restart >= WORKER_HEALTHY_RESET:
+                    # 재시작 뒤 충분히 오래 정상 동작: 몇 시간에 걸친 드문 재시작이 누적되지 않게 함
+                    self.restarts = 0
+                return message[2], message[3]
+
+    def _restart(self, reason):
+        self.restarts += 1
+        if self.restarts > WORKER_MAX_RESTARTS:
+            self._fail(f"{self.kind} worker {reason}; gave up after {WORKER_MAX_RESTARTS} restarts")
+            return
+        self.status = f"{self.kind} worker {reason}; restarting ({self.restarts}/{WORKER_MAX_RESTARTS})"
+        self.stop(graceful=False)
+        self.start()
+        self._last_restart = time.perf_counter()
+
+    def _fail(self, message):
+        self.error = message
+        self.status = message
+        self.stop(graceful=False)
+
+    def stop(self, graceful=True):
+        if self.process is None:
+            return
+        if graceful:
+            try:
+                self.conn.send(None)
+            except (OSError, EOFError):
+                pass
+            self.process.join(WORKER_STOP_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+        self.process = None
+        self.conn = None
+        self.ready = False
+
+
+class ProcessInferencePool:
+    """
+    InferenceCoordinator의 멀티프로세스 버전입니다. (process / set_idle / close 인터페이스 동일)
+    Face Mesh와 Hands는 각자 워커 프로세스에서 돌고, 메인 프로세스는 프레임을 공유 메모리 링에 RGB로 한 번 쓴 뒤
+    두 워커에 슬롯 번호만 보내고 결과를 기다립니다. 얼굴 결과는 TracedFaceResults로 돌아옵니다.
+    """
+
+    def __init__(self, refine_landmarks=True, face_roi=False, max_faces=1, hands=True, hand_scheduler=None, timers=None,
+                 result_cache=None, inference_scale=1.0, slots=FRAME_RING_SLOTS):
+        self.hand_scheduler = hand_scheduler
+        self.result_cache = result_cache
+        self.timers = timers or NULL_PROFILER
+        self.buffers = fl.FrameBuffers(scale=inference_scale)
+        self.slots = slots
+        self.ring = None
+        self._seq = 0
+        context = multiprocessing.get_context('spawn')
+        # 두 워커가 메인 프로세스의 나머지 초기화와 동시에 모델을 만들도록 바로 시작
+        self.face_worker = ModelWorker('face', {'refine_landmarks': refine_landmarks, 'face_roi': face_roi,
+                                                  'max_faces': max_faces}, context)
+        self.hand_worker = ModelWorker('hands', context=context) if hands else None
+        self._started = False
+
+    @property
+    def failed(self):
+        """Face Mesh 워커를 포기했으면 True입니다. (Hands 워커만 실패하면 손 추적만 건너뜀)"""
+        return self.face_worker.failed
+
+    @property
+    def error(self):
+        return self.face_worker.error
+
+    @property
+    def status(self):
+        """워커들의 마지막 재시작/실패 안내를 한 줄로 반환합니다. (없으면 None)"""
+        messages = [worker.status for worker in self._workers() if worker.status]
+        return " | ".join(messages) if messages else None
+
+    def _workers(self):
+        return [worker for worker in (self.face_worker, self.hand_worker) if worker is not None]
+
+    def _ring_for(self, frame):
+        width, height = self.buffers.inference_size(frame)
+        shape = (height, width, 3)
+        if self.ring is None or self.ring.shape != shape:
+            if self.ring is not None:
+                self.ring.close()
+            self.ring = SharedFrameRing(shape, self.slots)
+        return self.ring
+
+    def _write_frame(self, frame):
+        """frame을 링의 다음 슬롯에 RGB로 쓰고 워커에 보낼 요청을 반환합니다."""
+        ring = self._ring_for(frame)
+        slot, rgb = ring.next_slot()
+        self.buffers.convert(frame, out=rgb)
+        self._seq += 1
+        return self._seq, ring.name, ring.shape, ring.slots, slot
+
+    def warm_up(self, width, height):
+        """워커가 모델을 다 만들 때까지 기다린 뒤, 검은 프레임을 링으로 한 번 보내 첫 추론(공유 메모리 연결 포함)을 미리 실행합니다."""
+        for worker in self._workers():
+            worker.wait_ready()
+        self._started = True
+        request = self._write_frame(np.zeros((height, width, 3), dtype=np.uint8))
+        sent = [worker for worker in self._workers() if worker.submit(request)]
+        for worker in sent:
+            worker.receive(request[0], timeout=WORKER_START_TIMEOUT)
+
+    def process(self, frame):
+        """frame(BGR)을 추론해 InferenceResult를 반환합니다."""
+        if self.result_cache is not None:
+            cached = self.result_cache.lookup(frame)
+            if cached is not None:
+                return fl.InferenceResult(frame, *cached)
+
+        if not self._started:
+            # 첫 프레임만 모델 준비를 기다리고, 재시작된 워커는 준비될 때까지 건너뜀
+            for worker in self._workers():
+                worker.wait_ready()
+            self._started = True
+
+        request = self._write_frame(frame)
+
+        run_hands = self.hand_worker is not None
+        if run_hands and self.hand_scheduler is not None:
+            run_hands = self.hand_scheduler.should_run()
+
+        face_sent = self.face_worker.wait_ready(0) and self.face_worker.submit(request)
+        hands_sent = run_hands and self.hand_worker.wait_ready(0) and self.hand_worker.submit(request)
+
+        faces = []
+        if face_sent:
+            reply = self.face_worker.receive(self._seq)
+            if reply is not None:
+                faces, elapsed = reply
+                self.timers.record('inference.face', elapsed)
+        hand_data = None
+        if hands_sent:
+            reply = self.hand_worker.receive(self._seq)
+            if reply is not None:
+                hand_data, elapsed = reply
+                self.timers.record('inference.hands', elapsed)
+
+        face_results = lt.TracedFaceResults(faces)
+        if hand_data is None and self.hand_scheduler is not None:
+            hand_data = self.hand_scheduler.predict()
+        elif hand_data is None:
+            hand_data = fl.build_hand_data(None)
+        elif self.hand_scheduler is not None:
+            self.hand_scheduler.record(hand_data)
+
+        if self.result_cache is not None:
+            self.result_cache.store(frame, face_results, hand_data)
+        return fl.InferenceResult(frame, face_results, hand_data)
+
+    def set_idle(self, idle):
+        """메뉴/일시 정지처럼 정확한 추적이 필요 없는 동안 추론을 저빈도 keep-alive로 낮춥니다."""
+        if self.result_cache is not None:
+            self.result_cache.idle = idle
+
+    def close(self):
+        for worker in self._workers():
+            worker.stop()
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
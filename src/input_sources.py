@@ -0,0 +1,271 @@
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+# 프레임 디렉터리 입력으로 읽을 이미지 확장자
+FRAME_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+# FPS 정보가 없는 입력의 기본 재생 속도
+DEFAULT_SOURCE_FPS = 30.0
+# 카메라가 읽어 들이는 미리 할당된 프레임 버퍼 수 (렌더 루프가 recycle()로 돌려줄 때까지 다시 쓰지 않음)
+CAMERA_BUFFER_COUNT = 2
+# 빈 프레임이 연속될 때의 재시도 대기 (초, 두 배씩 늘림)와 카메라를 닫힌 것으로 볼 연속 실패 횟수
+CAPTURE_RETRY_DELAY = 0.005
+CAPTURE_MAX_RETRY_DELAY = 0.1
+CAPTURE_MAX_FAILURES = 100
+# 캡처 시각/영상 내 시각을 기억해 둘 최근 프레임 수 (지연 시간 측정, 트레이스 기록용)
+CAPTURE_TIME_HISTORY = 16
+
+
+class FrameSource:
+    """
+    main.py가 프레임을 받아 오는 입력 소스의 공통 인터페이스입니다.
+    read(): (True, frame) / 일시적 실패면 (False, None) / 입력이 끝났으면 (None, None)
+    media_time(): 마지막으로 읽은 프레임의 시각(초). 녹화 입력은 재생 속도와 무관한 영상 내 시각입니다.
+    frame_media_time(frame): 특정 프레임을 읽었을 때의 media_time. 캡처가 추론보다 앞서 나가는 파이프라인 모드용입니다.
+    """
+    live = False
+
+    def __init__(self, width, height, fps, mirror=True):
+        self.width = width
+        self.height = height
+        self.fps = fps or DEFAULT_SOURCE_FPS
+        self.mirror = mirror
+        self._media_time = 0.0
+        self._capture_times = {}
+        self._media_times = {}
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        raise NotImplementedError
+
+    def media_time(self):
+        return self._media_time
+
+    def release(self):
+        pass
+
+    def recycle(self, frame):
+        """read()로 받은 frame을 다 쓴 뒤(표시 후, 또는 버려질 때) 호출합니다. 버퍼를 재사용하는 입력만 돌려받습니다."""
+
+    def capture_time(self, frame):
+        """frame을 읽어 온 시각(perf_counter)을 반환합니다. 캡처→표시 지연 측정용이며 모르면 None."""
+        return self._capture_times.get(id(frame))
+
+    def frame_media_time(self, frame):
+        """frame을 읽었을 때의 media_time을 반환합니다. 모르면 None."""
+        return self._media_times.get(id(frame))
+
+    def _finish(self, frame, captured_at=None):
+        if self.mirror:
+            # 새 버퍼를 만들지 않고 제자리에서 좌우 반전
+            cv2.flip(frame, 1, dst=frame)
+        for times in (self._capture_times, self._media_times):
+            times.pop(id(frame), None)
+            if len(times) >= CAPTURE_TIME_HISTORY:
+                times.pop(next(iter(times)))
+        self._capture_times[id(frame)] = captured_at if captured_at is not None else time.perf_counter()
+        self._media_times[id(frame)] = self._media_time
+        return True, frame
+
+
+class _PacedSource(FrameSource):
+    """녹화 입력의 공통 부분: 프레임 번호로 영상 내 시각을 정하고, realtime이면 원래 FPS에 맞춰 기다립니다."""
+
+    def __init__(self, width, height, fps, mirror=True, realtime=True):
+        super().__init__(width, height, fps, mirror)
+        self.realtime = realtime
+        self.frame_index = 0
+        self._started = None
+
+    def _pace(self):
+        self._media_time = self.frame_index / self.fps
+        self.frame_index += 1
+        if not self.realtime:
+            return
+        now = time.perf_counter()
+        if self._started is None:
+            self._started = now - self._media_time
+        delay = self._started + self._media_time - now
+        if delay > 0:
+            # 처리가 늦어 밀린 경우에는 기다리지 않고 바로 다음 프레임을 넘김
+            time.sleep(delay)
+
+
+class CameraSource(FrameSource):
+    """
+    웹캠 입력. 요청한 해상도/FPS/픽셀 포맷(MJPG, YUYV)을 드라이버와 협상하고,
+    드라이버 버퍼를 1장으로 줄여 오래된 프레임이 쌓이지 않게 합니다.
+    프레임은 미리 할당한 buffer_count개의 버퍼 풀에서 빈 버퍼를 꺼내 읽어 들이므로 프레임마다 새 배열을 만들지 않습니다.
+    버퍼는 사용하는 쪽이 recycle()로 돌려줄 때까지 다시 쓰지 않으며, 빈 버퍼가 없으면 그 프레임은 버립니다(dropped).
+    media_time은 실제 시각(perf_counter)입니다.
+    """
+    live = True
+
+    def __init__(self, index=0, mirror=True, width=None, height=None, fps=None, fourcc=None,
+                 buffer_count=CAMERA_BUFFER_COUNT):
+        self.cap = cv2.VideoCapture(index)
+        if fourcc:
+            # 포맷을 먼저 정해야 드라이버가 해당 포맷에서 가능한 해상도/FPS를 고름
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        if width and height:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if fps:
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        super().__init__(int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                         self.cap.get(cv2.CAP_PROP_FPS), mirror)
+        self.buffers = [np.empty((self.height, self.width, 3), dtype=np.uint8) for _ in range(max(1, buffer_count))]
+        # 캡처 스레드가 꺼내고 렌더 루프(또는 프레임을 버리는 큐)가 돌려놓는 빈 버퍼 목록
+        self._free_buffers = list(self.buffers)
+        self._buffer_lock = threading.Lock()
+        self._failures = 0
+        self.dropped = 0
+
+    def describe(self):
+        """협상 결과 (실제 해상도, FPS, 포맷, 드라이버 버퍼 수)를 한 줄로 반환합니다."""
+        code = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc = ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00') or '?'
+        return (f"{self.width}x{self.height} @ {self.fps:.1f}fps {fourcc}, "
+                f"driver buffer {int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE))}")
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        if not self.cap.isOpened():
+            return None, None
+        with self._buffer_lock:
+            buffer = self._free_buffers.pop() if self._free_buffers else None
+        if buffer is None:
+            # 모든 버퍼가 추론/렌더 중: 드라이버 프레임만 소비해 버리고 다음 프레임을 기다림
+            if not self.cap.grab():
+                return self._read_failed()
+            self.dropped += 1
+            return False, None
+        ret, frame = self.cap.read(buffer)
+        if not ret or frame is None:
+            self.recycle(buffer)
+            return self._read_failed()
+        self._failures = 0
+        captured_at = time.perf_counter()
+        self._media_time = captured_at
+        if frame is not buffer:
+            # 드라이버가 알려 준 크기와 실제 프레임이 다르면 새 배열을 버퍼로 채택
+            with self._buffer_lock:
+                self.buffers = [frame if b is buffer else b for b in self.buffers]
+        return self._finish(frame, captured_at)
+
+    def _read_failed(self):
+        """빈 프레임: 바로 다시 읽지 않고 점점 길게 기다렸다가, 계속 실패하면 입력 종료로 처리"""
+        self._failures += 1
+        if self._failures >= CAPTURE_MAX_FAILURES:
+            self.cap.release()
+            return None, None
+        time.sleep(min(CAPTURE_MAX_RETRY_DELAY, CAPTURE_RETRY_DELAY * 2 ** min(self._failures - 1, 8)))
+        return False, None
+
+    def recycle(self, frame):
+        with self._buffer_lock:
+            # 풀의 버퍼가 아니거나 이미 돌려받은 버퍼면 무시
+            if (frame is None or not any(frame is buffer for buffer in self.buffers)
+                    or any(frame is buffer for buffer in self._free_buffers)):
+                return
+            self._free_buffers.append(frame)
+
+    def media_time(self):
+        return time.perf_counter()
+
+    def release(self):
+        self.cap.release()
+
+
+class VideoFileSource(_PacedSource):
+    """녹화된 영상 파일 입력. realtime=False면 디코딩되는 대로 최대한 빨리 넘깁니다."""
+
+    def __init__(self, path, mirror=True, realtime=True):
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise IOError(f"Could not open video '{path}'")
+        super().__init__(int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                         self.cap.get(cv2.CAP_PROP_FPS), mirror, realtime)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        if not self.cap.isOpened():
+            return None, None
+        ret, frame = self.cap.read()
+        if not ret:
+            # 파일 끝
+            self.cap.release()
+            return None, None
+        self._pace()
+        return self._finish(frame)
+
+    def release(self):
+        self.cap.release()
+
+
+class FrameDirectorySource(_PacedSource):
+    """이미지 파일이 든 디렉터리를 파일 이름 순서대로 fps 속도로 재생합니다."""
+
+    def __init__(self, path, fps=DEFAULT_SOURCE_FPS, mirror=True, realtime=True):
+        self.paths = sorted(os.path.join(path, name) for name in os.listdir(path)
+                            if name.lower().endswith(FRAME_EXTENSIONS))
+        if not self.paths:
+            raise IOError(f"No frames ({', '.join(FRAME_EXTENSIONS)}) in '{path}'")
+        first = cv2.imread(self.paths[0])
+        if first is None:
+            raise IOError(f"Could not read frame '{self.paths[0]}'")
+        super().__init__(first.shape[1], first.shape[0], fps, mirror, realtime)
+
+    def isOpened(self):
+        return self.frame_index < len(self.paths)
+
+    def read(self):
+        if self.frame_index >= len(self.paths):
+            return None, None
+        frame = cv2.imread(self.paths[self.frame_index])
+        self._pace()
+        if frame is None:
+            return False, None
+        return self._finish(frame)
+
+
+class BlankSource(_PacedSource):
+    """영상 없이 랜드마크 트레이스만 재생할 때 쓰는 단색 배경 입력입니다. frame_count개를 넘기면 끝납니다."""
+
+    def __init__(self, width, height, fps=DEFAULT_SOURCE_FPS, frame_count=None, color=(40, 40, 40), realtime=True):
+        super().__init__(width, height, fps, mirror=False, realtime=realtime)
+        self.frame_count = frame_count
+        self.color = color
+
+    def isOpened(self):
+        return self.frame_count is None or self.frame_index < self.frame_count
+
+    def read(self):
+        if not self.isOpened():
+            return None, None
+        self._pace()
+        # 렌더링이 프레임 위에 바로 그리므로 매번 새 배경을 만듦
+        return self._finish(np.full((self.height, self.width, 3), self.color, dtype=np.uint8))
+
+
+def open_source(spec, mirror=True, realtime=True, fps=DEFAULT_SOURCE_FPS, camera_options=None):
+    """
+    spec이 정수(문자열 포함)면 해당 번호의 카메라, 디렉터리면 프레임 디렉터리, 그 외에는 영상 파일로 엽니다.
+    realtime=False면 녹화 입력을 원래 속도와 관계없이 최대한 빨리 재생합니다.
+    camera_options: CameraSource에 넘길 width, height, fps, fourcc, buffer_count
+    """
+    if spec is None or str(spec).isdigit():
+        return CameraSource(int(spec or 0), mirror=mirror, **(camera_options or {}))
+    if os.path.isdir(spec):
+        return FrameDirectorySource(spec, fps=fps, mirror=mirror, realtime=realtime)
+    return VideoFileSource(spec, mirror=mirror, realtime=realtime)
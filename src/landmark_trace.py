@@ -0,0 +1,178 @@
+import struct
+
+import numpy as np
+
+from filter_logic import InferenceResult
+
+# 파일 헤더: 매직, 버전, 프레임 크기, FPS
+TRACE_MAGIC = b'XMLT'
+TRACE_VERSION = 1
+_HEADER = struct.Struct('<4sHHHf')
+# 프레임 레코드: 시각(초), 얼굴 수, 손 수, 제스처 코드
+_RECORD = struct.Struct('<dBBB')
+_COUNT = struct.Struct('<H')
+# 제스처 이름 <-> 1바이트 코드 (0은 제스처 없음)
+TRACE_GESTURES = (None, 'PALM', 'PEACE', 'FIST', 'ROCK')
+
+
+class TracedLandmark:
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class _TracedLandmarkSequence:
+    """(N, 3) 배열을 landmark[idx].x 형태로 읽게 해 주는 시퀀스입니다. 접근한 점만 객체로 만듭니다."""
+
+    def __init__(self, points):
+        self.points = points
+
+    def __getitem__(self, idx):
+        x, y, z = self.points[idx].tolist()
+        return TracedLandmark(x, y, z)
+
+    def __len__(self):
+        return len(self.points)
+
+    def __iter__(self):
+        for x, y, z in self.points.tolist():
+            yield TracedLandmark(x, y, z)
+
+
+class TracedFaceLandmarks:
+    """MediaPipe NormalizedLandmarkList 대신 쓰는 재생용 얼굴 랜드마크입니다."""
+
+    def __init__(self, points):
+        self.points = points
+        self.landmark = _TracedLandmarkSequence(points)
+
+
+class TracedFaceResults:
+    """Face Mesh 결과처럼 multi_face_landmarks를 가진 재생용 결과입니다. 얼굴이 없으면 None입니다."""
+
+    def __init__(self, faces):
+        self.multi_face_landmarks = [TracedFaceLandmarks(points) for points in faces] or None
+
+
+class LandmarkTraceWriter:
+    """
+    프레임별 추론 결과(얼굴 랜드마크, 손 랜드마크, 제스처)를 압축된 바이너리로 기록합니다.
+    좌표는 float32 (N, 3)으로 저장되어 Face Mesh 478점 기준 프레임당 약 5.7KB입니다.
+    """
+
+    def __init__(self, path, width, height, fps):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._file.write(_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, width, height, fps or 0.0))
+        self.frames = 0
+
+    def write(self, timestamp, result):
+        """InferenceResult 하나를 기록합니다."""
+        faces = []
+        if result.face_results is not None and result.face_results.multi_face_landmarks:
+            for face in result.face_results.multi_face_landmarks:
+                faces.append(np.array([(lm.x, lm.y, lm.z) for lm in face.landmark], dtype=np.float32))
+        hands = [np.asarray(points, dtype=np.float32) for points in result.hand_data.get('landmarks', [])]
+        gesture = result.hand_data.get('gesture')
+
+        parts = [_RECORD.pack(timestamp, len(faces), len(hands),
+                              TRACE_GESTURES.index(gesture) if gesture in TRACE_GESTURES else 0)]
+        for points in faces + hands:
+            parts.append(_COUNT.pack(len(points)))
+            parts.append(points.tobytes())
+        self._file.write(b''.join(parts))
+        self.frames += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class LandmarkTraceReader:
+    """LandmarkTraceWriter가 만든 파일을 프레임 순서대로 읽습니다."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._data = f.read()
+        if len(self._data) < _HEADER.size:
+            raise ValueError(f"'{path}' is not a landmark trace (file too short)")
+        magic, version, self.width, self.height, fps = _HEADER.unpack_from(self._data, 0)
+        if magic != TRACE_MAGIC or version != TRACE_VERSION:
+            raise ValueError(f"'{path}' is not a landmark trace (version {TRACE_VERSION})")
+        self.fps = fps or None
+        self._offset = _HEADER.size
+        self.frames = 0
+
+    @property
+    def exhausted(self):
+        return self._offset >= len(self._data)
+
+    def read(self):
+        """
+        다음 프레임의 (시각, 얼굴 랜드마크 배열 목록, hand_data)를 반환합니다. 끝이면 None.
+        레코드가 중간에 잘려 있으면 ValueError를 던집니다.
+        """
+        if self.exhausted:
+            return None
+        data = self._data
+        try:
+            timestamp, face_count, hand_count, gesture = _RECORD.unpack_from(data, self._offset)
+            offset = self._offset + _RECORD.size
+            arrays = []
+            for _ in range(face_count + hand_count):
+                (count,) = _COUNT.unpack_from(data, offset)
+                offset += _COUNT.size
+                arrays.append(np.frombuffer(data, dtype=np.float32, count=count * 3, offset=offset).reshape(count, 3))
+                offset += count * 3 * 4
+        except (struct.error, ValueError) as exc:
+            raise ValueError(f"'{self.path}' is truncated or corrupt at frame {self.frames}") from exc
+        self._offset = offset
+        self.frames += 1
+
+        hands = arrays[face_count:]
+        hand_data = {
+            'gesture': TRACE_GESTURES[gesture] if gesture < len(TRACE_GESTURES) else None,
+            'landmarks': [[tuple(point) for point in hand.tolist()] for hand in hands],
+            'hand_count': len(hands)
+        }
+        return timestamp, arrays[:face_count], hand_data
+
+    def count_frames(self):
+        """남은 레코드를 건너뛰며 전체 프레임 수를 셉니다. (읽기 위치는 바뀌지 않음)"""
+        offset = self._offset
+        frames = self.frames
+        while self.read() is not None:
+            pass
+        total = self.frames
+        self._offset = offset
+        self.frames = frames
+        return total
+
+
+class TraceReplayInference:
+    """
+    InferenceCoordinator 대신 쓰는 재생용 추론기입니다.
+    process(frame)는 모델을 돌리지 않고 트레이스의 다음 레코드를 InferenceResult로 돌려줍니다.
+    결과의 media_time은 녹화 때 기록한 시각이라, 게임 시계가 이를 따르면 녹화 때와 같은 틱 수로 재생됩니다.
+    """
+
+    def __init__(self, reader):
+        self.reader = reader
+
+    def process(self, frame):
+        record = self.reader.read()
+        if record is None:
+            return InferenceResult(frame, TracedFaceResults([]), {'gesture': None, 'landmarks': [], 'hand_count': 0})
+        timestamp, faces, hand_data = record
+        return InferenceResult(frame, TracedFaceResults(faces), hand_data, media_time=timestamp)
+
+    def set_idle(self, idle):
+        """트레이스는 기록된 순서대로 한 프레임씩 재생하므로 keep-alive 모드가 없습니다."""
+
+    def close(self):
+        pass
@@ -1,9 +1,19 @@
+import argparse
 import cv2
 import filter_logic as fl
 import game_logic as gl
+import hud
+import inference_workers as iw
+import input_sources as ins
+import landmark_trace as lt
 import math
 import os
+import pipeline as pl
+import profiling
 import random
+import time
+import timestep
+import ui_layer as ui
 
 # MediaPipe/TensorFlow 로그 레벨 설정 (경고 숨김)
 os.environ['GLOG_minloglevel'] = '2'
@@ -23,31 +33,205 @@ GESTURE_INSTRUCTIONS = {
     'FIST': 'Hold up a closed fist!'
 }
 
-def main():
-    cap = cv2.VideoCapture(0)
+# 파이프라인 모드에서 스테이지 타이밍을 출력하는 주기 (초)
+PIPELINE_STATS_INTERVAL = 5.0
+# 파이프라인 모드의 카메라 프레임 버퍼 수 (캡처 중 1 + 큐 2 + 추론 중 1 + 렌더 중 1에 여유분)
+# 버퍼는 표시 후 cap.recycle()로 돌려받으며, 모두 사용 중이면 캡처 스레드가 그 프레임을 버림
+PIPELINE_CAMERA_BUFFERS = 8
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Christmas Game Filter')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='캡처/추론/렌더를 별도 스레드로 분리한 파이프라인 모드로 실행')
+    parser.add_argument('--stats', action='store_true',
+                        help='스테이지별 처리 시간을 주기적으로 출력')
+    parser.add_argument('--serial-inference', action='store_true',
+                        help='Face Mesh와 Hands를 병렬 대신 순차로 실행')
+    parser.add_argument('--process-workers', action='store_true',
+                        help='Face Mesh와 Hands를 각각 별도 프로세스에서 실행 (프레임은 공유 메모리로 전달)')
+    parser.add_argument('--face-roi', action='store_true',
+                        help='얼굴을 찾은 뒤에는 얼굴 주변 ROI만 잘라 Face Mesh를 실행하는 추적 모드')
+    parser.add_argument('--no-refine-landmarks', action='store_true',
+                        help='홍채 정밀 랜드마크(refine_landmarks)를 끄고 Face Mesh를 실행')
+    parser.add_argument('--inference-scale', type=float, default=1.0,
+                        help='Face Mesh/Hands 입력을 이 비율(0 < S < 1, 예: 0.5)로 한 번 축소해 추론. '
+                             '1 이상이면 축소하지 않음. 화면은 원본 해상도로 그림')
+    parser.add_argument('--no-frame-cache', action='store_true',
+                        help='메뉴/일시 정지/게임 오버 중에도 매 프레임 추론 (keep-alive와 정지 장면 결과 재사용 끄기)')
+    parser.add_argument('--hand-interval', type=int, default=3,
+                        help='제스처 프롬프트가 대기 중이 아닐 때 Hands 모델을 실행하는 프레임 간격')
+    parser.add_argument('--profile', action='store_true',
+                        help='스테이지/그리기 단계별 시간을 수집 (o 키로 p50/p95/p99 오버레이 표시)')
+    parser.add_argument('--profile-out', metavar='PATH',
+                        help='종료 시 프로파일 요약을 CSV(.csv) 또는 JSON으로 저장 (--profile 포함)')
+    parser.add_argument('--profile-label', default='',
+                        help='내보낸 프로파일에 기록할 빌드/설정 이름')
+    parser.add_argument('--input', default='0',
+                        help='입력 소스: 카메라 번호, 영상 파일, 또는 프레임 이미지 디렉터리 (기본 0)')
+    parser.add_argument('--fast', action='store_true',
+                        help='녹화 입력(영상/디렉터리/트레이스)을 원래 FPS 대신 최대한 빨리 재생')
+    parser.add_argument('--input-fps', type=float, default=ins.DEFAULT_SOURCE_FPS,
+                        help='프레임 디렉터리 입력의 재생 FPS')
+    parser.add_argument('--camera-size', metavar='WxH',
+                        help='카메라에 요청할 해상도 (예: 1280x720). 실제 값은 드라이버와 협상된 결과를 출력')
+    parser.add_argument('--camera-fps', type=float,
+                        help='카메라에 요청할 FPS')
+    parser.add_argument('--camera-format', choices=['MJPG', 'YUYV'],
+                        help='카메라 픽셀 포맷 (고해상도/고FPS는 대개 MJPG에서만 지원)')
+    parser.add_argument('--no-mirror', action='store_true',
+                        help='입력 프레임을 좌우 반전하지 않음 (이미 반전된 녹화본용)')
+    parser.add_argument('--record-trace', metavar='PATH',
+                        help='프레임별 얼굴/손 랜드마크 결과를 바이너리 트레이스로 저장')
+    parser.add_argument('--replay-trace', metavar='PATH',
+                        help='MediaPipe 대신 저장된 트레이스를 재생 (--input을 주지 않으면 단색 배경 사용)')
+    parser.add_argument('--seed', type=int,
+                        help='게임과 제스처 선택 난수 시드 (트레이스 재생을 재현 가능하게 할 때 사용)')
+    parser.add_argument('--difficulty', choices=['easy', 'normal', 'hard'],
+                        help='메뉴를 건너뛰고 바로 이 난이도로 시작')
+    parser.add_argument('--players', type=int, default=1,
+                        help='멀티플레이어: 최대 N개의 얼굴을 추적해 얼굴마다 점수/라이프를 따로 관리 (기본 1)')
+    args = parser.parse_args(argv)
+    if args.players < 1:
+        parser.error('--players must be at least 1')
+    if args.camera_size:
+        # 'WxH' → (width, height)
+        parts = args.camera_size.lower().split('x')
+        if len(parts) != 2 or not all(part.isdigit() and int(part) > 0 for part in parts):
+            parser.error(f"--camera-size must look like 1280x720 (got '{args.camera_size}')")
+        args.camera_size = tuple(int(part) for part in parts)
+    if not args.inference_scale > 0:  # NaN도 거부
+        parser.error('--inference-scale must be greater than 0 (values of 1 or more disable downscaling)')
+    if args.pipeline and (args.replay_trace or not args.input.isdigit()):
+        # 파이프라인 큐는 밀린 프레임을 버리므로 녹화 입력/트레이스 재생의 결과가 재현되지 않음
+        parser.error('--pipeline drops frames to stay live and only supports camera input '
+                     '(not --input files/directories or --replay-trace)')
+    if args.players > 1 and args.face_roi:
+        parser.error('--face-roi tracks a single face and cannot be combined with --players')
+    return args
+
+def main(argv=None):
+    started = time.perf_counter()
+    args = parse_args(argv)
+    realtime = not args.fast
+    mirror = not args.no_mirror
+
+    # 입력 소스: 카메라 / 영상 파일 / 프레임 디렉터리, 트레이스 재생 시 입력이 없으면 단색 배경
+    trace_reader = None
+    try:
+        trace_reader = lt.LandmarkTraceReader(args.replay_trace) if args.replay_trace else None
+        if trace_reader is not None and args.input == '0':
+            cap = ins.BlankSource(trace_reader.width, trace_reader.height,
+                                  fps=trace_reader.fps or ins.DEFAULT_SOURCE_FPS,
+                                  frame_count=trace_reader.count_frames(), realtime=realtime)
+        else:
+            width, height = args.camera_size or (None, None)
+            camera_options = {
+                'width': width, 'height': height, 'fps': args.camera_fps, 'fourcc': args.camera_format,
+                # 파이프라인 모드는 캡처가 추론/렌더보다 몇 프레임 앞서 나가므로 버퍼를 넉넉히 둠
+                'buffer_count': PIPELINE_CAMERA_BUFFERS if args.pipeline else ins.CAMERA_BUFFER_COUNT
+            }
+            cap = ins.open_source(args.input, mirror=mirror, realtime=realtime, fps=args.input_fps,
+                                  camera_options=camera_options)
+    except (IOError, ValueError) as exc:
+        # 입력 소스를 열 수 없거나 트레이스 파일이 없거나 손상됨
+        print(f"Error: {exc}")
+        return
     
     if not cap.isOpened():
         print("Error: Could not open webcam.")
         return
+    if cap.live:
+        print(f"Camera: {cap.describe()}")
 
     window_name = 'Christmas Game Filter'
     cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
 
-    # MediaPipe Face Mesh 객체 및 유틸리티 초기화
-    face_mesh, mp_drawing = fl.initialize_filter_system()
-    
-    frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-    frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    frame_width = cap.width
+    frame_height = cap.height
     cv2.resizeWindow(window_name, frame_width, frame_height)
     
-    # ChristmasGame 객체 및 MediaPipe Hands 초기화
-    game = gl.ChristmasGame(frame_width, frame_height)
-    hand_tracker = fl.initialize_hand_tracker()
+    # 스테이지별 시간 계측. --stats/--profile이 모두 꺼져 있으면 계측 지점은 no-op
+    timers = profiling.FrameProfiler(enabled=args.stats or args.profile or bool(args.profile_out))
+    # 시작 단계별 시간 (창 표시, mediapipe import, 모델 생성, 워밍업, 첫 프레임). 모델이 준비되면 한 줄로 출력
+    startup = profiling.StartupTimeline(origin=started, profiler=timers)
+    startup.mark('window')
+    show_profile_overlay = False
+    # 제스처 카드/입 상태 문구의 HUD 타일 캐시 (게임 HUD는 game.hud_tiles)
+    hud_tiles = hud.HudTileCache()
+
+    # ChristmasGame 객체 초기화
+    game = gl.ChristmasGame(frame_width, frame_height, seed=args.seed, profiler=timers, max_players=args.players)
+    gesture_rng = random.Random(args.seed)
+
+    # Hands는 제스처 판정이 필요할 때만 매 프레임, 그 외에는 --hand-interval 프레임마다 실행
+    hand_scheduler = fl.HandTrackingScheduler(interval=args.hand_interval)
+    face_mesh = None
+    hand_tracker = None
+    model_loader = None
+
+    def create_inference():
+        """MediaPipe 모델을 만들어 추론 객체로 감쌉니다. (모델 로더 스레드에서 실행)"""
+        nonlocal face_mesh, hand_tracker
+        result_cache = None if args.no_frame_cache else fl.InferenceResultCache()
+        if args.process_workers:
+            # 모델은 워커 프로세스가 만들고, 이 프로세스는 캡처/시뮬레이션/렌더링만 담당
+            return iw.ProcessInferencePool(refine_landmarks=not args.no_refine_landmarks,
+                                           face_roi=args.face_roi,
+                                           max_faces=args.players,
+                                           hand_scheduler=hand_scheduler,
+                                           timers=timers,
+                                           result_cache=result_cache,
+                                           inference_scale=args.inference_scale)
+        with startup.measure('mediapipe import'):
+            fl.load_mediapipe()
+        # MediaPipe Face Mesh 객체 및 유틸리티 초기화
+        refine_landmarks = not args.no_refine_landmarks
+        if args.face_roi:
+            # 입 주변 ROI만 잘라 추론하는 추적 모드 (process 인터페이스는 동일)
+            face_mesh = fl.initialize_face_roi_tracker(refine_landmarks=refine_landmarks)
+        else:
+            face_mesh, _ = fl.initialize_filter_system(refine_landmarks=refine_landmarks, max_num_faces=args.players)
+        hand_tracker = fl.initialize_hand_tracker()
+        # 한 번의 RGB 변환으로 Face Mesh와 Hands를 병렬 실행
+        return fl.InferenceCoordinator(face_mesh, hand_tracker,
+                                       parallel=not args.serial_inference,
+                                       hand_scheduler=hand_scheduler,
+                                       timers=timers,
+                                       result_cache=result_cache,
+                                       inference_scale=args.inference_scale)
+
+    if trace_reader is not None:
+        # 저장된 랜드마크를 그대로 재생하므로 MediaPipe 모델을 만들지 않음
+        inference = lt.TraceReplayInference(trace_reader)
+    else:
+        # 모델 import/생성/워밍업은 백그라운드에서 하고, 그동안 창과 메뉴는 카메라 영상으로 바로 표시
+        model_loader = fl.DeferredInference(create_inference, (frame_width, frame_height), startup=startup)
+        inference = model_loader
+        if not cap.live and not model_loader.wait():
+            # 녹화 입력은 첫 프레임부터 추적해야 결과가 재현되므로 모델을 기다리고, 실패하면 종료
+            print(f"Error: Could not load face tracking models: {model_loader.error}")
+            model_loader.close()
+            cap.release()
+            cv2.destroyAllWindows()
+            return
+    trace_writer = lt.LandmarkTraceWriter(args.record_trace, frame_width, frame_height, cap.fps) \
+        if args.record_trace else None
 
+    # 게임 로직은 렌더/추론 프레임률과 무관하게 고정 틱(초당 timestep.SIM_TICK_RATE)으로 진행
+    # 시각은 입력 소스 기준이라 녹화 입력을 --fast로 재생해도 프레임당 틱 수가 원래 속도와 같음
+    # 트레이스 재생은 지금 렌더하는 결과에 기록된 시각을 써서 녹화 때의 프레임 간격을 그대로 재현
+    # (첫 결과 전에는 None이라 시계가 첫 결과의 시각부터 셈)
+    replay_time = None
+
+    def clock_time():
+        return replay_time if trace_reader is not None else cap.media_time()
+
+    game_clock = timestep.FixedTimestepClock(time_source=clock_time)
 
     gesture_types = ['PALM', 'PEACE', 'FIST']
-    GESTURE_INTERVAL_FRAMES = 240
-    GESTURE_SUCCESS_FRAMES = 80
+    # 제스처 주기와 성공 연출 길이 (틱 단위)
+    GESTURE_INTERVAL_TICKS = 240
+    GESTURE_SUCCESS_TICKS = 80
     GESTURE_BONUS_POINTS = 40
 
     gesture_target = None
@@ -57,7 +241,7 @@ def main():
 
     def start_gesture_cycle():
         nonlocal gesture_target, gesture_timer, gesture_ready, gesture_success_timer
-        gesture_target = random.choice(gesture_types)
+        gesture_target = gesture_rng.choice(gesture_types)
         gesture_timer = 0
         gesture_ready = True
         gesture_success_timer = 0
@@ -73,7 +257,7 @@ def main():
         nonlocal gesture_timer, gesture_ready, gesture_success_timer
         gesture_timer = 0
         gesture_ready = False
-        gesture_success_timer = GESTURE_SUCCESS_FRAMES
+        gesture_success_timer = GESTURE_SUCCESS_TICKS
 
     def update_gesture_cycle(detected_gesture):
         nonlocal gesture_timer, gesture_success_timer
@@ -94,30 +278,45 @@ def main():
                 mark_gesture_success()
                 return
         gesture_timer += 1
-        if gesture_timer >= GESTURE_INTERVAL_FRAMES:
+        if gesture_timer >= GESTURE_INTERVAL_TICKS:
             start_gesture_cycle()
 
     menu_active = True
-    active_buttons = []
+    active_layer = None
+    # 모델이 준비되기 전에 고른 난이도 (준비되면 바로 시작)
+    pending_mode = None
+
+    def set_ui_layer(layer):
+        nonlocal active_layer
+        active_layer = layer
 
-    def set_buttons(buttons):
-        nonlocal active_buttons
-        active_buttons = buttons
+    def models_ready():
+        return model_loader is None or model_loader.ready
+
+    def models_failed():
+        return model_loader is not None and model_loader.failed
 
     def launch_mode(mode):
-        nonlocal menu_active
+        nonlocal menu_active, pending_mode
+        if models_failed():
+            # 얼굴 추적 없이는 게임을 할 수 없으므로 메뉴에 실패 안내만 남김
+            pending_mode = None
+            return
+        if not models_ready():
+            pending_mode = mode
+            return
+        pending_mode = None
         game.start_new_run(mode)
         menu_active = False
         start_gesture_cycle()
+        game_clock.reset()
 
     def handle_mouse(event, x, y, flags, param):
-        if event == cv2.EVENT_LBUTTONUP:
-            for btn in active_buttons:
-                x1, y1, x2, y2 = btn['rect']
-                if x1 <= x <= x2 and y1 <= y <= y2:
-                    callback = btn.get('callback')
-                    if callback:
-                        callback()
+        if event == cv2.EVENT_LBUTTONUP and active_layer is not None:
+            # 화면에 그린 것과 같은 캐시된 레이아웃으로 클릭 위치 판정
+            button = active_layer.hit_test(x, y)
+            if button is not None and button.action:
+                button.action()
 
     cv2.setMouseCallback(window_name, handle_mouse)
 
@@ -134,7 +333,17 @@ def main():
         menu_active = True
         reset_gesture_cycle()
 
-    def build_difficulty_buttons():
+    def build_menu_layer(width, height):
+        layer = ui.UiLayer(width, height, tint=((30, 0, 70), 0.45), solid_blend=game.solid_blend)
+
+        def render_title(canvas):
+            canvas.putText("Christmas Catch", (width // 2 - 260, 50),
+                           cv2.FONT_HERSHEY_DUPLEX, 1.8, (255, 255, 255), 2, cv2.LINE_AA)
+            canvas.putText("Open wide to grab the gifts!", (width // 2 - 240, 100),
+                           cv2.FONT_HERSHEY_DUPLEX, 0.95, (255, 220, 220), 2, cv2.LINE_AA)
+
+        layer.add_panel((0, height // 2 - 270), (width, 120), render_title)
+
         configs = [
             ('easy', 'EASY', 'Relaxed gift collecting', (80, 180, 100)),
             ('normal', 'NORMAL', 'Balanced challenge', (255, 150, 60)),
@@ -144,136 +353,153 @@ def main():
         button_height = 85
         spacing = 28
         vertical_span = button_height * len(configs) + spacing * (len(configs) - 1)
-        start_y = (frame_height // 2) - (vertical_span // 2) + 70
-        buttons = []
+        start_y = (height // 2) - (vertical_span // 2) + 70
         for idx, (mode, label, subtitle, color) in enumerate(configs):
-            x1 = frame_width // 2 - button_width // 2
+            x1 = width // 2 - button_width // 2
             y1 = start_y + idx * (button_height + spacing)
             rect = (x1, y1, x1 + button_width, y1 + button_height)
-            buttons.append({
-                'label': label,
-                'subtitle': subtitle,
-                'rect': rect,
-                'color': color,
-                'callback': make_start_callback(mode)
-            })
-        return buttons
-
-    def build_replay_buttons():
+            layer.add_button(ui.UiButton(rect, label, subtitle, color, make_start_callback(mode)))
+        return layer
+
+    def build_replay_layer(width, height):
+        layer = ui.UiLayer(width, height)
         button_width = 230
         button_height = 70
-        y1 = frame_height // 2 + 200
+        y1 = height // 2 + 200
         spacing = 30
-        left_rect = (frame_width // 2 - button_width - spacing // 2, y1, frame_width // 2 - spacing // 2, y1 + button_height)
-        right_rect = (frame_width // 2 + spacing // 2, y1, frame_width // 2 + button_width + spacing // 2, y1 + button_height)
-        return [
-            {
-                'label': 'REPLAY',
-                'subtitle': 'Try again same mode',
-                'rect': left_rect,
-                'color': (0, 120, 255),
-                'callback': replay_current
-            },
-            {
-                'label': 'MAIN MENU',
-                'subtitle': 'Choose difficulty',
-                'rect': right_rect,
-                'color': (120, 50, 180),
-                'callback': go_to_menu
-            }
-        ]
-
-    def draw_buttons(frame, buttons):
-        for btn in buttons:
-            x1, y1, x2, y2 = btn['rect']
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (x1, y1), (x2, y2), btn['color'], -1)
-            cv2.addWeighted(overlay, 0.75, frame, 0.25, 0, frame)
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (255, 255, 255), 2, cv2.LINE_AA)
-            text_y = y1 + (y2 - y1) // 2 + 8
-            cv2.putText(frame, btn['label'], (x1 + 25, text_y), 
-                        cv2.FONT_HERSHEY_DUPLEX, 0.9, (255, 255, 255), 2, cv2.LINE_AA)
-            subtitle = btn.get('subtitle')
-            if subtitle:
-                cv2.putText(frame, subtitle, (x1 + 25, y2 - 12), 
-                            cv2.FONT_HERSHEY_DUPLEX, 0.58, (255, 255, 255), 1, cv2.LINE_AA)
-
-    def draw_menu_overlay(frame, title, subtitle):
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (frame_width, frame_height), (30, 0, 70), -1)
-        cv2.addWeighted(overlay, 0.45, frame, 0.55, 0, frame)
-        cv2.putText(frame, title, (frame_width // 2 - 260, frame_height // 2 - 220), 
-                    cv2.FONT_HERSHEY_DUPLEX, 1.8, (255, 255, 255), 2, cv2.LINE_AA)
-        cv2.putText(frame, subtitle, (frame_width // 2 - 240, frame_height // 2 - 170), 
-                    cv2.FONT_HERSHEY_DUPLEX, 0.95, (255, 220, 220), 2, cv2.LINE_AA)
-
-    def draw_hand_icon(frame, origin, gesture, highlighted):
+        left_rect = (width // 2 - button_width - spacing // 2, y1, width // 2 - spacing // 2, y1 + button_height)
+        right_rect = (width // 2 + spacing // 2, y1, width // 2 + button_width + spacing // 2, y1 + button_height)
+        layer.add_button(ui.UiButton(left_rect, 'REPLAY', 'Try again same mode', (0, 120, 255), replay_current))
+        layer.add_button(ui.UiButton(right_rect, 'MAIN MENU', 'Choose difficulty', (120, 50, 180), go_to_menu))
+        return layer
+
+    ui_layers = {}
+    ui_builders = {'menu': build_menu_layer, 'replay': build_replay_layer}
+
+    def get_ui_layer(name, frame):
+        """name('menu' / 'replay') 레이어를 프레임 해상도별로 한 번만 만들어 재사용합니다."""
+        height, width = frame.shape[:2]
+        key = (name, width, height)
+        layer = ui_layers.get(key)
+        if layer is None:
+            layer = ui_builders[name](width, height)
+            ui_layers[key] = layer
+        return layer
+
+    def draw_hand_icon(canvas, origin, gesture, highlighted):
         x, y = origin
         fill = (0, 220, 200) if highlighted else (180, 180, 200)
         outline = (255, 255, 255)
         palm_top = (x + 15, y + 40)
         palm_bottom = (x + 65, y + 98)
-        cv2.rectangle(frame, palm_top, palm_bottom, fill, -1)
-        cv2.rectangle(frame, palm_top, palm_bottom, outline, 2)
+        canvas.rectangle(palm_top, palm_bottom, fill, -1)
+        canvas.rectangle(palm_top, palm_bottom, outline, 2)
 
         if gesture == 'PALM':
             for idx in range(4):
                 fx = x + 15 + idx * 12
-                cv2.rectangle(frame, (fx, y + 5), (fx + 10, y + 45), fill, -1)
-                cv2.rectangle(frame, (fx, y + 5), (fx + 10, y + 45), outline, 1)
+                canvas.rectangle((fx, y + 5), (fx + 10, y + 45), fill, -1)
+                canvas.rectangle((fx, y + 5), (fx + 10, y + 45), outline, 1)
         elif gesture == 'PEACE':
             for fx in [x + 20, x + 45]:
-                cv2.rectangle(frame, (fx, y + 5), (fx + 10, y + 55), fill, -1)
-                cv2.rectangle(frame, (fx, y + 5), (fx + 10, y + 55), outline, 1)
-            cv2.rectangle(frame, (x + 27, y + 55), (x + 55, y + 70), (140, 140, 160), -1)
-            cv2.rectangle(frame, (x + 27, y + 55), (x + 55, y + 70), outline, 1)
+                canvas.rectangle((fx, y + 5), (fx + 10, y + 55), fill, -1)
+                canvas.rectangle((fx, y + 5), (fx + 10, y + 55), outline, 1)
+            canvas.rectangle((x + 27, y + 55), (x + 55, y + 70), (140, 140, 160), -1)
+            canvas.rectangle((x + 27, y + 55), (x + 55, y + 70), outline, 1)
         elif gesture == 'FIST':
-            cv2.rectangle(frame, (x + 20, y + 15), (x + 60, y + 70), fill, -1)
-            cv2.rectangle(frame, (x + 20, y + 15), (x + 60, y + 70), outline, 2)
-            cv2.rectangle(frame, (x + 18, y + 65), (x + 62, y + 85), (140, 140, 160), -1)
-            cv2.rectangle(frame, (x + 18, y + 65), (x + 62, y + 85), outline, 1)
+            canvas.rectangle((x + 20, y + 15), (x + 60, y + 70), fill, -1)
+            canvas.rectangle((x + 20, y + 15), (x + 60, y + 70), outline, 2)
+            canvas.rectangle((x + 18, y + 65), (x + 62, y + 85), (140, 140, 160), -1)
+            canvas.rectangle((x + 18, y + 65), (x + 62, y + 85), outline, 1)
         elif gesture == 'ROCK':
             for fx in [x + 20, x + 55]:
-                cv2.rectangle(frame, (fx, y + 5), (fx + 10, y + 50), fill, -1)
-                cv2.rectangle(frame, (fx, y + 5), (fx + 10, y + 50), outline, 1)
-            cv2.rectangle(frame, (x + 28, y + 45), (x + 52, y + 70), (140, 140, 160), -1)
-            cv2.rectangle(frame, (x + 28, y + 45), (x + 52, y + 70), outline, 1)
+                canvas.rectangle((fx, y + 5), (fx + 10, y + 50), fill, -1)
+                canvas.rectangle((fx, y + 5), (fx + 10, y + 50), outline, 1)
+            canvas.rectangle((x + 28, y + 45), (x + 52, y + 70), (140, 140, 160), -1)
+            canvas.rectangle((x + 28, y + 45), (x + 52, y + 70), outline, 1)
 
     def draw_gesture_prompt(frame, target, detected, ready, success_timer):
         if target is None:
             return
         box_x1, box_y1 = 20, 80
         box_x2, box_y2 = 280, 270
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (box_x1, box_y1), (box_x2, box_y2), (20, 30, 70), -1)
-        cv2.addWeighted(overlay, 0.65, frame, 0.35, 0, frame)
-        cv2.rectangle(frame, (box_x1, box_y1), (box_x2, box_y2), (255, 255, 255), 2, cv2.LINE_AA)
-
         highlight = success_timer > 0 or (ready and detected == target)
-        draw_hand_icon(frame, (box_x1 + 12, box_y1 + 20), target, highlight)
-
-        cv2.putText(frame, "BONUS GESTURE", (box_x1 + 110, box_y1 + 45),
-                    cv2.FONT_HERSHEY_DUPLEX, 0.62, (255, 210, 180), 1, cv2.LINE_AA)
-        instruction = GESTURE_INSTRUCTIONS.get(target, target)
-        cv2.putText(frame, target, (box_x1 + 110, box_y1 + 78),
-                    cv2.FONT_HERSHEY_DUPLEX, 0.85, (255, 255, 255), 2, cv2.LINE_AA)
-        cv2.putText(frame, instruction, (box_x1 + 20, box_y1 + 125),
-                    cv2.FONT_HERSHEY_DUPLEX, 0.55, (210, 220, 255), 1, cv2.LINE_AA)
-
-        status_y = box_y1 + 180
         if success_timer > 0:
-            cv2.putText(frame, f"BONUS +{GESTURE_BONUS_POINTS}", (box_x1 + 30, status_y),
-                        cv2.FONT_HERSHEY_DUPLEX, 0.78, (255, 120, 220), 2, cv2.LINE_AA)
+            status = 'bonus'
         elif ready and detected == target:
-            cv2.putText(frame, "MATCH! Hold steady", (box_x1 + 20, status_y),
-                        cv2.FONT_HERSHEY_DUPLEX, 0.6, (0, 220, 180), 2, cv2.LINE_AA)
+            status = 'match'
         elif ready:
-            cv2.putText(frame, "Show this hand pose", (box_x1 + 15, status_y),
-                        cv2.FONT_HERSHEY_DUPLEX, 0.6, (200, 220, 255), 1, cv2.LINE_AA)
+            status = 'ready'
+        else:
+            status = 'waiting'
+
+        def render(canvas):
+            # 타일 원점은 (box_x1 - 2, box_y1 - 2): 카드 테두리 안티앨리어싱까지 포함
+            x1, y1 = 2, 2
+            x2, y2 = x1 + box_x2 - box_x1, y1 + box_y2 - box_y1
+            canvas.fill_rect((x1, y1), (x2, y2), (20, 30, 70), 0.65)
+            canvas.rectangle((x1, y1), (x2, y2), (255, 255, 255), 2, cv2.LINE_AA)
+            draw_hand_icon(canvas, (x1 + 12, y1 + 20), target, highlight)
+
+            canvas.putText("BONUS GESTURE", (x1 + 110, y1 + 45),
+                           cv2.FONT_HERSHEY_DUPLEX, 0.62, (255, 210, 180), 1, cv2.LINE_AA)
+            instruction = GESTURE_INSTRUCTIONS.get(target, target)
+            canvas.putText(target, (x1 + 110, y1 + 78),
+                           cv2.FONT_HERSHEY_DUPLEX, 0.85, (255, 255, 255), 2, cv2.LINE_AA)
+            canvas.putText(instruction, (x1 + 20, y1 + 125),
+                           cv2.FONT_HERSHEY_DUPLEX, 0.55, (210, 220, 255), 1, cv2.LINE_AA)
+
+            status_y = y1 + 180
+            if status == 'bonus':
+                canvas.putText(f"BONUS +{GESTURE_BONUS_POINTS}", (x1 + 30, status_y),
+                               cv2.FONT_HERSHEY_DUPLEX, 0.78, (255, 120, 220), 2, cv2.LINE_AA)
+            elif status == 'match':
+                canvas.putText("MATCH! Hold steady", (x1 + 20, status_y),
+                               cv2.FONT_HERSHEY_DUPLEX, 0.6, (0, 220, 180), 2, cv2.LINE_AA)
+            elif status == 'ready':
+                canvas.putText("Show this hand pose", (x1 + 15, status_y),
+                               cv2.FONT_HERSHEY_DUPLEX, 0.6, (200, 220, 255), 1, cv2.LINE_AA)
+            else:
+                canvas.putText("New pose incoming...", (x1 + 12, status_y),
+                               cv2.FONT_HERSHEY_DUPLEX, 0.58, (200, 200, 200), 1, cv2.LINE_AA)
+
+        # 제스처/상태가 바뀔 때만 카드를 다시 그리고, 평소에는 캐시된 타일만 합성
+        hud_tiles.draw(frame, 'gesture_prompt', (target, highlight, status), (box_x1 - 2, box_y1 - 2),
+                       (box_x2 - box_x1 + 5, box_y2 - box_y1 + 5), render)
+
+    def draw_mouth_status(frame, is_mouth_open, mouth_ratio):
+        """입 벌림 상태와 Mouth Ratio 문구. 상태 문구는 두 가지뿐이라 타일로 캐시하고, 비율은 값이 바뀔 때만 다시 그림."""
+        status_text = "COLLECTING!" if is_mouth_open else "WAITING"
+        color = (40, 40, 255) if is_mouth_open else (0, 200, 0)
+        hud_tiles.draw(frame, 'mouth_status', status_text, (10, 92), (260, 40),
+                       lambda canvas: canvas.putText(status_text, (10, 28), cv2.FONT_HERSHEY_DUPLEX, 0.9, color, 2,
+                                                     cv2.LINE_AA))
+        dist_text = f"Mouth Ratio: {mouth_ratio:.3f}"
+        hud_tiles.draw(frame, 'mouth_ratio', dist_text, (10, 132), (320, 36),
+                       lambda canvas: canvas.putText(dist_text, (10, 23), cv2.FONT_HERSHEY_DUPLEX, 0.8, (0, 210, 0), 2,
+                                                     cv2.LINE_AA))
+
+    def draw_loading_status(frame):
+        """모델이 준비되는 동안(또는 준비에 실패했을 때) 메뉴 아래에 표시하는 안내 문구."""
+        if models_failed():
+            text = "Face tracking failed. Press 'q' to quit."
+        elif pending_mode is not None:
+            text = f"Starting {pending_mode.upper()} when face tracking is ready..."
         else:
-            cv2.putText(frame, "New pose incoming...", (box_x1 + 12, status_y),
-                        cv2.FONT_HERSHEY_DUPLEX, 0.58, (200, 200, 200), 1, cv2.LINE_AA)
+            text = "Loading face tracking..."
+
+        def render(canvas):
+            (text_w, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_DUPLEX, 0.8, 2)
+            canvas.putText(text, (frame_width // 2 - text_w // 2, 32),
+                           cv2.FONT_HERSHEY_DUPLEX, 0.8, (255, 220, 220), 2, cv2.LINE_AA)
 
+        hud_tiles.draw(frame, 'loading', text, (0, frame_height - 80), (frame_width, 48), render)
+
+    def mouth_state(landmarks):
+        """얼굴 하나의 (입 x, 입 y, 입 벌림 여부)를 픽셀 좌표로 반환합니다."""
+        mouth_landmark = landmarks.landmark[fl.MOUTH_UPPER]
+        ratio = fl.calculate_mouth_dist(landmarks, frame_width, frame_height)
+        return mouth_landmark.x * frame_width, mouth_landmark.y * frame_height, ratio > MOUTH_OPEN_THRESHOLD
 
     def compute_overlay_intensity(hand_data):
         landmarks = hand_data.get('landmarks') or []
@@ -292,18 +518,45 @@ def main():
             return max(0.0, min(1.0, val))
         return 0.0
 
-    print("Christmas Game Filter started. Click a button to choose difficulty. Press 'q' to exit. Press 'p' to pause during play.")
+    def read_frame():
+        return cap.read()
 
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            print("Ignoring empty camera frame.")
-            continue
-        
-        frame = cv2.flip(frame, 1)
+    def run_inference(frame):
+        result = inference.process(frame)
+        if result.media_time is None and trace_reader is None:
+            # 파이프라인 모드에서는 캡처가 앞서 나가므로 cap.media_time()이 아니라 이 프레임의 시각을 실어 보냄
+            result.media_time = cap.frame_media_time(frame)
+        if trace_writer is not None:
+            trace_writer.write(result.media_time, result)
+        return result
 
-        processed_frame, results = fl.process_frame(frame, face_mesh)
-        hand_data = fl.detect_hand_gesture(frame, hand_tracker)
+    model_error_reported = False
+
+    reported_status = None
+
+    def report_model_error():
+        """모델 초기화/실행이 실패했으면 원인을 콘솔에 한 번 출력하고, 워커 재시작 같은 상태 안내는 바뀔 때마다 출력합니다."""
+        nonlocal model_error_reported, reported_status
+        if model_loader is None:
+            return
+        if not model_error_reported and models_failed():
+            model_error_reported = True
+            print(f"Error: Face tracking unavailable: {model_loader.error}")
+        status = model_loader.status
+        if status and status != reported_status and not models_failed():
+            print(f"[inference] {status}")
+        reported_status = status
+
+    def render_frame(inference_result):
+        nonlocal replay_time
+        if inference_result.media_time is not None:
+            replay_time = inference_result.media_time
+        if pending_mode is not None and (models_ready() or models_failed()):
+            launch_mode(pending_mode)
+        report_model_error()
+        processed_frame = inference_result.frame
+        results = inference_result.face_results
+        hand_data = inference_result.hand_data
         detected_gesture = hand_data.get('gesture')
 
         mouth_ratio = 0 # 픽셀이 아닌 비율을 사용
@@ -329,9 +582,6 @@ def main():
             
             # C38: 필터 로직 없이 processed_frame을 시각화 프레임에 할당
             visualized_frame = processed_frame 
-
-            # 충돌 판정 호출
-            game.check_collection(is_mouth_open, mouth_x, mouth_y) 
         else:
             visualized_frame = processed_frame 
             if results.multi_face_landmarks:
@@ -342,7 +592,7 @@ def main():
                 mouth_ratio = fl.calculate_mouth_dist(landmarks, frame_width, frame_height)
                 is_mouth_open = mouth_ratio > MOUTH_OPEN_THRESHOLD
         
-        buttons_for_frame = []
+        ui_layer = None
         overlay_intensity = 0.0
         overlay_color = GESTURE_COLORS.get(detected_gesture) or GESTURE_COLORS.get(gesture_target) or (180, 200, 255)
         if not menu_active:
@@ -353,42 +603,56 @@ def main():
         game.set_gesture_overlay(overlay_intensity, overlay_color)
 
         if not menu_active:
-            game.update()
-            game.draw(visualized_frame)
+            # 검출된 얼굴마다 입 상태를 구해 플레이어 번호에 배정 (얼굴이 없으면 모든 플레이어가 충돌 판정에서 빠짐)
+            game.update_players([mouth_state(landmarks) for landmarks in results.multi_face_landmarks]
+                                if allow_gameplay else [])
+            # 지난 프레임 이후 흐른 시간만큼 고정 틱을 실행 (느린 프레임 뒤에는 여러 틱을 몰아서 처리)
+            for _ in range(game_clock.advance()):
+                if allow_gameplay:
+                    # 모든 플레이어의 입을 한 번에 충돌 판정 (틱마다 최신 입 위치 기준)
+                    game.check_players()
+                with timers.measure('game.update'):
+                    game.update()
+                update_gesture_cycle(detected_gesture)
+            game.draw(visualized_frame, game_clock.alpha)
             if game.game_over:
-                buttons_for_frame = build_replay_buttons()
-            update_gesture_cycle(detected_gesture)
+                ui_layer = get_ui_layer('replay', visualized_frame)
         else:
-            draw_menu_overlay(visualized_frame, "Christmas Catch", "Open wide to grab the gifts!")
-            buttons_for_frame = build_difficulty_buttons()
-
-        if buttons_for_frame:
-            draw_buttons(visualized_frame, buttons_for_frame)
-        set_buttons(buttons_for_frame)
+            ui_layer = get_ui_layer('menu', visualized_frame)
+
+        if ui_layer is not None:
+            ui_layer.draw(visualized_frame)
+        set_ui_layer(ui_layer)
+        if (menu_active and not models_ready()) or models_failed():
+            draw_loading_status(visualized_frame)
+
+        # 제스처 판정이 필요한 동안에만 Hands를 매 프레임 실행
+        hand_scheduler.set_active(not menu_active and gesture_ready and gesture_success_timer == 0)
+        # 메뉴/일시 정지/게임 오버 중에는 추론을 저빈도 keep-alive로 낮춤 (게임 중에는 매 프레임 추론)
+        inference.set_idle(menu_active or game.paused or game.game_over)
         
         if not menu_active:
-            # 입 벌림 상태 시각화
-            status_text = "COLLECTING!" if is_mouth_open else "WAITING"
-            color = (40, 40, 255) if is_mouth_open else (0, 200, 0)
-            cv2.putText(visualized_frame, status_text, (20, 120), 
-                        cv2.FONT_HERSHEY_DUPLEX, 0.9, color, 2, cv2.LINE_AA)
-            
-            dist_text = f"Mouth Ratio: {mouth_ratio:.3f}"
-            cv2.putText(visualized_frame, dist_text, (20, 155), 
-                        cv2.FONT_HERSHEY_DUPLEX, 0.8, (0, 210, 0), 2, cv2.LINE_AA)
+            if not game.multiplayer:
+                # 입 벌림 상태 시각화 (멀티플레이어는 게임이 입마다 플레이어 번호를 그림)
+                draw_mouth_status(visualized_frame, is_mouth_open, mouth_ratio)
 
             draw_gesture_prompt(visualized_frame, gesture_target, detected_gesture, gesture_ready, gesture_success_timer)
 
-        # 최종 프레임 표시
-        cv2.imshow(window_name, visualized_frame)
+        if show_profile_overlay:
+            timers.draw_overlay(visualized_frame)
 
-        # -----------------
-        # 키 입력 처리 (Pause, Restart)
-        # -----------------
-        key = cv2.waitKey(5) & 0xFF
-        
+        return visualized_frame
+
+    def handle_key(key):
+        """키 입력을 처리합니다. 종료 요청이면 False를 반환합니다."""
+        nonlocal show_profile_overlay
         if key == ord('q'):
-            break
+            return False
+
+        # 'o' 키: 프로파일 오버레이 토글 (계측이 꺼져 있었다면 이때부터 수집)
+        if key == ord('o'):
+            show_profile_overlay = not show_profile_overlay
+            timers.enabled = timers.enabled or show_profile_overlay
         
         # 'p' 키: 일시 정지/재개 토글
         if key == ord('p') and not menu_active and not game.game_over:
@@ -405,13 +669,114 @@ def main():
                 launch_mode('normal')
             elif key == ord('3'):
                 launch_mode('hard')
-        # -----------------
+        return True
+
+    stats_started = time.perf_counter()
+
+    def record_latency(frame):
+        """캡처 시각부터 imshow까지 걸린 시간을 'latency' 스테이지로 기록합니다."""
+        if not timers.enabled:
+            return
+        captured_at = cap.capture_time(frame)
+        if captured_at is not None:
+            timers.record('latency', time.perf_counter() - captured_at)
+
+    startup_reported = False
+
+    def note_frame_shown():
+        """첫 프레임 표시 시각을 기록하고, 모델이 준비되면 시작 단계별 시간을 한 번 출력합니다."""
+        nonlocal startup_reported
+        startup.mark('first frame')
+        if not startup_reported and models_ready():
+            startup_reported = True
+            print(startup.format_report())
+
+    def maybe_print_stats():
+        nonlocal stats_started
+        if not args.stats:
+            return
+        elapsed = time.perf_counter() - stats_started
+        if elapsed >= PIPELINE_STATS_INTERVAL:
+            print(f"[stats] {timers.format_report(elapsed)}")
+            timers.reset()
+            stats_started = time.perf_counter()
+
+    print("Christmas Game Filter started. Click a button to choose difficulty. Press 'q' to exit. Press 'p' to pause during play.")
+    if args.difficulty:
+        launch_mode(args.difficulty)
+
+    if args.pipeline:
+        # 캡처/추론은 워커 스레드에서, 게임 로직과 표시(HighGUI)는 메인 스레드에서 실행
+        frame_pipeline = pl.FramePipeline(read_frame, run_inference, timers, release_frame=cap.recycle,
+                                          release_result=lambda result: cap.recycle(result.frame))
+        frame_pipeline.start()
+        while frame_pipeline.running:
+            item = frame_pipeline.get_result(timeout=0.5)
+            if item is None:
+                continue
+            with timers.measure('render'):
+                visualized_frame = render_frame(item)
+            with timers.measure('imshow'):
+                cv2.imshow(window_name, visualized_frame)
+            record_latency(visualized_frame)
+            # imshow가 화면에 복사했으므로 캡처 버퍼를 풀로 돌려줌
+            cap.recycle(item.frame)
+            note_frame_shown()
+            with timers.measure('waitKey'):
+                key = cv2.waitKey(1) & 0xFF
+            maybe_print_stats()
+            if not handle_key(key):
+                break
+        frame_pipeline.stop()
+        if frame_pipeline.error is not None:
+            print(f"Inference worker stopped: {frame_pipeline.error}")
+    else:
+        while cap.isOpened():
+            with timers.measure('capture'):
+                ret, frame = read_frame()
+            if ret is None:
+                break
+            if not ret:
+                print("Ignoring empty camera frame.")
+                continue
+
+            with timers.measure('inference'):
+                inference_result = run_inference(frame)
+            with timers.measure('render'):
+                visualized_frame = render_frame(inference_result)
+
+            # 최종 프레임 표시
+            with timers.measure('imshow'):
+                cv2.imshow(window_name, visualized_frame)
+            record_latency(visualized_frame)
+            cap.recycle(inference_result.frame)
+            note_frame_shown()
+            with timers.measure('waitKey'):
+                key = cv2.waitKey(5) & 0xFF
+            maybe_print_stats()
+
+            # -----------------
+            # 키 입력 처리 (Pause, Restart)
+            # -----------------
+            if not handle_key(key):
+                break
+            # -----------------
+
+    if args.profile_out:
+        timers.export(args.profile_out, args.profile_label)
+        print(f"Profile written to {args.profile_out}")
 
     # 자원 해제
     cap.release()
     cv2.destroyAllWindows()
-    face_mesh.close()
-    hand_tracker.close()
+    inference.close()
+    if face_mesh is not None:
+        face_mesh.close()
+    if hand_tracker is not None:
+        hand_tracker.close()
+    if trace_writer is not None:
+        trace_writer.close()
+        print(f"Landmark trace ({trace_writer.frames} frames) written to {args.record_trace}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,196 @@
+import threading
+import time
+
+
+class LatestQueue:
+    """
+    가장 최근 항목 하나만 보관하는 큐입니다. 새 항목이 들어오면 이전 항목은 버려집니다.
+    on_drop이 있으면 버려진 항목으로 호출합니다. (예: 프레임 버퍼를 입력 소스의 풀로 돌려줌)
+    """
+
+    def __init__(self, on_drop=None):
+        self._cond = threading.Condition()
+        self._item = None
+        self._has_item = False
+        self._closed = False
+        self.on_drop = on_drop
+        self.dropped = 0
+
+    def put(self, item):
+        with self._cond:
+            dropped = self._item if self._has_item else None
+            if self._has_item:
+                self.dropped += 1
+            self._item = item
+            self._has_item = True
+            self._cond.notify()
+        if dropped is not None and self.on_drop is not None:
+            self.on_drop(dropped)
+
+    def get(self, timeout=None):
+        """항목을 꺼냅니다. 시간 초과 또는 큐가 닫히면 None을 반환합니다."""
+        with self._cond:
+            if not self._has_item and not self._closed:
+                self._cond.wait(timeout)
+            if not self._has_item:
+                return None
+            item = self._item
+            self._item = None
+            self._has_item = False
+            return item
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def drained(self):
+        """큐가 닫혔고 남은 항목도 없으면 True입니다."""
+        with self._cond:
+            return self._closed and not self._has_item
+
+
+class _StageMeasure:
+    def __init__(self, timers, name):
+        self.timers = timers
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timers.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class StageTimers:
+    """스테이지별 처리 시간(횟수, 누적, 최근 값)을 스레드 안전하게 집계합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def measure(self, name):
+        return _StageMeasure(self, name)
+
+    def record(self, name, elapsed):
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                stat = {'count': 0, 'total': 0.0, 'last': 0.0, 'max': 0.0}
+                self._stats[name] = stat
+            stat['count'] += 1
+            stat['total'] += elapsed
+            stat['last'] = elapsed
+            stat['max'] = max(stat['max'], elapsed)
+
+    def snapshot(self):
+        with self._lock:
+            return {name: dict(stat) for name, stat in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def bottleneck(self):
+        """평균 처리 시간이 가장 긴 스테이지 이름을 반환합니다."""
+        stats = self.snapshot()
+        if not stats:
+            return None
+        return max(stats, key=lambda name: stats[name]['total'] / max(1, stats[name]['count']))
+
+    def format_report(self, elapsed=None):
+        stats = self.snapshot()
+        parts = []
+        for name, stat in stats.items():
+            avg_ms = stat['total'] / max(1, stat['count']) * 1000
+            part = f"{name}: {avg_ms:.1f}ms avg / {stat['max'] * 1000:.1f}ms max"
+            if elapsed:
+                part += f" ({stat['count'] / elapsed:.1f}/s)"
+            parts.append(part)
+        bottleneck = self.bottleneck()
+        if bottleneck:
+            parts.append(f"bottleneck={bottleneck}")
+        return " | ".join(parts)
+
+
+class FramePipeline:
+    """
+    캡처 스레드 → 추론 워커 → 렌더 루프(호출 스레드)로 이어지는 스테이지 파이프라인입니다.
+    스테이지 사이는 LatestQueue로 연결되므로 느린 스테이지는 최신 프레임만 받아 처리하고,
+    표시 프레임률은 스테이지 시간의 합이 아니라 가장 느린 스테이지에 의해 결정됩니다.
+
+    read_frame(): (ok, frame) 반환. ok가 None이면 입력 종료로 간주합니다.
+    infer(frame): 렌더 루프로 넘길 결과를 반환합니다.
+    release_frame(frame) / release_result(result): 큐에서 버려져 렌더 루프까지 가지 못한 프레임/결과로 호출합니다.
+    렌더 루프가 받은 결과는 표시한 뒤 호출하는 쪽이 직접 돌려줍니다.
+    """
+
+    def __init__(self, read_frame, infer, timers=None, release_frame=None, release_result=None):
+        self.read_frame = read_frame
+        self.infer = infer
+        self.timers = timers or StageTimers()
+        self.frame_queue = LatestQueue(on_drop=release_frame)
+        self.result_queue = LatestQueue(on_drop=release_result)
+        self._stop_event = threading.Event()
+        self._threads = []
+        self.error = None
+
+    @property
+    def running(self):
+        """렌더 루프가 더 받을 결과가 남아 있으면 True입니다."""
+        return not self.result_queue.drained
+
+    def start(self):
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name='capture', daemon=True),
+            threading.Thread(target=self._inference_loop, name='inference', daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout=2.0):
+        self._stop_event.set()
+        self.frame_queue.close()
+        self.result_queue.close()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def get_result(self, timeout=0.5):
+        """추론이 끝난 최신 결과를 꺼냅니다. 준비된 결과가 없으면 None을 반환합니다."""
+        return self.result_queue.get(timeout)
+
+    def _capture_loop(self):
+        while not self._stop_event.is_set():
+            with self.timers.measure('capture'):
+                ok, frame = self.read_frame()
+            if ok is None:
+                # 입력 소스가 끝났거나 닫힘: 남은 프레임은 추론 워커가 마저 처리
+                break
+            if not ok:
+                time.sleep(0.005)
+                continue
+            self.frame_queue.put(frame)
+        self.frame_queue.close()
+
+    def _inference_loop(self):
+        while not self._stop_event.is_set():
+            frame = self.frame_queue.get(timeout=0.1)
+            if frame is None:
+                if self.frame_queue.drained:
+                    break
+                continue
+            try:
+                with self.timers.measure('inference'):
+                    result = self.infer(frame)
+            except Exception as exc:
+                self.error = exc
+                self._stop_event.set()
+                break
+            self.result_queue.put(result)
+        self.result_queue.close()
@@ -0,0 +1,209 @@
+import csv
+import json
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from pipeline import StageTimers
+
+# 스테이지별로 백분위를 계산할 최근 샘플 수
+PROFILE_WINDOW = 600
+# 오버레이 텍스트(백분위)를 다시 계산하는 주기 (초)
+OVERLAY_REFRESH_INTERVAL = 0.5
+PERCENTILES = (50, 95, 99)
+
+
+class _NullMeasure:
+    """비활성 프로파일러가 돌려주는 아무 일도 하지 않는 컨텍스트 매니저입니다."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_MEASURE = _NullMeasure()
+
+
+class FrameProfiler(StageTimers):
+    """
+    StageTimers에 스테이지별 최근 window개 샘플 링 버퍼를 더해 p50/p95/p99를 계산하는 프로파일러입니다.
+    reset()은 StageTimers의 주기 집계(--stats)만 비우고, 링 버퍼와 실행 전체 누적값은 clear()로만 비웁니다.
+    enabled가 False면 measure()가 공유 no-op 컨텍스트를 돌려주므로 계측 지점의 비용은 메서드 호출 한 번뿐입니다.
+    """
+
+    def __init__(self, enabled=True, window=PROFILE_WINDOW):
+        super().__init__()
+        self.enabled = enabled
+        self.window = window
+        self._samples = {}
+        self._overlay_lines = []
+        self._overlay_updated = 0.0
+
+    def measure(self, name):
+        if not self.enabled:
+            return _NULL_MEASURE
+        return super().measure(name)
+
+    def record(self, name, elapsed):
+        super().record(name, elapsed)
+        with self._lock:
+            ring = self._samples.get(name)
+            if ring is None:
+                ring = {'buffer': np.zeros(self.window, dtype=np.float64), 'count': 0, 'total': 0.0, 'max': 0.0}
+                self._samples[name] = ring
+            ring['buffer'][ring['count'] % self.window] = elapsed
+            ring['count'] += 1
+            ring['total'] += elapsed
+            ring['max'] = max(ring['max'], elapsed)
+
+    def clear(self):
+        """주기 집계와 링 버퍼, 실행 전체 누적값을 모두 비웁니다."""
+        self.reset()
+        with self._lock:
+            self._samples = {}
+
+    def percentiles(self, name):
+        """최근 샘플의 {p50, p95, p99} (초)를 반환합니다. 샘플이 없으면 None."""
+        with self._lock:
+            ring = self._samples.get(name)
+            if ring is None:
+                return None
+            samples = ring['buffer'][:min(ring['count'], self.window)].copy()
+        values = np.percentile(samples, PERCENTILES)
+        return {f"p{p}": float(v) for p, v in zip(PERCENTILES, values)}
+
+    def summary(self):
+        """스테이지별 실행 전체 count, mean, max와 최근 window 기준 백분위를 반환합니다. (값은 밀리초)"""
+        with self._lock:
+            totals = {name: (ring['count'], ring['total'], ring['max']) for name, ring in self._samples.items()}
+        rows = {}
+        for name, (count, total, max_elapsed) in totals.items():
+            row = {
+                'count': count,
+                'mean_ms': total / max(1, count) * 1000,
+                'max_ms': max_elapsed * 1000
+            }
+            for key, value in (self.percentiles(name) or {}).items():
+                row[f"{key}_ms"] = value * 1000
+            rows[name] = row
+        return rows
+
+    def export_csv(self, path, label=''):
+        """summary()를 스테이지당 한 행으로 저장합니다. label로 빌드/설정을 구분합니다."""
+        fields = ['label', 'stage', 'count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms']
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for name, row in self.summary().items():
+                writer.writerow({'label': label, 'stage': name,
+                                 **{key: round(value, 4) if isinstance(value, float) else value
+                                    for key, value in row.items()}})
+
+    def export_json(self, path, label=''):
+        with open(path, 'w') as f:
+            json.dump({'label': label, 'window': self.window, 'stages': self.summary()}, f, indent=2)
+
+    def export(self, path, label=''):
+        """확장자(.csv / .json)에 맞춰 저장합니다."""
+        if path.lower().endswith('.csv'):
+            self.export_csv(path, label)
+        else:
+            self.export_json(path, label)
+
+    def draw_overlay(self, frame, origin=None):
+        """
+        스테이지별 p50/p95/p99 표를 그립니다. (기본 위치: 점수 HUD 아래 오른쪽)
+        백분위는 OVERLAY_REFRESH_INTERVAL마다 다시 계산합니다.
+        """
+        now = time.perf_counter()
+        if now - self._overlay_updated >= OVERLAY_REFRESH_INTERVAL:
+            self._overlay_updated = now
+            self._overlay_lines = ["stage            p50   p95   p99 ms"]
+            with self._lock:
+                names = sorted(self._samples)
+            for name in names:
+                p = self.percentiles(name)
+                if p is not None:
+                    self._overlay_lines.append(
+                        f"{name:<15}{p['p50'] * 1000:6.1f}{p['p95'] * 1000:6.1f}{p['p99'] * 1000:6.1f}")
+        if not self._overlay_lines:
+            return
+        line_height = 18
+        height, width = frame.shape[:2]
+        x, y = origin if origin is not None else (max(0, width - 340), 180)
+        x2 = min(width, x + 330)
+        y2 = min(height, y + line_height * len(self._overlay_lines) + 10)
+        if x < x2 and y < y2:
+            panel = frame[y:y2, x:x2]
+            cv2.addWeighted(panel, 0.35, panel, 0, 0, dst=panel)
+        for idx, line in enumerate(self._overlay_lines):
+            cv2.putText(frame, line, (x + 6, y + 16 + idx * line_height),
+                        cv2.FONT_HERSHEY_PLAIN, 1.0, (220, 255, 220), 1, cv2.LINE_AA)
+
+
+# 계측 지점에서 기본값으로 쓰는 비활성 프로파일러
+NULL_PROFILER = FrameProfiler(enabled=False)
+
+
+class _StartupMeasure:
+    def __init__(self, timeline, name):
+        self.timeline = timeline
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.timeline.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class StartupTimeline:
+    """
+    시작 과정의 단계별 시간을 기록합니다. (mediapipe import, 모델 생성, 워밍업 추론, 첫 프레임 표시 등)
+    measure(name)는 걸린 시간을, mark(name)는 origin(main() 시작)부터 그 시점까지의 시간을 처음 한 번만 기록합니다.
+    profiler가 켜져 있으면 같은 값을 'startup.<name>' 스테이지로도 기록해 --profile-out에 함께 남깁니다.
+    """
+
+    def __init__(self, origin=None, profiler=None, enabled=True):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.profiler = profiler
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def measure(self, name):
+        if not self.enabled:
+            return _NULL_MEASURE
+        return _StartupMeasure(self, name)
+
+    def mark(self, name):
+        if self.enabled and name not in self._entries:
+            self.record(name, time.perf_counter() - self.origin)
+
+    def record(self, name, elapsed):
+        with self._lock:
+            if name in self._entries:
+                return
+            self._entries[name] = elapsed
+        if self.profiler is not None and self.profiler.enabled:
+            self.profiler.record(f"startup.{name}", elapsed)
+
+    def get(self, name):
+        return self._entries.get(name)
+
+    def format_report(self):
+        with self._lock:
+            entries = list(self._entries.items())
+        return "Startup: " + ", ".join(f"{name} {elapsed:.2f}s" for name, elapsed in entries)
+
+
+# 계측 지점에서 기본값으로 쓰는 비활성 시작 타임라인
+NULL_STARTUP = StartupTimeline(enabled=False)
@@ -0,0 +1,108 @@
+"""웹캠/창 없이 합성 입 궤적으로 ChristmasGame 로직만 돌리는 헤드리스 시뮬레이션입니다."""
+import math
+import random
+
+import game_logic as gl
+
+
+class GreedyMouthController:
+    """
+    가장 아래(가장 급한) 수집 아이템을 향해 입을 옮기고 석탄은 좌우로 피하는 합성 플레이어입니다.
+    객체마다 GameObjectView를 만들지 않고 game.objects(GameObjectStore)의 열 배열을 직접 읽어 목표와 위험물을 고릅니다.
+    """
+
+    def __init__(self, width, height, rng, max_step=22.0, mouth_y_ratio=0.62, reaction=0.9):
+        self.width = width
+        self.height = height
+        self.rng = rng
+        self.max_step = max_step
+        self.reaction = reaction
+        self.x = width / 2
+        self.y = height * mouth_y_ratio
+        # type_id → 수집 아이템 여부 (저장소에 새 종류가 등록되면 다시 만듦)
+        self._collectible = []
+
+    def _collectible_lookup(self, game, store):
+        if len(self._collectible) != len(store.type_names):
+            self._collectible = [game.item_properties.get(name, {}).get('category') == 'collectible'
+                                 for name in store.type_names]
+        return self._collectible
+
+    def step(self, game):
+        store = game.objects
+        n = store.count
+        collectible = self._collectible_lookup(game, store)
+        target = hazard = None
+        target_y = hazard_y = None
+        # 살아 있는 객체가 보통 몇 개뿐이라 배열 연산 여러 번보다 열을 한 번 리스트로 꺼내 도는 쪽이 쌈
+        for slot, (active, type_id, x, y, size) in enumerate(zip(store.active[:n].tolist(), store.type_id[:n].tolist(),
+                                                                 store.x[:n].tolist(), store.y[:n].tolist(),
+                                                                 store.size[:n].tolist())):
+            if not active or y > self.y + size:
+                continue
+            if collectible[type_id]:
+                if target is None or y > target_y:
+                    target, target_y = slot, y
+            elif abs(x - self.x) < size * 1.2 and (hazard is None or y > hazard_y):
+                hazard, hazard_y = slot, y
+
+        goal_x = self.x
+        if hazard is not None and self.y - hazard_y < store.size[hazard] * 2.5:
+            # 석탄이 가까우면 반대쪽으로 회피
+            hazard_x, hazard_size = float(store.x[hazard]), int(store.size[hazard])
+            goal_x = hazard_x + (hazard_size * 1.5 if self.x >= hazard_x else -hazard_size * 1.5)
+        elif target is not None and self.rng.random() < self.reaction:
+            goal_x = float(store.x[target])
+
+        delta = max(-self.max_step, min(self.max_step, goal_x - self.x))
+        self.x = max(0.0, min(float(self.width), self.x + delta))
+        is_open = target is not None and abs(target_y - self.y) < store.size[target] * 1.5
+        return is_open, self.x, self.y
+
+
+class SweepMouthController:
+    """입을 벌린 채 화면을 좌우로 천천히 훑는 단순 궤적입니다. (기준선용)"""
+
+    def __init__(self, width, height, rng, period_frames=240, mouth_y_ratio=0.62):
+        self.width = width
+        self.phase = rng.uniform(0, math.pi * 2)
+        self.period_frames = period_frames
+        self.y = height * mouth_y_ratio
+        self.frame = 0
+
+    def step(self, game):
+        self.frame += 1
+        t = self.phase + self.frame * (math.pi * 2 / self.period_frames)
+        x = self.width / 2 + math.sin(t) * self.width * 0.4
+        return True, x, self.y
+
+
+CONTROLLERS = {
+    'greedy': GreedyMouthController,
+    'sweep': SweepMouthController
+}
+
+
+def simulate_run(difficulty='normal', seed=0, max_frames=3600, controller='greedy', width=1280, height=720):
+    """한 판을 게임 오버 또는 max_frames까지 진행하고 결과 요약을 반환합니다."""
+    game = gl.ChristmasGame(width, height, seed=seed, render=False)
+    game.start_new_run(difficulty)
+    mouth = CONTROLLERS[controller](width, height, random.Random(seed * 7919 + 1))
+
+    frames = 0
+    while frames < max_frames and not game.game_over:
+        is_open, mouth_x, mouth_y = mouth.step(game)
+        game.check_collection(is_open, mouth_x, mouth_y)
+        game.update()
+        frames += 1
+
+    return {
+        'difficulty': game.current_difficulty,
+        'seed': seed,
+        'frames': frames,
+        'score': game.score,
+        'level': game.level,
+        'lives': game.lives,
+        'game_over': game.game_over,
+        'collected': dict(game.collection_counts)
+    }
@@ -0,0 +1,157 @@
+import cv2
+import numpy as np
+
+# 아틀라스에 미리 그려 두는 최대 반지름. 배경 파티클(크기 2~4.5, 제스처 강도 최대에서 2.9배 → 13px)과
+# 보너스 폭발(3~6px)의 전체 범위를 덮으며, 더 큰 반지름은 이 크기로 잘라 그립니다. (cv2.circle 대체 경로 없음)
+SPRITE_MAX_RADIUS = 13
+
+
+class DiscSpriteAtlas:
+    """
+    정수 반지름별로 안티앨리어싱된 원을 미리 래스터화해 둔 스프라이트 아틀라스입니다.
+    각 원은 (dx, dy, coverage) 픽셀 오프셋으로 저장되어, 파티클 수천 개를
+    cv2.circle 호출 대신 반지름 그룹당 몇 번의 NumPy gather/scatter로 합성합니다.
+    """
+
+    def __init__(self, sprite_max_radius=SPRITE_MAX_RADIUS):
+        self.sprite_max_radius = sprite_max_radius
+        self.discs = {}
+        for radius in range(1, sprite_max_radius + 1):
+            # LINE_AA 원은 반지름 바깥 1px까지 번지므로 여유를 둔 캔버스에 그림
+            center = radius + 2
+            canvas = np.zeros((center * 2 + 1, center * 2 + 1), dtype=np.uint8)
+            cv2.circle(canvas, (center, center), radius, 255, -1, cv2.LINE_AA)
+            ys, xs = np.nonzero(canvas)
+            self.discs[radius] = ((xs - center).astype(np.intp), (ys - center).astype(np.intp),
+                                  canvas[ys, xs].astype(np.uint16), center)
+        self._flat_offsets = {}
+
+    def _get_flat_offsets(self, radius, width):
+        """(dy * width + dx) * 3 + channel 형태로 펼친 원 픽셀의 바이트 오프셋을 반환합니다."""
+        key = (radius, width)
+        offsets = self._flat_offsets.get(key)
+        if offsets is None:
+            dx, dy, _, _ = self.discs[radius]
+            offsets = ((dy * width + dx)[:, None] * 3 + np.arange(3)[None, :]).ravel()
+            self._flat_offsets[key] = offsets
+        return offsets
+
+    def _stamp(self, frame, xs, ys, radii, colors, additive, alpha=1.0):
+        """
+        반지름 그룹별로 원 픽셀을 모아 한 번에 합성합니다.
+        additive=True: frame += color * coverage * alpha
+        additive=False: frame = frame * (1 - coverage) + color * coverage
+        겹치는 픽셀은 마지막 파티클 값이 남습니다.
+        """
+        height, width = frame.shape[:2]
+        flat_frame = frame.reshape(-1)
+        for radius in np.unique(radii).tolist():
+            members = radii == radius
+            px = xs[members]
+            py = ys[members]
+            color = colors[members]
+            dx, dy, coverage, margin = self.discs[radius]
+
+            inside = (px >= margin) & (px < width - margin) & (py >= margin) & (py < height - margin)
+            if inside.any():
+                # 화면 안쪽 파티클: 경계 검사 없이 펼친 오프셋으로 바로 gather/scatter
+                base = (py[inside].astype(np.intp) * width + px[inside]) * 3
+                flat = (base[:, None] + self._get_flat_offsets(radius, width)[None, :]).ravel()
+                values = self._blend(np.take(flat_frame, flat).reshape(-1, len(coverage), 3),
+                                     color[inside][:, None, :], coverage[None, :, None], additive, alpha)
+                flat_frame[flat] = values.ravel()
+
+            edge = ~inside
+            if edge.any():
+                # 화면 가장자리 파티클: 화면 밖 픽셀을 걸러낸 뒤 합성
+                ex = px[edge][:, None] + dx[None, :]
+                ey = py[edge][:, None] + dy[None, :]
+                valid = (ex >= 0) & (ex < width) & (ey >= 0) & (ey < height)
+                particle_idx, pixel_idx = np.nonzero(valid)
+                ex = ex[valid]
+                ey = ey[valid]
+                values = self._blend(frame[ey, ex], color[edge][particle_idx],
+                                     coverage[pixel_idx][:, None], additive, alpha)
+                frame[ey, ex] = values
+
+    @staticmethod
+    def _blend(dst, color, coverage, additive, alpha):
+        # 8비트 고정소수점 정수 연산: coverage는 0..255
+        dst = dst.astype(np.uint16)
+        if additive:
+            dst += (color * alpha).astype(np.uint16) * coverage // 255
+            np.minimum(dst, 255, out=dst)
+        else:
+            color = color.astype(np.uint16)
+            dst = (dst * (255 - coverage) + color * coverage + 127) // 255
+        return dst.astype(np.uint8)
+
+    def blit_additive(self, frame, xs, ys, radii, colors, alpha):
+        """검은 오버레이에 원을 그린 뒤 cv2.addWeighted(overlay, alpha, frame, 1.0)로 더한 것과 같은 합성입니다."""
+        self._stamp(frame, xs, ys, self._clamp(radii), colors, True, alpha)
+
+    def blit_over(self, frame, xs, ys, radii, colors):
+        """cv2.circle(..., -1, cv2.LINE_AA)처럼 불투명 원을 커버리지 비율로 프레임 위에 합성합니다."""
+        self._stamp(frame, xs, ys, self._clamp(radii), colors, False)
+
+    def _clamp(self, radii):
+        return np.clip(radii, 1, self.sprite_max_radius)
+
+
+class PremultipliedSprite:
+    """
+    로드 시점에 알파를 미리 곱해 둔 스프라이트입니다.
+    premultiplied: BGR * alpha / 255 (uint8), inv_alpha: 255 - alpha를 3채널로 복제한 값 (uint8)
+    합성은 dst = dst * inv_alpha / 255 + premultiplied 로, 프레임마다 float 변환 없이 cv2 정수 연산 두 번으로 끝납니다.
+    """
+
+    def __init__(self, image):
+        if image.ndim == 3 and image.shape[2] == 4:
+            alpha = image[:, :, 3:4].astype(np.uint16)
+            bgr = image[:, :, :3].astype(np.uint16)
+            self.premultiplied = ((bgr * alpha + 127) // 255).astype(np.uint8)
+            self.inv_alpha = np.repeat((255 - alpha).astype(np.uint8), 3, axis=2)
+            self.opaque = False
+        else:
+            self.premultiplied = np.ascontiguousarray(image[:, :, :3])
+            self.inv_alpha = None
+            self.opaque = True
+        self.height, self.width = self.premultiplied.shape[:2]
+
+    @classmethod
+    def from_premultiplied(cls, premultiplied, inv_alpha):
+        """이미 알파를 곱한 BGR과 3채널 inv_alpha(255 - alpha)로 만듭니다. 배열은 복사하지 않습니다."""
+        sprite = cls.__new__(cls)
+        sprite.premultiplied = premultiplied
+        sprite.inv_alpha = inv_alpha
+        sprite.opaque = False
+        sprite.height, sprite.width = premultiplied.shape[:2]
+        return sprite
+
+    def blit(self, frame, x, y):
+        """스프라이트 왼쪽 위를 (x, y)에 두고 합성합니다. 화면 가장자리에 걸친 부분은 잘라서 그립니다."""
+        frame_height, frame_width = frame.shape[:2]
+        x1, y1 = max(x, 0), max(y, 0)
+        x2, y2 = min(x + self.width, frame_width), min(y + self.height, frame_height)
+        if x1 >= x2 or y1 >= y2:
+            return
+        sx1, sy1 = x1 - x, y1 - y
+        sx2, sy2 = sx1 + (x2 - x1), sy1 + (y2 - y1)
+
+        roi = frame[y1:y2, x1:x2]
+        premultiplied = self.premultiplied[sy1:sy2, sx1:sx2]
+        if self.opaque:
+            roi[:] = premultiplied
+            return
+        cv2.multiply(roi, self.inv_alpha[sy1:sy2, sx1:sx2], dst=roi, scale=1 / 255.0)
+        cv2.add(roi, premultiplied, dst=roi)
+
+
+_disc_atlas = None
+
+def get_disc_atlas():
+    """프로세스 전체에서 공유하는 원 스프라이트 아틀라스를 반환합니다."""
+    global _disc_atlas
+    if _disc_atlas is None:
+        _disc_atlas = DiscSpriteAtlas()
+    return _disc_atlas
@@ -0,0 +1,53 @@
+import time
+
+# 게임 로직 1틱의 길이. 게임의 모든 타이머와 속도는 이 틱 단위(초당 60틱)로 정의되어 있습니다.
+SIM_TICK_RATE = 60
+# 한 렌더 프레임에서 따라잡을 수 있는 최대 틱 수. 넘치는 시간은 버려 게임이 잠시 느려지는 쪽을 택합니다.
+MAX_CATCH_UP_TICKS = 8
+
+
+class FixedTimestepClock:
+    """
+    실제 경과 시간을 고정 길이 틱으로 나눠 주는 게임 시계입니다.
+    렌더/추론 프레임률과 관계없이 게임 로직은 항상 초당 tick_rate번 진행되고,
+    느린 프레임 뒤에는 여러 틱을 몰아서 실행하며, 남은 시간 비율(alpha)로 렌더링을 보간합니다.
+    """
+
+    def __init__(self, tick_rate=SIM_TICK_RATE, max_catch_up=MAX_CATCH_UP_TICKS, time_source=time.perf_counter):
+        self.tick_rate = tick_rate
+        self.tick_duration = 1.0 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.time_source = time_source
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped_time = 0.0
+        self._last_time = None
+
+    def reset(self, now=None):
+        """누적 시간을 비웁니다. 메뉴처럼 게임이 멈춰 있던 구간이 틱으로 몰려오지 않게 할 때 호출합니다."""
+        self.accumulator = 0.0
+        self._last_time = self.time_source() if now is None else now
+
+    def advance(self, now=None):
+        """마지막 호출 이후 흐른 시간만큼 실행해야 할 틱 수를 반환합니다."""
+        if now is None:
+            now = self.time_source()
+        if self._last_time is None:
+            self._last_time = now
+        self.accumulator += max(0.0, now - self._last_time)
+        self._last_time = now
+
+        steps = int(self.accumulator / self.tick_duration)
+        if steps > self.max_catch_up:
+            # 과부하: 따라잡지 못할 시간은 버림 (무한 따라잡기 방지)
+            self.dropped_time += (steps - self.max_catch_up) * self.tick_duration
+            steps = self.max_catch_up
+            self.accumulator = steps * self.tick_duration + self.accumulator % self.tick_duration
+        self.accumulator -= steps * self.tick_duration
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """마지막 틱 이후 다음 틱까지 진행된 비율 (0..1). 이전/현재 틱 상태 보간에 사용합니다."""
+        return min(1.0, self.accumulator / self.tick_duration)
@@ -0,0 +1,81 @@
+import cv2
+
+from hud import HudCanvas
+
+
+class UiButton:
+    """클릭할 수 있는 사각형 버튼 하나입니다. rect는 (x1, y1, x2, y2), action은 클릭 시 호출할 함수입니다."""
+
+    # 버튼 테두리 안티앨리어싱이 사각형 바깥으로 번지는 폭
+    MARGIN = 2
+
+    def __init__(self, rect, label, subtitle, color, action):
+        self.rect = rect
+        self.label = label
+        self.subtitle = subtitle
+        self.color = color
+        self.action = action
+
+    def contains(self, x, y):
+        x1, y1, x2, y2 = self.rect
+        return x1 <= x <= x2 and y1 <= y <= y2
+
+    def render(self, canvas):
+        """버튼을 (x1 - MARGIN, y1 - MARGIN)을 원점으로 하는 캔버스에 그립니다."""
+        x1, y1, x2, y2 = self.rect
+        m = self.MARGIN
+        width, height = x2 - x1, y2 - y1
+        canvas.fill_rect((m, m), (m + width, m + height), self.color, 0.75)
+        canvas.rectangle((m, m), (m + width, m + height), (255, 255, 255), 2, cv2.LINE_AA)
+        text_y = m + height // 2 + 8
+        canvas.putText(self.label, (m + 25, text_y),
+                       cv2.FONT_HERSHEY_DUPLEX, 0.9, (255, 255, 255), 2, cv2.LINE_AA)
+        if self.subtitle:
+            canvas.putText(self.subtitle, (m + 25, m + height - 12),
+                           cv2.FONT_HERSHEY_DUPLEX, 0.58, (255, 255, 255), 1, cv2.LINE_AA)
+
+
+class UiLayer:
+    """
+    메뉴/리플레이 화면처럼 모양이 바뀌지 않는 UI를 해상도마다 한 번 미리 그려 둔 레이어입니다.
+    패널과 버튼은 알파를 미리 곱한 패치(hud.HudCanvas)로 만들어 두고, draw()는 각 패치의 경계 상자만 합성합니다.
+    tint가 있으면 먼저 화면 전체를 SolidBlendCache.blend_solid로 제자리에서 물들입니다. 프레임 복사는 하지 않습니다.
+    """
+
+    def __init__(self, width, height, tint=None, solid_blend=None):
+        self.width = width
+        self.height = height
+        # (color, alpha) 전체 화면 색조
+        self.tint = tint
+        self.solid_blend = solid_blend
+        self.buttons = []
+        self._patches = []
+
+    def add_panel(self, origin, size, render):
+        """size (width, height) 캔버스에 render(canvas)로 그린 패널을 origin에 둡니다."""
+        canvas = HudCanvas(*size)
+        render(canvas)
+        sprite, offset = canvas.to_sprite()
+        if sprite is not None:
+            self._patches.append((sprite, origin[0] + offset[0], origin[1] + offset[1]))
+
+    def add_button(self, button):
+        x1, y1, x2, y2 = button.rect
+        m = button.MARGIN
+        self.add_panel((x1 - m, y1 - m), (x2 - x1 + 2 * m + 1, y2 - y1 + 2 * m + 1), button.render)
+        self.buttons.append(button)
+        return button
+
+    def draw(self, frame):
+        if self.tint is not None:
+            color, alpha = self.tint
+            self.solid_blend.blend_solid(frame, color, alpha)
+        for sprite, x, y in self._patches:
+            sprite.blit(frame, x, y)
+
+    def hit_test(self, x, y):
+        """(x, y)를 포함하는 버튼을 반환합니다. (없으면 None)"""
+        for button in self.buttons:
+            if button.contains(x, y):
+                return button
+        return None
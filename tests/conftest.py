@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 게임 모듈은 src/ 안의 평면 모듈이라 벤치마크처럼 경로를 추가해 import
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from filter_logic import InferenceResult
+from landmark_trace import LandmarkTraceReader, LandmarkTraceWriter, TracedFaceResults, TraceReplayInference
+
+
+def make_result(rng, face_count, hand_count, gesture):
+    faces = [rng.random((478, 3), dtype=np.float32) for _ in range(face_count)]
+    hands = [[tuple(point) for point in rng.random((21, 3), dtype=np.float32).tolist()] for _ in range(hand_count)]
+    hand_data = {'gesture': gesture, 'landmarks': hands, 'hand_count': hand_count}
+    return InferenceResult(None, TracedFaceResults(faces), hand_data), faces, hands
+
+
+def write_trace(path, records):
+    writer = LandmarkTraceWriter(str(path), 1280, 720, 30.0)
+    for timestamp, result in records:
+        writer.write(timestamp, result)
+    writer.close()
+
+
+def test_round_trip(tmp_path):
+    rng = np.random.default_rng(0)
+    path = tmp_path / 'session.trace'
+    cases = [(0.0, 1, 0, None), (1 / 30, 2, 1, 'PEACE'), (2 / 30, 0, 2, 'FIST'), (0.1, 0, 0, 'UNKNOWN')]
+    records = []
+    expected = []
+    for timestamp, face_count, hand_count, gesture in cases:
+        result, faces, hands = make_result(rng, face_count, hand_count, gesture)
+        records.append((timestamp, result))
+        expected.append((timestamp, faces, hands, gesture if gesture != 'UNKNOWN' else None))
+    write_trace(path, records)
+
+    reader = LandmarkTraceReader(str(path))
+    assert (reader.width, reader.height, reader.fps) == (1280, 720, 30.0)
+    assert reader.count_frames() == len(cases)
+    for timestamp, faces, hands, gesture in expected:
+        read_time, read_faces, hand_data = reader.read()
+        assert read_time == timestamp
+        assert len(read_faces) == len(faces)
+        for read_face, face in zip(read_faces, faces):
+            np.testing.assert_array_equal(read_face, face)
+        assert hand_data['gesture'] == gesture
+        assert hand_data['hand_count'] == len(hands)
+        np.testing.assert_array_equal(np.asarray(hand_data['landmarks'], dtype=np.float32).reshape(-1, 3),
+                                      np.asarray(hands, dtype=np.float32).reshape(-1, 3))
+    assert reader.read() is None
+    assert reader.exhausted
+
+
+def test_replay_uses_recorded_time(tmp_path):
+    rng = np.random.default_rng(1)
+    path = tmp_path / 'session.trace'
+    result, faces, _ = make_result(rng, 1, 0, None)
+    write_trace(path, [(0.5, result)])
+
+    replay = TraceReplayInference(LandmarkTraceReader(str(path)))
+    replayed = replay.process(None)
+    assert replayed.media_time == 0.5
+    landmark = replayed.face_results.multi_face_landmarks[0].landmark[13]
+    assert (landmark.x, landmark.y, landmark.z) == tuple(faces[0][13].tolist())
+    # 트레이스가 끝나면 얼굴 없는 결과
+    assert replay.process(None).face_results.multi_face_landmarks is None
+
+
+def test_truncated_or_foreign_file(tmp_path):
+    rng = np.random.default_rng(2)
+    path = tmp_path / 'session.trace'
+    write_trace(path, [(0.0, make_result(rng, 1, 1, 'PALM')[0])])
+    data = path.read_bytes()
+
+    truncated = tmp_path / 'truncated.trace'
+    truncated.write_bytes(data[:-10])
+    reader = LandmarkTraceReader(str(truncated))
+    with pytest.raises(ValueError):
+        reader.read()
+
+    foreign = tmp_path / 'foreign.trace'
+    foreign.write_bytes(b'NOPE' + data[4:])
+    with pytest.raises(ValueError):
+        LandmarkTraceReader(str(foreign))
+
+    short = tmp_path / 'short.trace'
+    short.write_bytes(data[:5])
+    with pytest.raises(ValueError):
+        LandmarkTraceReader(str(short))
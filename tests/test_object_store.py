@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+import game_logic as gl
+
+
+def brute_overlap(store, x, y, claimed=()):
+    """모든 슬롯을 확인해 (x, y)와 겹치는 가장 먼저 생성된 활성 슬롯을 찾습니다."""
+    for slot in range(store.count):
+        size = store.size[slot]
+        if (store.active[slot] and slot not in claimed
+                and abs(store.y[slot] - y) < size and abs(store.x[slot] - x) < size):
+            return slot
+    return -1
+
+
+def brute_overlaps(store, xs, ys):
+    claimed = set()
+    slots = []
+    for x, y in zip(xs, ys):
+        slot = brute_overlap(store, x, y, claimed)
+        if slot >= 0:
+            claimed.add(slot)
+        slots.append(slot)
+    return slots
+
+
+def fill(store, rng, count, height):
+    for _ in range(count):
+        store.append(rng.uniform(0, 1280), rng.uniform(-200, height), rng.uniform(1, 9),
+                     'present' if rng.random() < 0.7 else 'coal', int(rng.choice([60, 120])))
+
+
+@pytest.mark.parametrize('min_objects', [8, gl.OVERLAP_INDEX_MIN_OBJECTS])
+def test_index_matches_brute_force(monkeypatch, min_objects):
+    monkeypatch.setattr(gl, 'OVERLAP_INDEX_MIN_OBJECTS', min_objects)
+    rng = np.random.default_rng(3)
+    height = 720
+    store = gl.GameObjectStore()
+    fill(store, rng, 1500, height)
+
+    for tick in range(120):
+        store.advance(height)
+        if tick % 7 == 0:
+            # 인덱스를 만든 뒤 추가되는 슬롯과 압축, 뷰로 직접 옮긴 객체도 확인
+            fill(store, rng, 40, height)
+        if tick % 25 == 0:
+            store.maybe_compact()
+        if tick % 31 == 0 and store.count:
+            store.view(int(rng.integers(store.count))).y = rng.uniform(0, height)
+
+        for x, y in rng.uniform((0, 0), (1280, height), size=(20, 2)).tolist():
+            assert store.find_overlap(x, y) == brute_overlap(store, x, y)
+        xs, ys = rng.uniform(0, 1280, 4).tolist(), rng.uniform(0, height, 4).tolist()
+        assert store.find_overlaps(xs, ys).tolist() == brute_overlaps(store, xs, ys)
+
+
+def test_small_store_has_no_index():
+    store = gl.GameObjectStore()
+    store.append(100, 100, 3, 'present', 120)
+    store.advance(720)
+    assert store._index_slots is None
+    assert store.find_overlap(100, 103) == 0
+    assert store.find_overlap(400, 103) == -1
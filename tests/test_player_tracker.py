@@ -0,0 +1,49 @@
+import game_logic as gl
+
+
+def test_ids_follow_faces_between_frames():
+    tracker = gl.PlayerTracker(3, max_distance=200)
+    assert tracker.assign([(100, 300), (900, 300)]) == [0, 1]
+    # 검출 순서가 바뀌어도 가까운 이전 위치의 번호를 유지
+    assert tracker.assign([(880, 310), (120, 290)]) == [1, 0]
+
+
+def test_new_face_prefers_unused_id():
+    tracker = gl.PlayerTracker(3, max_distance=200)
+    tracker.assign([(100, 300), (900, 300)])
+    # 1번 얼굴이 잠시 사라진 사이 멀리서 새 얼굴이 들어오면 1번을 뺏지 않고 새 번호를 받음
+    assert tracker.assign([(110, 300), (500, 100)]) == [0, 2]
+    # 사라졌던 얼굴은 이전 위치 근처로 돌아오면 원래 번호를 다시 받음
+    assert tracker.assign([(110, 300), (890, 300), (500, 110)]) == [0, 1, 2]
+
+
+def test_far_jump_and_overflow():
+    tracker = gl.PlayerTracker(2, max_distance=200)
+    tracker.assign([(100, 300)])
+    # max_distance보다 멀리 뛴 얼굴은 이어 붙이지 않고 쓰이지 않은 번호부터 받음
+    assert tracker.assign([(1000, 300)]) == [1]
+    # 번호가 모자라면 None
+    assert tracker.assign([(100, 300), (1000, 300), (600, 600)]) == [0, 1, None]
+    tracker.reset()
+    assert tracker.assign([(1000, 300)]) == [0]
+
+
+def test_game_assigns_mouths_and_collects_per_player():
+    game = gl.ChristmasGame(1280, 720, seed=0, render=False, max_players=2)
+    game.start_new_run('easy')
+    assert [player.joined for player in game.players] == [True, False]
+
+    ids = game.update_players([(200, 400, True), (1000, 400, True)])
+    assert ids == [0, 1]
+    assert all(player.joined and player.present for player in game.players)
+
+    game.objects.append(1000, 400, 0, 'present', 120)
+    game.check_players()
+    assert game.players[1].score > 0
+    assert game.players[0].score == 0
+    assert game.score == game.players[1].score
+
+    # 검출되지 않은 플레이어는 다음 프레임 판정에서 빠지지만 참여 상태는 유지
+    game.update_players([(210, 400, False)])
+    assert [player.present for player in game.players] == [True, False]
+    assert game.players[1].joined
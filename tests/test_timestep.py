@@ -0,0 +1,42 @@
+import pytest
+
+from timestep import MAX_CATCH_UP_TICKS, FixedTimestepClock
+
+
+def test_ticks_follow_elapsed_time():
+    clock = FixedTimestepClock(tick_rate=60, max_catch_up=5)
+    clock.reset(now=0.0)
+    assert clock.advance(now=1 / 120) == 0
+    assert clock.alpha == pytest.approx(0.5)
+    assert clock.advance(now=1 / 60) == 1
+    assert clock.advance(now=4 / 60 + 1e-9) == 3
+    assert clock.ticks == 4
+    assert clock.dropped_time == 0.0
+
+
+def test_catch_up_is_capped():
+    clock = FixedTimestepClock(tick_rate=60, max_catch_up=5)
+    clock.reset(now=0.0)
+    # 1초 멈춘 뒤에도 한 번에 최대 5틱만 실행하고 나머지 시간은 버림
+    assert clock.advance(now=1.0 + 1 / 240) == 5
+    assert clock.dropped_time == pytest.approx(55 / 60)
+    assert clock.alpha == pytest.approx(0.25)
+    # 버린 시간은 다음 프레임으로 넘어오지 않음
+    assert clock.advance(now=1.0 + 1 / 240 + 1 / 60) == 1
+    assert clock.ticks == 6
+
+
+def test_default_catch_up_limit():
+    clock = FixedTimestepClock()
+    clock.reset(now=0.0)
+    assert clock.advance(now=5.0) == MAX_CATCH_UP_TICKS
+
+
+def test_reset_discards_paused_time():
+    clock = FixedTimestepClock(tick_rate=60, max_catch_up=5)
+    clock.reset(now=0.0)
+    clock.advance(now=1 / 120)
+    clock.reset(now=10.0)
+    assert clock.advance(now=10.0) == 0
+    assert clock.alpha == 0.0
+    assert clock.advance(now=10.0 - 1.0) == 0  # 시간이 거꾸로 가도 음수 틱 없음